@@ -0,0 +1,59 @@
+"""Finds the crossover point of `contain_all` and `contain_any` between scanning
+the data for every expected element and comparing sets of elements, with the
+expected value prepared once by the checker and prepared in every call.
+
+Run with: python -m benchmarks.bench_comparators"""
+
+import timeit
+from typing import Any, Callable
+
+from bepatient.waiter_src.comparators import (
+    LARGE_INPUT,
+    ExpectedItems,
+    _contain_all_items,
+    _contain_any_items,
+)
+
+SIZES = [(4, 2), (8, 4), (16, 4), (32, 4), (64, 4), (100, 10), (10_000, 500)]
+
+
+def scan_all(data: list[Any], expected_value: list[Any]) -> bool:
+    return all(i in data for i in expected_value)
+
+
+def scan_any(data: list[Any], expected_value: list[Any]) -> bool:
+    return any(i in data for i in expected_value)
+
+
+def measure(function: Callable[[], bool], size: int) -> float:
+    number = max(1, 1_000_000 // size)
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"LARGE_INPUT: {LARGE_INPUT}")
+    for data_size, expected_size in SIZES:
+        data = list(range(data_size))
+        # the worst cases of the scan: all found at the end, none found
+        present = data[-expected_size:]
+        absent = [-number - 1 for number in range(expected_size)]
+        for name, scan, sets, expected in (
+            ("contain_all", scan_all, _contain_all_items, present),
+            ("contain_any", scan_any, _contain_any_items, absent),
+        ):
+            prepared = ExpectedItems(expected)
+            assert scan(data, expected) == sets(data, prepared)
+            size = data_size * expected_size
+            scan_time = measure(lambda: scan(data, expected), size)
+            cached_time = measure(lambda: sets(data, prepared), size)
+            uncached_time = measure(lambda: sets(data, ExpectedItems(expected)), size)
+            print(
+                f"{name} | {data_size} x {expected_size} = {size}"
+                f" | scan: {scan_time * 1e6:.2f} us"
+                f" | sets (prepared): {cached_time * 1e6:.2f} us"
+                f" | sets (per call): {uncached_time * 1e6:.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compares JSON decoders available for checkers on 1 KB, 1 MB and 50 MB payloads.
+Backends which are not installed are skipped.
+
+Run with: python -m benchmarks.bench_json_decoders"""
+
+import json
+import timeit
+
+from requests import Response
+
+from bepatient.waiter_src.checkers.json_decoders import (
+    DECODER_FACTORIES,
+    JsonDecoder,
+)
+
+SIZES = {"1 KB": 1_000, "1 MB": 1_000_000, "50 MB": 50_000_000}
+
+
+def build_payload(size: int) -> bytes:
+    item = {"id": 123456, "status": "pending", "name": "żółw", "values": [1.5, 2, 3]}
+    item_size = len(json.dumps(item).encode("utf-8")) + 2
+    return json.dumps({"data": [item] * max(size // item_size, 1)}).encode("utf-8")
+
+
+def build_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = content  # pylint: disable=protected-access
+    response.encoding = "utf-8"
+    return response
+
+
+def get_decoders() -> dict[str, JsonDecoder]:
+    decoders = {}
+    for name, factory in DECODER_FACTORIES.items():
+        try:
+            decoders[name] = factory()
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+    return decoders
+
+
+def main():
+    decoders = get_decoders()
+    for label, size in SIZES.items():
+        content = build_payload(size)
+        response = build_response(content)
+        number = max(1, 50_000_000 // (len(content) * 10))
+
+        baseline = timeit.timeit(response.json, number=number) / number
+        print(f"{label} | Response.json(): {baseline * 1e3:.3f} ms")
+        for name, decoder in decoders.items():
+            elapsed = timeit.timeit(lambda: decoder(content), number=number) / number
+            print(
+                f"{label} | {name}: {elapsed * 1e3:.3f} ms"
+                f" | speedup: {baseline / elapsed:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
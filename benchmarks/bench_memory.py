@@ -0,0 +1,87 @@
+"""Compares the memory taken by executors with their checkers, when they are kept
+in `__slots__` and when they carry the instance `__dict__`.
+
+Run with: python -m benchmarks.bench_memory"""
+
+import gc
+import tracemalloc
+from typing import Callable
+
+from requests import Request, Session
+
+from bepatient.waiter_src.checkers.response_checkers import (
+    JsonChecker,
+    StatusCodeChecker,
+)
+from bepatient.waiter_src.comparators import is_equal
+from bepatient.waiter_src.conditions_manager import ConditionsManager
+from bepatient.waiter_src.executors.executor import Executor
+from bepatient.waiter_src.executors.requests_executor import RequestsExecutor
+
+WAITERS = 10_000
+CHECKERS = 3
+
+
+class DictStatusCodeChecker(StatusCodeChecker):
+    pass
+
+
+class DictJsonChecker(JsonChecker):
+    pass
+
+
+class DictConditionsManager(ConditionsManager):
+    pass
+
+
+class DictRequestsExecutor(RequestsExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conditions_manager = DictConditionsManager()
+        self.add_pre_condition(DictStatusCodeChecker(is_equal, 200))
+
+
+def build_waiters(
+    executor_cls: type[RequestsExecutor], checker_cls: type[JsonChecker]
+) -> Callable[[], list[Executor]]:
+    session = Session()
+    request = session.prepare_request(Request("GET", "https://example.com/"))
+
+    def build() -> list[Executor]:
+        executors: list[Executor] = []
+        for _ in range(WAITERS):
+            executor = executor_cls(request, 200, session=session)
+            for index in range(CHECKERS):
+                executor.add_main_condition(
+                    checker_cls(is_equal, "done", dict_path=f"data.{index}.status")
+                )
+            executors.append(executor)
+        return executors
+
+    return build
+
+
+def measure(build: Callable[[], list[Executor]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    executors = build()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    assert len(executors) == WAITERS
+    return size / WAITERS
+
+
+def main():
+    with_dict = measure(build_waiters(DictRequestsExecutor, DictJsonChecker))
+    with_slots = measure(build_waiters(RequestsExecutor, JsonChecker))
+    print(
+        f"{WAITERS} waiters with {CHECKERS + 1} checkers each"
+        f" | __dict__: {with_dict:.0f} B/waiter"
+        f" | __slots__: {with_slots:.0f} B/waiter"
+        f" | saved: {1 - with_slots / with_dict:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
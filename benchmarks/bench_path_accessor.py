@@ -0,0 +1,45 @@
+"""Compares `dictor` with the compiled PathAccessor on deep paths.
+
+Run with: python -m benchmarks.bench_path_accessor"""
+
+import timeit
+
+from dictor import dictor
+
+from bepatient.waiter_src.checkers.path_accessor import PathAccessor
+
+DEPTH = 20
+NUMBER = 100_000
+
+
+def build_data(depth: int) -> tuple[dict, str]:
+    data: dict = {"value": "done"}
+    keys: list[str] = []
+    for level in range(depth):
+        key = f"Level_{level}"
+        data = {key: [data], "other": level}
+        keys = [key, "0", *keys]
+    return data, ".".join(keys) + ".value"
+
+
+def main():
+    data, path = build_data(DEPTH)
+    accessor = PathAccessor(path)
+    assert accessor(data) == dictor(data, path) == "done"
+
+    for ignore_case in (False, True):
+        accessor = PathAccessor(path, ignore_case=ignore_case)
+        dictor_time = timeit.timeit(
+            lambda: dictor(data, path, ignorecase=ignore_case), number=NUMBER
+        )
+        accessor_time = timeit.timeit(lambda: accessor(data), number=NUMBER)
+        print(
+            f"ignore_case={ignore_case} | path of {len(accessor.steps)} keys"
+            f" | dictor: {dictor_time / NUMBER * 1e6:.2f} us"
+            f" | PathAccessor: {accessor_time / NUMBER * 1e6:.2f} us"
+            f" | speedup: {dictor_time / accessor_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
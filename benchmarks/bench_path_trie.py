@@ -0,0 +1,43 @@
+"""Compares separate PathAccessors with the PathTrie resolving all paths at once,
+for checkers sharing the long prefix of their paths.
+
+Run with: python -m benchmarks.bench_path_trie"""
+
+import timeit
+
+from benchmarks.bench_path_accessor import build_data
+
+from bepatient.waiter_src.checkers.path_accessor import PathAccessor, PathTrie
+
+DEPTH = 20
+NUMBER = 10_000
+
+
+def main():
+    data, path = build_data(DEPTH)
+    prefix = path.rsplit(".", 1)[0]
+    for checkers in (2, 10, 50):
+        accessors = [PathAccessor(path)] + [
+            PathAccessor(f"{prefix}.key_{number}", default=number)
+            for number in range(checkers - 1)
+        ]
+        trie = PathTrie(accessors)
+        found = trie.resolve(data)
+        assert [found[id(accessor)] for accessor in accessors] == [
+            accessor(data) for accessor in accessors
+        ]
+
+        separate_time = timeit.timeit(
+            lambda: [accessor(data) for accessor in accessors], number=NUMBER
+        )
+        trie_time = timeit.timeit(lambda: trie.resolve(data), number=NUMBER)
+        print(
+            f"{checkers} paths of {len(accessors[0].steps)} keys"
+            f" | PathAccessors: {separate_time / NUMBER * 1e6:.2f} us"
+            f" | PathTrie: {trie_time / NUMBER * 1e6:.2f} us"
+            f" | speedup: {separate_time / trie_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
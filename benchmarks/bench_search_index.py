@@ -0,0 +1,54 @@
+"""Compares separate `search_query` scans with the SearchIndex shared by checkers
+searching a large document for different keys.
+
+Run with: python -m benchmarks.bench_search_index"""
+
+import timeit
+
+from bepatient.waiter_src.checkers.path_accessor import PathAccessor, SearchIndex
+
+ITEMS = 1_000
+NUMBER = 100
+
+
+def build_data(items: int) -> dict:
+    return {
+        "items": [
+            {
+                "id": number,
+                "state": "done",
+                "owner": {"name": f"user_{number}", "roles": [{"role": "admin"}]},
+                "tags": [{"tag": "a"}, {"tag": "b"}],
+            }
+            for number in range(items)
+        ]
+    }
+
+
+def main():
+    data = build_data(ITEMS)
+    keys = ["id", "state", "name", "role", "tag", "missing"]
+    for checkers in (1, 2, len(keys)):
+        accessors = [PathAccessor(search=key) for key in keys[:checkers]]
+        assert [accessor(data) for accessor in accessors] == [
+            SearchIndex(data).search(key) for key in keys[:checkers]
+        ]
+
+        def indexed(accessors=accessors):
+            index = SearchIndex(data)
+            return [index.search(accessor.search) for accessor in accessors]
+
+        scan_time = timeit.timeit(
+            lambda: [accessor(data) for accessor in accessors], number=NUMBER
+        )
+        index_time = timeit.timeit(indexed, number=NUMBER)
+        print(
+            f"{checkers} search keys | {ITEMS} items"
+            f" | scans: {scan_time / NUMBER * 1e3:.2f} ms"
+            f" | SearchIndex: {index_time / NUMBER * 1e3:.2f} ms"
+            f" | speedup: {scan_time / index_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
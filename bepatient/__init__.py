@@ -4,6 +4,7 @@ import logging
 from logging import NullHandler
 
 from .api import (
+    AsyncRequestsWaiter,
     RequestsWaiter,
     delete_none_values_from_dict,
     dict_differences,
@@ -13,26 +14,51 @@ from .api import (
     to_curl,
     wait_for_value_in_request,
     wait_for_values_in_request,
+    wait_for_values_in_requests,
 )
 from .retry import retry
 from .waiter_src.checkers import CHECKERS
 from .waiter_src.checkers.checker import Checker
+from .waiter_src.checkers.json_decoders import JSON_DECODERS, set_json_decoder
 from .waiter_src.comparators import COMPARATORS
+from .waiter_src.delays import (
+    CappedDelay,
+    ConstantDelay,
+    DecorrelatedJitterDelay,
+    DelayPolicy,
+    ExponentialDelay,
+    LinearDelay,
+)
+from .waiter_src.executors.session_registry import configure_session_pool
+from .waiter_src.waiter_group import GroupResult, WaiterGroup
 
 __version__ = "1.0.0"
 __all__ = [
+    "AsyncRequestsWaiter",
+    "CappedDelay",
     "Checker",
     "CHECKERS",
     "COMPARATORS",
+    "configure_session_pool",
+    "ConstantDelay",
+    "DecorrelatedJitterDelay",
+    "DelayPolicy",
     "delete_none_values_from_dict",
     "dict_differences",
+    "ExponentialDelay",
     "extract_url_params",
     "find_uuid_in_text",
+    "GroupResult",
+    "JSON_DECODERS",
+    "LinearDelay",
     "retry",
     "RequestsWaiter",
+    "set_json_decoder",
     "str_to_bool",
     "to_curl",
+    "WaiterGroup",
     "wait_for_values_in_request",
+    "wait_for_values_in_requests",
     "wait_for_value_in_request",
 ]
 
@@ -1,5 +1,7 @@
+import copy
 import re
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
 
 from requests import PreparedRequest, Request, Response, Session
 
@@ -7,49 +9,24 @@ from .curler import Curler
 from .waiter_src import comparators
 from .waiter_src.checkers import CHECKERS, RESPONSE_CHECKERS
 from .waiter_src.checkers.checker import Checker
+from .waiter_src.checkers.json_decoders import JSON_DECODERS, JsonDecoder
 from .waiter_src.conditions_manager import CONDITION_LEVEL
-from .waiter_src.executors.requests_executor import RequestsExecutor
-from .waiter_src.waiter import wait_for_executor
+from .waiter_src.delays import Delay
+from .waiter_src.exceptions import BePatientException, WaiterConditionWasNotMet
+from .waiter_src.executors.executor import Executor
+from .waiter_src.executors.requests_executor import UNREAD_BODY, RequestsExecutor
+from .waiter_src.executors.session_registry import session_registry
+from .waiter_src.waiter import wait_for_executor, wait_for_executor_async
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
-class RequestsWaiter:
-    """Utility class for setting up and monitoring requests for expected values.
-
-    Args:
-        request (PreparedRequest | Request | Response): request or response to monitor.
-        status_code (int, optional): The expected HTTP status code. Defaults to 200.
-        session (Session | None, optional): The requests session to use for sending
-            requests. Defaults to None.
-        timeout (int | tuple[int, int] | None, optional): request timeout in seconds.
-            Default value is 15 for connect and 30 for read (15, 30). If user provide
-            one value, it will be applied to both - connect and read timeouts.
 
-    Example:
-        To wait for a JSON response where the "status" field equals 200 using a
-            RequestsWaiter:
-        ```
-            waiter = RequestsWaiter(request=requests, status_code=200, session=session)
-            response = waiter.add_checker(
-                expected_value=0,
-                comparer="have_len_greater",
-                checker="json_checker",
-                dict_path="data"
-            ).run(retries=5, delay=2).get_result()
-        ```"""
+class BaseWaiter:
+    """Base class of waiters, responsible for setting up the checkers of its
+    executor."""
 
-    def __init__(
-        self,
-        request: PreparedRequest | Request | Response,
-        status_code: int = 200,
-        session: Session | None = None,
-        timeout: int | tuple[int, int] | None = None,
-    ):
-        self.executor = RequestsExecutor(
-            req_or_res=request,
-            expected_status_code=status_code,
-            session=session,
-            timeout=timeout,
-        )
+    executor: Executor
 
     def add_checker(
         self,
@@ -60,6 +37,7 @@ class RequestsWaiter:
         search_query: str | None = None,
         ignore_case: bool = False,
         condition_level: CONDITION_LEVEL = "main",
+        latch: bool = False,
     ):
         """Add a response checker (main_condition) to the waiter.
 
@@ -77,22 +55,35 @@ class RequestsWaiter:
                 are treated the same. Defaults to False.
             condition_level (CONDITION_LEVEL, optional): specifies, on what stage of
                 validation, that condition should be checked.
+            latch (bool, optional): if set, once the checker passes, it is treated as
+                satisfied and is not evaluated again during the run. Defaults to False.
 
         Returns:
-            self: updated RequestsWaiter instance."""
+            self: updated waiter instance."""
+        # only the given options are passed, as not every checker takes them
+        options: dict[str, Any] = {}
+        if dict_path is not None:
+            options["dict_path"] = dict_path
+        if search_query is not None:
+            options["search_query"] = search_query
+        if ignore_case:
+            options["ignore_case"] = ignore_case
         checker = RESPONSE_CHECKERS[checker](  # type: ignore
             comparer=getattr(comparators, comparer),
             expected_value=expected_value,
-            dict_path=dict_path,
-            search_query=search_query,
-            ignore_case=ignore_case,
+            **options,
         )
         return self.add_custom_checker(
-            checker=checker, condition_level=condition_level  # type: ignore
+            checker=checker,  # type: ignore
+            condition_level=condition_level,
+            latch=latch,
         )
 
     def add_custom_checker(
-        self, checker: Checker, condition_level: CONDITION_LEVEL = "main"
+        self,
+        checker: Checker,
+        condition_level: CONDITION_LEVEL = "main",
+        latch: bool = False,
     ):
         """Add a custom response checker (main_condition) to the waiter.
         This method allows users to add their own custom response checker by providing
@@ -103,29 +94,124 @@ class RequestsWaiter:
                 from the Checker class.
             condition_level (CONDITION_LEVEL, optional): specifies, on what stage of
                 validation, that condition should be checked.
+            latch (bool, optional): if set, once the checker passes, it is treated as
+                satisfied and is not evaluated again during the run. Defaults to False.
 
         Returns:
-            self: updated RequestsWaiter instance."""
+            self: updated waiter instance."""
         match condition_level:
             case "exception":
-                self.executor.add_exception_condition(checker)
+                self.executor.add_exception_condition(checker, latch=latch)
             case "pre":
-                self.executor.add_pre_condition(checker)
+                self.executor.add_pre_condition(checker, latch=latch)
             case "main":
-                self.executor.add_main_condition(checker)
+                self.executor.add_main_condition(checker, latch=latch)
             case _:
                 raise ValueError(
                     "You have to choose between 'exception', 'pre' and 'main'!"
                 )
         return self
 
-    def run(self, retries: int = 60, delay: int = 1, raise_error: bool = True):
+    def get_result(self) -> Any:
+        """Get the final response containing the expected values.
+
+        Returns:
+            Any: final response containing the expected values."""
+        return self.executor.get_result()
+
+
+class RequestsWaiter(BaseWaiter):
+    """Utility class for setting up and monitoring requests for expected values.
+
+    Args:
+        request (PreparedRequest | Request | Response): request or response to monitor.
+        status_code (int, optional): The expected HTTP status code. Defaults to 200.
+        session (Session | None, optional): The requests session to use for sending
+            requests. If not provided, the pooled session shared by waiters with the
+            same scheme, host and authentication is used. Defaults to None.
+        timeout (int | tuple[int, int] | None, optional): request timeout in seconds.
+            Default value is 15 for connect and 30 for read (15, 30). If user provide
+            one value, it will be applied to both - connect and read timeouts.
+        conditional (bool, optional): if set, the request is sent with
+            `If-None-Match`/`If-Modified-Since` built from the last response. On
+            304 Not Modified the last response and verdicts are reused.
+            Defaults to False.
+        skip_unchanged_body (bool, optional): if set, checkers are not run again
+            when the status code and body are identical to the last checked
+            response. Their last verdicts are reused. With `headers_checker`,
+            the headers must be identical too. Defaults to False.
+        json_decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None, optional): JSON decoder used by the checkers of this waiter. If not
+            provided, the one set by `set_json_decoder` is used. Defaults to None.
+        stream (bool, optional): if set, the body is downloaded only as far as
+            checkers read it (see "streaming_json_checker"). Defaults to False.
+        unread_body ("drain" | "close", optional): what to do with the unread part of
+            the streamed body of the rejected response - read and discard it, or
+            close the connection. Defaults to "drain".
+        short_circuit (bool, optional): if set, checking stops at the first failed
+            checker on all but the final attempt. Defaults to False.
+
+    Attributes:
+        waiting_times (list[float]): actual waiting times after each failed attempt
+            of the last run, in seconds.
+
+    Example:
+        To wait for a JSON response where the "status" field equals 200 using a
+            RequestsWaiter:
+        ```
+            waiter = RequestsWaiter(request=requests, status_code=200, session=session)
+            response = waiter.add_checker(
+                expected_value=0,
+                comparer="have_len_greater",
+                checker="json_checker",
+                dict_path="data"
+            ).run(retries=5, delay=2).get_result()
+        ```"""
+
+    def __init__(
+        self,
+        request: PreparedRequest | Request | Response,
+        status_code: int = 200,
+        session: Session | None = None,
+        timeout: int | tuple[int, int] | None = None,
+        conditional: bool = False,
+        skip_unchanged_body: bool = False,
+        json_decoder: JSON_DECODERS | JsonDecoder | None = None,
+        stream: bool = False,
+        unread_body: UNREAD_BODY = "drain",
+        short_circuit: bool = False,
+    ):
+        self.executor: RequestsExecutor = RequestsExecutor(
+            req_or_res=request,
+            expected_status_code=status_code,
+            session=session,
+            timeout=timeout,
+            conditional=conditional,
+            skip_unchanged_body=skip_unchanged_body,
+            json_decoder=json_decoder,
+            stream=stream,
+            unread_body=unread_body,
+        )
+        self.executor.conditions_manager.short_circuit = short_circuit
+        self.waiting_times: list[float] = []
+
+    def run(
+        self,
+        retries: int = 60,
+        delay: Delay = 1,
+        raise_error: bool = True,
+        total_timeout: float | None = None,
+    ):
         """Run the waiter and monitor the specified request or response.
 
         Args:
             retries (int, optional): The number of retries to perform. Defaults to 60.
-            delay (int, optional): The delay between retries in seconds. Defaults to 1.
+            delay (float | DelayPolicy, optional): The delay between retries in seconds
+                or the policy computing it. Defaults to 1.
             raise_error (bool): raises WaiterConditionWasNotMet.
+            total_timeout (float | None, optional): maximal duration of the whole wait
+                in seconds, including the time of requests and checks. The request
+                timeout is reduced when the remaining time runs out. Defaults to None.
 
         Returns:
             self: updated RequestsWaiter instance.
@@ -133,11 +219,14 @@ class RequestsWaiter:
         Raises:
             WaiterConditionWasNotMet: if the condition is not met within the specified
                 number of attempts."""
+        self.waiting_times = []
         wait_for_executor(
             executor=self.executor,
             retries=retries,
             delay=delay,
             raise_error=raise_error,
+            waiting_times=self.waiting_times,
+            total_timeout=total_timeout,
         )
         return self
 
@@ -149,6 +238,108 @@ class RequestsWaiter:
         return self.executor.get_result()
 
 
+class AsyncRequestsWaiter(BaseWaiter):
+    """Asynchronous version of the RequestsWaiter, sending requests with httpx.
+    Many waiters can be awaited concurrently on the single event loop. Requires
+    the `async` extra: `pip install bepatient[async]`.
+
+    Args:
+        request (httpx.Request | httpx.Response): request or response to monitor.
+        status_code (int, optional): The expected HTTP status code. Defaults to 200.
+        client (httpx.AsyncClient | None, optional): The httpx client to use for
+            sending requests. If not provided, the waiter creates its own client,
+            which is closed when the run ends. Defaults to None.
+        timeout (int | tuple[int, int] | None, optional): request timeout in seconds.
+            Default value is 15 for connect and 30 for read (15, 30). If user provide
+            one value, it will be applied to both - connect and read timeouts.
+        json_decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None, optional): JSON decoder used by the checkers of this waiter. If not
+            provided, the one set by `set_json_decoder` is used. Defaults to None.
+        short_circuit (bool, optional): if set, checking stops at the first failed
+            checker on all but the final attempt. Defaults to False.
+
+    Attributes:
+        waiting_times (list[float]): actual waiting times after each failed attempt
+            of the last run, in seconds.
+
+    Example:
+        To wait for many resources at the same time:
+        ```
+            async def wait_for(request: httpx.Request) -> httpx.Response:
+                waiter = AsyncRequestsWaiter(request=request, client=client)
+                waiter.add_checker(
+                    expected_value="done", comparer="is_equal", dict_path="status"
+                )
+                return (await waiter.run(retries=5, delay=2)).get_result()
+
+            responses = await asyncio.gather(*(wait_for(req) for req in requests))
+        ```"""
+
+    def __init__(
+        self,
+        request: "httpx.Request | httpx.Response",
+        status_code: int = 200,
+        client: "httpx.AsyncClient | None" = None,
+        timeout: int | tuple[int, int] | None = None,
+        json_decoder: JSON_DECODERS | JsonDecoder | None = None,
+        short_circuit: bool = False,
+    ):
+        # pylint: disable-next=import-outside-toplevel
+        from .waiter_src.executors.httpx_executor import HttpxExecutor
+
+        self.executor: HttpxExecutor = HttpxExecutor(
+            req_or_res=request,
+            expected_status_code=status_code,
+            client=client,
+            timeout=timeout,
+            json_decoder=json_decoder,
+        )
+        self.executor.conditions_manager.short_circuit = short_circuit
+        self.waiting_times: list[float] = []
+
+    async def run(
+        self,
+        retries: int = 60,
+        delay: Delay = 1,
+        raise_error: bool = True,
+        total_timeout: float | None = None,
+    ):
+        """Run the waiter and monitor the specified request or response.
+
+        Args:
+            retries (int, optional): The number of retries to perform. Defaults to 60.
+            delay (float | DelayPolicy, optional): The delay between retries in seconds
+                or the policy computing it. Defaults to 1.
+            raise_error (bool): raises WaiterConditionWasNotMet.
+            total_timeout (float | None, optional): maximal duration of the whole wait
+                in seconds, including the time of requests and checks. Defaults to
+                None.
+
+        Returns:
+            self: updated AsyncRequestsWaiter instance.
+
+        Raises:
+            WaiterConditionWasNotMet: if the condition is not met within the specified
+                number of attempts."""
+        self.waiting_times = []
+        await wait_for_executor_async(
+            executor=self.executor,
+            retries=retries,
+            delay=delay,
+            raise_error=raise_error,
+            waiting_times=self.waiting_times,
+            total_timeout=total_timeout,
+        )
+        return self
+
+    def get_result(self) -> "httpx.Response":
+        """Get the final response containing the expected values.
+
+        Returns:
+            httpx.Response: final response containing the expected values."""
+        return self.executor.get_result()
+
+
 def wait_for_value_in_request(
     request: PreparedRequest | Request | Response,
     status_code: int = 200,
@@ -159,7 +350,7 @@ def wait_for_value_in_request(
     dict_path: str | None = None,
     search_query: str | None = None,
     retries: int = 60,
-    delay: int = 1,
+    delay: Delay = 1,
     req_timeout: int | tuple[int, int] | None = None,
 ) -> Response:
     """Wait for a specified value in a response.
@@ -174,13 +365,14 @@ def wait_for_value_in_request(
             data. Defaults to None.
         checker (CHECKERS, optional): The type of checker to use.
         session (Session | None, optional): The requests session to use for sending
-            requests. Defaults to None.
+            requests. If not provided, the pooled session is used. Defaults to None.
         dict_path (str | None, optional): The dot-separated path to the value in the
             response data. Defaults to None.
         search_query (str | None, optional): A search query to use to find the value in
             the response data. Defaults to None.
         retries (int, optional): The number of retries to perform. Defaults to 60.
-        delay (int, optional): The delay between retries in seconds. Defaults to 1.
+        delay (float | DelayPolicy, optional): The delay between retries in seconds or
+            the policy computing it. Defaults to 1.
         req_timeout (int | tuple[int, int] | None, optional): request timeout in
             seconds. Default value is 15 for connect and 30 for read (15, 30). If user
             provide one value, it will be applied to both - connect and read timeouts.
@@ -228,7 +420,7 @@ def wait_for_values_in_request(
     status_code: int = 200,
     session: Session | None = None,
     retries: int = 60,
-    delay: int = 1,
+    delay: Delay = 1,
     req_timeout: int | tuple[int, int] | None = None,
 ) -> Response:
     """Wait for multiple specified values in a response using different checkers.
@@ -254,9 +446,11 @@ def wait_for_values_in_request(
                     of validation, that condition should be checked.
         status_code (int, optional): The expected HTTP status code. Defaults to 200.
         session (Session | None, optional): The requests session to use for sending
-               requests. Defaults to None.
+               requests. If not provided, the pooled session is used.
+               Defaults to None.
         retries (int, optional): The number of retries to perform. Defaults to 60.
-        delay (int, optional): The delay between retries in seconds. Defaults to 1.
+        delay (float | DelayPolicy, optional): The delay between retries in seconds or
+            the policy computing it. Defaults to 1.
         req_timeout (int | tuple[int, int] | None, optional): request timeout in
             seconds. Default value is 15 for connect and 30 for read (15, 30). If user
             provide one value, it will be applied to both - connect and read timeouts.
@@ -305,6 +499,145 @@ def wait_for_values_in_request(
     return waiter.run(retries=retries, delay=delay).get_result()
 
 
+def _prepare_batch(
+    requests: list[PreparedRequest | Request | Response] | Request,
+    params: list[dict[str, Any]] | None,
+) -> list[PreparedRequest | Request | Response]:
+    if not isinstance(requests, Request):
+        if params is not None:
+            raise ValueError("Params can be used only with the single Request template")
+        return requests
+
+    batch: list[PreparedRequest | Request | Response] = []
+    for overrides in params or [{}]:
+        request = copy.deepcopy(requests)
+        for name, value in overrides.items():
+            if not hasattr(request, name):
+                raise ValueError(f"Request has no attribute: {name}")
+            setattr(request, name, value)
+        batch.append(request)
+    return batch
+
+
+def _enlarge_pooled_sessions(
+    batch: list[PreparedRequest | Request | Response], max_workers: int
+) -> None:
+    """Every worker keeps its connection alive in the pool of the pooled session."""
+    for request in batch:
+        session_registry.get_session(request, pool_maxsize=max_workers)
+
+
+def _gather_batch(
+    futures: list[Future[Response]], ordered: bool, raise_error: bool
+) -> list[Response | BePatientException]:
+    indexes = {future: index for index, future in enumerate(futures)}
+    results: list[Response | BePatientException] = []
+    errors: list[str] = []
+    for future in futures if ordered else as_completed(futures):
+        try:
+            results.append(future.result())
+        except BePatientException as exc:
+            results.append(exc)
+            errors.append(f"{indexes[future]}: {exc}")
+
+    if raise_error and errors:
+        raise WaiterConditionWasNotMet(
+            f"Conditions were not met for {len(errors)} of {len(results)} requests"
+            " | " + " | ".join(errors)
+        )
+    return results
+
+
+def wait_for_values_in_requests(
+    requests: list[PreparedRequest | Request | Response] | Request,
+    checkers: list[dict[str, Any]],
+    params: list[dict[str, Any]] | None = None,
+    status_code: int = 200,
+    session: Session | None = None,
+    retries: int = 60,
+    delay: Delay = 1,
+    req_timeout: int | tuple[int, int] | None = None,
+    max_workers: int = 10,
+    ordered: bool = True,
+    raise_error: bool = True,
+) -> list[Response | BePatientException]:
+    """Wait for multiple specified values in many responses at the same time.
+    Waiters are run on the bounded pool of threads and share pooled sessions, so
+    their connections are reused. Failures do not stop other waiters, they are
+    gathered until all of them are finished.
+
+    Args:
+        requests (list[PreparedRequest | Request | Response] | Request): requests or
+            responses to monitor, or one request template used with `params`.
+        checkers (list[dict[str, Any]]): checkers applied to every request, the same
+            as in `wait_for_values_in_request`.
+        params (list[dict[str, Any]] | None, optional): list of Request attributes
+            (e.g. `url`, `params`, `json`) overriding the request template. One
+            request is created for each dictionary. Defaults to None.
+        status_code (int, optional): The expected HTTP status code. Defaults to 200.
+        session (Session | None, optional): The requests session shared by all
+            waiters. If not provided, pooled sessions from the `session_registry`
+            are used, with connection pools enlarged to `max_workers`.
+            Defaults to None.
+        retries (int, optional): The number of retries to perform. Defaults to 60.
+        delay (float | DelayPolicy, optional): The delay between retries in seconds or
+            the policy computing it. Every waiter gets its own copy of the policy.
+            Defaults to 1.
+        req_timeout (int | tuple[int, int] | None, optional): request timeout in
+            seconds. Default value is 15 for connect and 30 for read (15, 30).
+        max_workers (int, optional): maximal number of waiters running at the same
+            time. Defaults to 10.
+        ordered (bool, optional): if set, results are returned in the order of
+            requests, otherwise in the order of completion. Messages of failed
+            waiters always start with the index of their request. Defaults to True.
+        raise_error (bool, optional): if set, WaiterConditionWasNotMet containing
+            messages of all failed waiters is raised after all of them are finished.
+            Otherwise, exceptions are returned in place of responses. Defaults to True.
+
+    Returns:
+        list[Response | BePatientException]: final responses or exceptions of failed
+            waiters.
+
+    Raises:
+        WaiterConditionWasNotMet: if the condition is not met for any request.
+
+    Example:
+        To wait for many jobs created in a batch:
+        ```
+            responses = wait_for_values_in_requests(
+                requests=Request("get", "https://example.com/api/jobs"),
+                params=[{"params": {"id": job_id}} for job_id in job_ids],
+                checkers=[
+                    {
+                        "checker": "json_checker",
+                        "comparer": "is_equal",
+                        "expected_value": "done",
+                        "dict_path": "status",
+                    }
+                ],
+                max_workers=20,
+            )
+        ```"""
+    batch = _prepare_batch(requests, params)
+    if session is None:
+        _enlarge_pooled_sessions(batch, max_workers)
+
+    def wait_for(request: PreparedRequest | Request | Response) -> Response:
+        return wait_for_values_in_request(
+            request=request,
+            checkers=checkers,
+            status_code=status_code,
+            session=session,
+            retries=retries,
+            delay=copy.deepcopy(delay),
+            req_timeout=req_timeout,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(wait_for, request) for request in batch]
+        return _gather_batch(futures, ordered, raise_error)
+
+
 def dict_differences(
     expected_dict: dict[str, Any], actual_dict: dict[str, Any]
 ) -> dict[str, set[str] | dict[str, Any]]:
@@ -55,3 +55,41 @@ class Curler:
 
         curl_command += f" {request.url}"
         return curl_command
+
+
+class LazyCurl:
+    """A `curl` command rendered only when it is converted to a string, e.g. when
+    the log record is actually emitted. The rendered command is cached as long as
+    the request is the same object with unchanged method, url, headers and body.
+
+    Args:
+        source (PreparedRequest | Response): request or response to render.
+        charset (str, optional): The character set to use for encoding the request
+            body. Defaults to "utf-8"."""
+
+    def __init__(self, source: PreparedRequest | Response, charset: str | None = None):
+        self.source = source
+        self.charset = charset
+        self._key: tuple[Any, ...] | None = None
+        self._curl = ""
+
+    def _get_key(self) -> tuple[Any, ...]:
+        request = (
+            self.source.request if isinstance(self.source, Response) else self.source
+        )
+        return (
+            id(request),
+            request.method,
+            request.url,
+            tuple(request.headers.items()),
+            request.body,
+        )
+
+    def __str__(self) -> str:
+        if self._key is None or self._key != self._get_key():
+            self._curl = Curler().to_curl(self.source, self.charset)
+            self._key = self._get_key()
+        return self._curl
+
+    def __repr__(self) -> str:
+        return f"LazyCurl({self})"
@@ -1,18 +1,26 @@
 import logging
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, Callable
 
 from .waiter_src.comparators import Comparator, is_equal
+from .waiter_src.delays import Delay, to_delay_policy
 from .waiter_src.exceptions import WaiterConditionWasNotMet
 
 logger = logging.getLogger(__name__)
 
 
 def retry(
-    expected: Any, *, comparer: Comparator = is_equal, loops: int = 60, delay: int = 1
+    expected: Any,
+    *,
+    comparer: Comparator = is_equal,
+    loops: int = 60,
+    delay: Delay = 1,
 ):
     """
     Simple decorator, that retries function if its result is different from expected.
+    The `delay` may be the number of seconds or the DelayPolicy. Actual waiting times
+    of the last call are available in the `waiting_times` attribute of the decorated
+    function.
 
     Example:
         ```python
@@ -25,8 +33,13 @@ def retry(
         ```
     """
 
+    delay_policy = to_delay_policy(delay)
+
     def wrap(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
         def wrapped(*args, **kwargs) -> Any:
+            waiting_times: list[float] = []
+            wrapped.waiting_times = waiting_times  # type: ignore[attr-defined]
+            delay_policy.reset()
             for attempt in range(loops):
                 logger.info(
                     "Checking whether the condition has been met. The %s approach."
@@ -41,9 +54,12 @@ def retry(
                 logger.info(
                     "Condition was not met! Expected: %s | Result %s", expected, result
                 )
-                sleep(delay)
+                sleep_start = monotonic()
+                sleep(delay_policy.get_delay(attempt + 1))
+                waiting_times.append(monotonic() - sleep_start)
             raise WaiterConditionWasNotMet()
 
+        wrapped.waiting_times = []  # type: ignore[attr-defined]
         return wrapped
 
     return wrap
@@ -1,7 +1,28 @@
 from typing import Literal
 
-from .response_checkers import HeadersChecker, JsonChecker
+from .response_checkers import (
+    BodyBytesChecker,
+    HeadersChecker,
+    JmesPathChecker,
+    JsonChecker,
+    SchemaChecker,
+    StreamingJsonChecker,
+)
 
-CHECKERS = Literal["json_checker", "headers_checker"]
+CHECKERS = Literal[
+    "json_checker",
+    "headers_checker",
+    "streaming_json_checker",
+    "body_checker",
+    "jmespath_checker",
+    "schema_checker",
+]
 
-RESPONSE_CHECKERS = {"json_checker": JsonChecker, "headers_checker": HeadersChecker}
+RESPONSE_CHECKERS = {
+    "json_checker": JsonChecker,
+    "headers_checker": HeadersChecker,
+    "streaming_json_checker": StreamingJsonChecker,
+    "body_checker": BodyBytesChecker,
+    "jmespath_checker": JmesPathChecker,
+    "schema_checker": SchemaChecker,
+}
@@ -1,41 +1,158 @@
 import logging
+import reprlib
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from itertools import islice
+from typing import Any, Callable, ClassVar
+
+from bepatient.waiter_src.comparators import EXPECTED_VALUE_PREPARERS
 
 log = logging.getLogger(__name__)
 
+DATA_PREVIEW_LENGTH = 1000
+_NOT_PREPARED = object()
+
+
+# pylint: disable-next=too-many-instance-attributes
+class _DataRepr(reprlib.Repr):
+    """Limited representation, which keeps dictionaries in their insertion order,
+    the same as `str()` does."""
+
+    def repr_dict(self, x: dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(x[key], level - 1)}"
+            for key in islice(x, self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+_data_repr = _DataRepr()
+_data_repr.maxlevel = 10
+_data_repr.maxdict = _data_repr.maxlist = _data_repr.maxtuple = 100
+_data_repr.maxset = _data_repr.maxfrozenset = _data_repr.maxdeque = 100
+_data_repr.maxstring = _data_repr.maxlong = _data_repr.maxother = 200
+
+
+def preview(data: Any, max_length: int = DATA_PREVIEW_LENGTH) -> str:
+    """Returns the textual representation of the data for logging, limited to
+    `max_length` characters. Large containers are not rendered entirely."""
+    if isinstance(data, str):
+        text = data[: max_length + 1]
+    elif isinstance(data, (dict, list, tuple, set, frozenset, bytes)):
+        text = _data_repr.repr(data)
+    else:
+        text = str(data)
+    if len(text) > max_length:
+        return text[:max_length] + "..."
+    return text
+
 
 class Checker(ABC):
-    """An abstract class defining the interface for a checker to be used by a Waiter."""
+    """An abstract class defining the interface for a checker to be used by a Waiter.
+    Attributes are kept in `__slots__`, so checkers do not carry an instance
+    `__dict__`. Subclasses without `__slots__` get it back and work as usual.
+
+    Checkers of responses get the `requests.Response`. Checkers setting
+    `uses_response_context` get the ResponseContext shared by all checkers of the
+    attempt instead, whose `response` attribute is the Response."""
+
+    uses_response_context: ClassVar[bool] = False
+
+    __slots__ = (
+        "comparer",
+        "expected_value",
+        "_prepared_data",
+        "_description",
+        "_expected",
+        "_expected_source",
+    )
 
     def __init__(self, comparer: Callable[[Any, Any], bool], expected_value: Any):
         self.comparer = comparer
         self.expected_value = expected_value
         self._prepared_data: Any = None
+        self._description: str | None = None
+        self._expected: Any = None
+        self._expected_source: Any = _NOT_PREPARED
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            # the description depends on public attributes only
+            super().__setattr__("_description", None)
+
+    def describe(self) -> str:
+        """Returns the static part of the textual representation. It is built once
+        and rebuilt only after a public attribute has been changed."""
+        if self._description is None:
+            attrs = self._public_attributes()
+            attrs["checker"] = self.__class__.__name__
+            attrs["comparer"] = self.comparer.__name__
+            self._description = " | ".join(
+                [f"{k.capitalize()}: {v}" for k, v in sorted(attrs.items())]
+            )
+        return self._description
+
+    def _public_attributes(self) -> dict[str, Any]:
+        """Returns public attributes kept both in slots and in the instance dict."""
+        attrs = {}
+        for cls in type(self).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if not name.startswith("_") and hasattr(self, name):
+                    attrs[name] = getattr(self, name)
+        for name, value in getattr(self, "__dict__", {}).items():
+            if not name.startswith("_"):
+                attrs[name] = value
+        return attrs
 
     def __str__(self) -> str:
-        """Textual representation of the Checker object for logging"""
-        attrs = self.__dict__.copy()
-        del attrs["_prepared_data"]
-        attrs["checker"] = self.__class__.__name__
-        attrs["comparer"] = self.comparer.__name__
+        """Textual representation of the Checker object for logging. The prepared
+        data is limited to DATA_PREVIEW_LENGTH characters."""
+        return f"{self.describe()} | Data: {preview(self._prepared_data)}"
 
-        return (
-            " | ".join([f"{k.capitalize()}: {v}" for k, v in sorted(attrs.items())])
-            + f" | Data: {self._prepared_data}"
-        )
+    def error_message(self) -> str:
+        """Returns the description of the failed checker for error messages.
+        Checkers may extend it with details, which are too costly to compute for
+        every log record."""
+        return str(self)
 
     @abstractmethod
     def prepare_data(self, data: Any, run_uuid: str | None = None) -> Any:
         """Prepare the data from the response for comparison.
 
         Args:
-            data (Response): response containing the data.
+            data (Response | ResponseContext): response containing the data, or its
+                context, if `uses_response_context` is set.
             run_uuid (str | None): unique run identifier. Defaults to None.
 
         Returns:
             Any: Data for comparison."""
 
+    def prepare_expected_value(self) -> Any:
+        """Returns the expected value passed to the comparer. Checkers may override
+        it to convert the expected value once, e.g. to the type of prepared data.
+
+        Expected values of comparators from EXPECTED_VALUE_PREPARERS, e.g. elements
+        of `contain_all`, are prepared once and prepared again only if
+        `expected_value` or `comparer` have been replaced."""
+        try:
+            preparer = EXPECTED_VALUE_PREPARERS.get(self.comparer)
+        except TypeError:  # unhashable comparer
+            preparer = None
+        if preparer is None:
+            return self.expected_value
+        source = (self.expected_value, self.comparer)
+        if self._expected_source != source:
+            self._expected = preparer(self.expected_value)
+            self._expected_source = source
+        return self._expected
+
     def check(self, data: Any, run_uuid: str) -> bool:
         """Check if the given data meets a certain condition.
 
@@ -48,7 +165,7 @@ class Checker(ABC):
         log.debug("Check uuid: %s | %s", run_uuid, self)
 
         self._prepared_data = self.prepare_data(data, run_uuid)
-        if self.comparer(self._prepared_data, self.expected_value):
+        if self.comparer(self._prepared_data, self.prepare_expected_value()):
             log.info(
                 "Check success! | uuid: %s | %s",
                 run_uuid,
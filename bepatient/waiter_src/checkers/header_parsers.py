@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Literal
+
+# pylint: disable-next=invalid-name
+HEADER_TYPES = Literal["int", "list", "date", "retry_after", "cache_control"]
+
+
+def parse_int(value: str) -> int:
+    """Parses numeric headers, e.g. `Content-Length` or `Age`."""
+    return int(value.strip())
+
+
+def parse_list(value: str) -> list[str]:
+    """Splits comma-separated headers, e.g. `Vary` or `Allow`. Repeated headers are
+    already joined with commas by `requests`."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_date(value: str) -> datetime:
+    """Parses HTTP-date headers, e.g. `Date`, `Expires` or `Last-Modified`."""
+    return parsedate_to_datetime(value)
+
+
+def parse_retry_after(value: str) -> float:
+    """Returns the number of seconds to wait from the `Retry-After` header, which
+    holds either the number of seconds or the HTTP-date."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    delay = parse_date(value) - datetime.now(timezone.utc)
+    return max(delay.total_seconds(), 0.0)
+
+
+def parse_cache_control(value: str) -> dict[str, int | str | bool]:
+    """Parses the `Cache-Control` header into the dictionary of its directives.
+    Directives without the value are set to True, numeric ones are converted to int,
+    e.g. `{"no-cache": True, "max-age": 60}`."""
+    directives: dict[str, int | str | bool] = {}
+    for directive in parse_list(value):
+        name, _, argument = directive.partition("=")
+        argument = argument.strip().strip('"')
+        if not argument:
+            directives[name.strip().lower()] = True
+        elif argument.isdigit():
+            directives[name.strip().lower()] = int(argument)
+        else:
+            directives[name.strip().lower()] = argument
+    return directives
+
+
+HEADER_PARSERS: dict[str, Callable[[str], Any]] = {
+    "int": parse_int,
+    "list": parse_list,
+    "date": parse_date,
+    "retry_after": parse_retry_after,
+    "cache_control": parse_cache_control,
+}
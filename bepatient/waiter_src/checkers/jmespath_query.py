@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Any
+
+try:
+    import jmespath
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "JmesPathChecker requires the jmespath library. Install it with:"
+        " pip install bepatient[jmespath]"
+    ) from exc
+
+CACHE_SIZE = 1024
+QueryError = jmespath.exceptions.JMESPathError
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_query(expression: str) -> Any:
+    """Compiles the JMESPath expression. Compiled expressions are cached for the
+    whole process, so checkers with the same expression share one parsed tree.
+
+    Args:
+        expression (str): JMESPath expression.
+
+    Returns:
+        ParsedResult: compiled expression with the `search(data)` method.
+
+    Raises:
+        jmespath.exceptions.ParseError: if the expression is not valid."""
+    return jmespath.compile(expression)
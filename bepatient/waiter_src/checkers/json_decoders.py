@@ -0,0 +1,118 @@
+import json
+import logging
+from json import JSONDecodeError
+from typing import Any, Callable, Literal, TypeAlias
+
+log = logging.getLogger(__name__)
+
+JsonDecoder: TypeAlias = Callable[[bytes], Any]
+# pylint: disable-next=invalid-name
+JSON_DECODERS = Literal["auto", "json", "orjson", "msgspec", "simdjson"]
+
+
+def _stdlib_decoder() -> JsonDecoder:
+    return json.loads
+
+
+def _orjson_decoder() -> JsonDecoder:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+    return orjson.loads  # pylint: disable=no-member
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    import msgspec  # pylint: disable=import-outside-toplevel,import-error
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), "", 0) from exc
+
+    return decode
+
+
+def _simdjson_decoder() -> JsonDecoder:
+    import simdjson  # pylint: disable=import-outside-toplevel,import-error
+
+    def decode(content: bytes) -> Any:
+        try:
+            return simdjson.loads(content)
+        except ValueError as exc:
+            raise JSONDecodeError(str(exc), "", 0) from exc
+
+    return decode
+
+
+DECODER_FACTORIES: dict[str, Callable[[], JsonDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "simdjson": _simdjson_decoder,
+    "json": _stdlib_decoder,
+}
+
+_settings: dict[str, JsonDecoder | None] = {"default": None}
+
+
+def get_json_decoder(
+    decoder: JSON_DECODERS | JsonDecoder | None,
+) -> JsonDecoder | None:
+    """Returns the function decoding JSON from the response content bytes.
+
+    Args:
+        decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None): name of the backend, own function or None. "auto" selects the
+            fastest installed backend, falling back to the stdlib `json`.
+
+    Returns:
+        JsonDecoder | None: decoding function or None, if the response should decode
+            its body on its own (`Response.json()`).
+
+    Raises:
+        ValueError: if the backend is unknown.
+        ImportError: if the library of the chosen backend is not installed."""
+    if decoder is None or callable(decoder):
+        return decoder
+    if decoder == "auto":
+        for name, factory in DECODER_FACTORIES.items():
+            try:
+                json_decoder = factory()
+            except ImportError:
+                continue
+            log.debug("Selected JSON decoder: %s", name)
+            return json_decoder
+    if decoder not in DECODER_FACTORIES:
+        raise ValueError(
+            f"Unknown JSON decoder: {decoder}."
+            f" Available: auto, {', '.join(DECODER_FACTORIES)}"
+        )
+    try:
+        return DECODER_FACTORIES[decoder]()
+    except ImportError as exc:
+        raise ImportError(
+            f"JSON decoder {decoder} requires the {decoder} library."
+            f" Install it with: pip install {decoder}"
+        ) from exc
+
+
+def set_json_decoder(decoder: JSON_DECODERS | JsonDecoder | None) -> None:
+    """Sets the JSON decoder used by all checkers, unless the waiter has its own.
+    None restores the default behaviour - `Response.json()`.
+
+    Args:
+        decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None): name of the backend, own function or None.
+
+    Example:
+        ```
+            set_json_decoder("auto")
+        ```"""
+    _settings["default"] = get_json_decoder(decoder)
+
+
+def get_default_json_decoder() -> JsonDecoder | None:
+    """Returns the JSON decoder set by `set_json_decoder`."""
+    return _settings["default"]
@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+try:
+    from jsonschema.protocols import Validator
+    from jsonschema.validators import validator_for
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "SchemaChecker requires the jsonschema library. Install it with:"
+        " pip install bepatient[schema]"
+    ) from exc
+
+CACHE_SIZE = 128
+
+
+class ValidatorCache:
+    """Thread-safe LRU cache of compiled validators, keyed by the hash of the
+    canonical JSON form of the schema. Equal schemas share one validator, no matter
+    which checker or waiter they come from.
+
+    Args:
+        maxsize (int, optional): maximal number of kept validators.
+            Defaults to CACHE_SIZE."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._validators: OrderedDict[str, Validator] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    @staticmethod
+    def schema_hash(schema: Any) -> str:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, schema: Any) -> Validator:
+        """Returns the validator of the schema, compiling it if it is not cached.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: if the schema is not valid."""
+        key = self.schema_hash(schema)
+        with self._lock:
+            if key in self._validators:
+                self._validators.move_to_end(key)
+                return self._validators[key]
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        with self._lock:
+            self._validators[key] = validator
+            if len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+
+validator_cache = ValidatorCache()
+
+
+def json_pointer(path: Iterable[str | int]) -> str:
+    """Returns the JSON pointer in the URI fragment form, e.g. `#/items/0/state`."""
+    return "#" + "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
+
+
+def first_violation(validator: Validator, data: Any) -> str | None:
+    """Validates the data, stopping at the first violation.
+
+    Returns:
+        str | None: JSON pointer and message of the first violation, or None if the
+            data is valid."""
+    error = next(validator.iter_errors(data), None)
+    if error is None:
+        return None
+    return f"{json_pointer(error.absolute_path)}: {error.message}"
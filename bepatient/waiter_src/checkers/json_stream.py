@@ -0,0 +1,115 @@
+from json import JSONDecodeError
+from typing import IO, Any, Iterator
+
+try:
+    import ijson
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "StreamingJsonChecker requires the ijson library. Install it with:"
+        " pip install bepatient[stream]"
+    ) from exc
+
+from .path_accessor import MISSING
+
+BUFFER_SIZE = 8 * 1024
+
+
+class _PathTracker:
+    """Keeps the path of the JSON value which is currently parsed."""
+
+    def __init__(self):
+        self.path: list[str | int] = []
+        self._containers: list[str] = []
+
+    def start_value(self) -> None:
+        if self._containers and self._containers[-1] == "array":
+            self.path[-1] += 1  # type: ignore[operator]
+
+    def start_container(self, event: str) -> None:
+        self._containers.append(event[len("start_") :])
+        self.path.append(-1 if event == "start_array" else "")
+
+    def end_container(self) -> None:
+        self._containers.pop()
+        self.path.pop()
+
+
+def _matches(
+    path: list[str | int], steps: list[tuple[str, int | None, str]], ignore_case: bool
+) -> bool:
+    for element, (key, index, lower_key) in zip(path, steps):
+        if isinstance(element, int):
+            if element != index:
+                return False
+        elif element != key and not (ignore_case and element.lower() == lower_key):
+            return False
+    return True
+
+
+def _build_value(events: Iterator[tuple[str, Any]], start: str) -> Any:
+    builder = ijson.ObjectBuilder()
+    builder.event(start, None)
+    depth = 1
+    for event, value in events:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
+
+
+def find_in_stream(
+    stream: IO[bytes], steps: list[tuple[str, int | None, str]], ignore_case: bool
+) -> Any:
+    """Parses the JSON document incrementally and stops reading as soon as the value
+    under the path is found, or it is known that the path does not exist.
+
+    Args:
+        stream (IO[bytes]): file-like object with the JSON document.
+        steps (list[tuple[str, int | None, str]]): path compiled by PathAccessor.
+        ignore_case (bool): If set, upper/lower-case keys are treated the same.
+
+    Returns:
+        Any: the found value or MISSING.
+
+    Raises:
+        JSONDecodeError: if the document is not a valid JSON."""
+    events = ijson.basic_parse(stream, buf_size=BUFFER_SIZE, use_float=True)
+    try:
+        return _find(events, steps, ignore_case)
+    except ijson.JSONError as exc:
+        raise JSONDecodeError(str(exc), "", 0) from exc
+
+
+def _find(
+    events: Iterator[tuple[str, Any]],
+    steps: list[tuple[str, int | None, str]],
+    ignore_case: bool,
+) -> Any:
+    tracker = _PathTracker()
+    for event, value in events:
+        if event == "map_key":
+            tracker.path[-1] = value
+            continue
+        if event in ("end_map", "end_array"):
+            # the container holding the rest of the path has been closed
+            if len(tracker.path) <= len(steps) and _matches(
+                tracker.path[:-1], steps, ignore_case
+            ):
+                return MISSING
+            tracker.end_container()
+            continue
+
+        tracker.start_value()
+        if len(tracker.path) == len(steps) and _matches(
+            tracker.path, steps, ignore_case
+        ):
+            if event in ("start_map", "start_array"):
+                return _build_value(events, event)
+            return value
+        if event in ("start_map", "start_array"):
+            tracker.start_container(event)
+    return MISSING
@@ -0,0 +1,308 @@
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator
+
+ESCAPED_DOT = "__dictor__"
+MISSING = object()
+
+Searcher = Callable[[Any, str, Any], Any]
+
+
+class PathAccessor:
+    """The dot-separated path compiled once into the list of lookup steps, which is
+    then walked directly on the parsed data. It follows the semantics of `dictor`:
+    `\\.` escapes the dot in the key, numeric keys are list indexes, missing keys
+    return the default value and `search` collects values of the given key from
+    the data found under the path.
+
+    Args:
+        path (str | None, optional): dot-separated path to the value. Defaults to None.
+        search (str | None, optional): key to search for. Defaults to None.
+        default (Any, optional): value returned if nothing was found.
+            Defaults to None.
+        ignore_case (bool, optional): If set, upper/lower-case keys in the path are
+            treated the same. Defaults to False.
+
+    Example:
+        ```
+            accessor = PathAccessor("data.0.status")
+            assert accessor({"data": [{"status": "done"}]}) == "done"
+        ```"""
+
+    __slots__ = ("path", "search", "default", "ignore_case", "steps")
+
+    def __init__(
+        self,
+        path: str | None = None,
+        search: str | None = None,
+        default: Any = None,
+        ignore_case: bool = False,
+    ):
+        self.path = path
+        self.search = search
+        self.default = default
+        self.ignore_case = ignore_case
+        self.steps = self._compile(path) if path else []
+
+    @property
+    def key(self) -> tuple[str | None, str | None, Any, bool]:
+        """Arguments the accessor has been compiled with."""
+        return self.path, self.search, self.default, self.ignore_case
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathAccessor):
+            return NotImplemented
+        return self.key == other.key
+
+    @staticmethod
+    def _compile(path: str) -> list[tuple[str, int | None, str]]:
+        steps = []
+        for key in path.replace(r"\.", ESCAPED_DOT).split("."):
+            key = key.replace(ESCAPED_DOT, ".")
+            try:
+                index: int | None = int(key)
+            except ValueError:
+                index = None
+            steps.append((key, index, key.lower()))
+        return steps
+
+    def __call__(self, data: Any, searcher: Searcher | None = None) -> Any:
+        """Returns the value found under the path in the given data.
+
+        Args:
+            data (Any): parsed data.
+            searcher (Searcher | None, optional): function taking the data, the
+                `search` key and the default value, used instead of scanning the
+                data, e.g. `ResponseContext.search`. Defaults to None."""
+        if self.search is None and self.path is None:
+            return data
+        if self.search and not self.path:
+            return self._search(data, searcher)
+        if not self.path:
+            return self.default
+
+        return self.finish(self._find(data), searcher)
+
+    def finish(self, value: Any, searcher: Searcher | None = None) -> Any:
+        """Returns the result for the value found under the path, searching it if
+        the accessor has got the `search` key."""
+        if self.search and value and value != self.default:
+            return self._search(value, searcher)
+        return value
+
+    def _find(self, data: Any, start: int = 0) -> Any:
+        value = self.default
+        for key, index, lower_key in self.steps[start:] if start else self.steps:
+            if isinstance(data, (list, tuple)):
+                try:
+                    value = data[index] if index is not None else self.default
+                except IndexError:
+                    value = self.default
+            else:
+                if self.ignore_case:
+                    for data_key in data.keys():
+                        if data_key.lower() == lower_key:
+                            key = data_key
+                            break
+                try:
+                    if not (data and key in data):
+                        value = self.default
+                        break
+                    value = data[key]
+                except TypeError:
+                    value = self.default
+            data = value
+        return value
+
+    def _search(self, data: Any, searcher: Searcher | None = None) -> Any:
+        if searcher is not None and self.search:
+            return searcher(data, self.search, self.default)
+        found: list[Any] = []
+        for item in data if isinstance(data, (list, tuple)) else [data]:
+            found.extend(self._search_in(item))
+        return found or self.default
+
+    def _search_in(self, data: Any) -> Iterator[Any]:
+        try:
+            for key, value in data.items():
+                if key == self.search:
+                    yield self.default if self.default and value is None else value
+                elif isinstance(value, dict):
+                    yield from self._search_in(value)
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, dict):
+                            yield from self._search_in(item)
+        except (KeyError, ValueError, IndexError, TypeError, AttributeError):
+            pass
+
+
+class SearchIndex:
+    """Values of all keys of the data, collected in a single traversal. Searching
+    the index for any key returns the same result as `PathAccessor` with the
+    `search` key, without scanning the data again. Values nested under the same
+    key are skipped, as the search does not descend into values it has found.
+
+    Args:
+        data (Any): parsed data, a dictionary or a list of dictionaries.
+
+    Attributes:
+        values (dict[Any, list[Any]]): values of each key, in the search order.
+        build_time (float): time of building the index in seconds.
+        hits (int): number of searches for keys present in the data.
+        misses (int): number of searches for keys missing from the data."""
+
+    __slots__ = ("data", "values", "build_time", "hits", "misses")
+
+    def __init__(self, data: Any):
+        start = perf_counter()
+        self.data = data
+        self.values: dict[Any, list[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        ancestors: dict[Any, int] = {}
+        for item in data if isinstance(data, (list, tuple)) else [data]:
+            if isinstance(item, dict):
+                self._index(item, ancestors)
+        self.build_time = perf_counter() - start
+
+    def _index(self, data: dict[Any, Any], ancestors: dict[Any, int]) -> None:
+        for key, value in data.items():
+            if not ancestors.get(key):
+                self.values.setdefault(key, []).append(value)
+            if isinstance(value, (dict, list)):
+                ancestors[key] = ancestors.get(key, 0) + 1
+                if isinstance(value, dict):
+                    self._index(value, ancestors)
+                else:
+                    for item in value:
+                        if isinstance(item, dict):
+                            self._index(item, ancestors)
+                ancestors[key] -= 1
+
+    def search(self, key: str, default: Any = None) -> Any:
+        """Returns the list of values of the key, or the default value if the key
+        is missing. Missing values (None) are replaced with the default value."""
+        values = self.values.get(key)
+        if values is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if default:
+            return [default if value is None else value for value in values]
+        return list(values)
+
+    def __str__(self) -> str:
+        return (
+            f"Keys: {len(self.values)}"
+            f" | Values: {sum(len(values) for values in self.values.values())}"
+            f" | Build time: {self.build_time:.6f}"
+            f" | Hits: {self.hits} | Misses: {self.misses}"
+        )
+
+
+def _step(
+    data: Any, key: str, index: int | None, lower_key: str, ignore_case: bool
+) -> Any:
+    """Returns the value under the single step of the path, or MISSING if the step
+    cannot be taken directly. Accessors finish such paths on their own."""
+    if isinstance(data, (list, tuple)):
+        if index is None or not -len(data) <= index < len(data):
+            return MISSING
+        return data[index]
+    if not isinstance(data, dict):
+        return MISSING
+    if ignore_case:
+        for data_key in data:
+            if data_key.lower() == lower_key:
+                return data[data_key]
+    return data.get(key, MISSING)
+
+
+class _TrieNode:
+    __slots__ = ("chain", "children", "accessors")
+
+    def __init__(self, chain: list[tuple[str, int | None, str, bool]]):
+        self.chain = chain
+        self.children: dict[tuple[str, int | None, str, bool], _TrieNode] = {}
+        self.accessors: list[PathAccessor] = []
+
+    def compress(self) -> None:
+        """Merges chains of nodes with a single child, so keys which are not shared
+        by any other path are walked in one loop."""
+        for child in self.children.values():
+            while not child.accessors and len(child.children) == 1:
+                (grandchild,) = child.children.values()
+                child.chain.extend(grandchild.chain)
+                child.children = grandchild.children
+                child.accessors = grandchild.accessors
+            child.compress()
+
+    def iter_accessors(self) -> Iterator[PathAccessor]:
+        yield from self.accessors
+        for child in self.children.values():
+            yield from child.iter_accessors()
+
+
+class PathTrie:
+    """Compiled paths of many accessors merged into the prefix trie. The data is
+    traversed once, and every shared prefix of the paths is walked only once. The
+    found values are the same as the ones returned by accessors on their own.
+
+    Args:
+        accessors (Iterable[PathAccessor]): accessors with paths.
+
+    Example:
+        ```
+            trie = PathTrie([PathAccessor("data.0.id"), PathAccessor("data.0.state")])
+            found = trie.resolve({"data": [{"id": 1, "state": "done"}]})
+        ```"""
+
+    __slots__ = ("accessors", "_root")
+
+    def __init__(self, accessors: Iterable[PathAccessor]):
+        self.accessors = [accessor for accessor in accessors if accessor.steps]
+        self._root = _TrieNode([])
+        for accessor in self.accessors:
+            node = self._root
+            for key, index, lower_key in accessor.steps:
+                edge = (key, index, lower_key, accessor.ignore_case)
+                if edge not in node.children:
+                    node.children[edge] = _TrieNode([edge])
+                node = node.children[edge]
+            node.accessors.append(accessor)
+        self._root.compress()
+
+    def resolve(self, data: Any) -> dict[int, Any]:
+        """Finds the values under the paths of all accessors in a single traversal.
+
+        Args:
+            data (Any): parsed data.
+
+        Returns:
+            dict[int, Any]: values found under the paths, keyed by the `id` of
+                the accessor. They are the results of `_find`, before the search."""
+        found: dict[int, Any] = {}
+        self._walk(self._root, data, 0, found)
+        return found
+
+    def _walk(self, node: _TrieNode, data: Any, depth: int, found: dict[int, Any]):
+        for offset, (key, index, lower_key, ignore_case) in enumerate(node.chain):
+            # exact type check, the plain dict is the fast path of parsed JSON
+            # pylint: disable-next=unidiomatic-typecheck
+            if type(data) is dict and not ignore_case:
+                value = data.get(key, MISSING)
+            else:
+                value = _step(data, key, index, lower_key, ignore_case)
+            if value is MISSING:
+                # defaults may differ, every accessor finishes its path on its own
+                for accessor in node.iter_accessors():
+                    # pylint: disable-next=protected-access
+                    found[id(accessor)] = accessor._find(data, depth + offset)
+                return
+            data = value
+
+        depth += len(node.chain)
+        for accessor in node.accessors:
+            found[id(accessor)] = data
+        for child in node.children.values():
+            self._walk(child, data, depth, found)
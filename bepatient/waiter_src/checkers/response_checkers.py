@@ -1,21 +1,32 @@
 import logging
+import re
 from json import JSONDecodeError
 from typing import Any, Callable
 
-from dictor import dictor
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 
-from .checker import Checker
+from bepatient.waiter_src.comparators import match_regex, match_schema, starts_with
+
+from .checker import _NOT_PREPARED, Checker, preview
+from .header_parsers import HEADER_PARSERS, HEADER_TYPES
+from .path_accessor import MISSING, PathAccessor
+from .response_context import ResponseContext
 
 log = logging.getLogger(__name__)
 
 
 class StatusCodeChecker(Checker):
-    def prepare_data(self, data: Response, run_uuid: str | None = None) -> int:
+    __slots__ = ()
+    uses_response_context = True
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> int:
         """Prepare the response status code for comparison.
 
         Args:
-            data (Response): response containing the status code.
+            data (Response | ResponseContext): response containing the status code.
             run_uuid (str | None, optional): unique run identifier. Defaults to None.
 
         Returns:
@@ -25,7 +36,7 @@ class StatusCodeChecker(Checker):
             "Check uuid: %s | Response status code: %s | Response content: %s",
             run_uuid,
             status_code,
-            data.content,
+            ResponseContext.of(data).loaded_content(),
         )
         return status_code
 
@@ -53,6 +64,9 @@ class JsonChecker(Checker):
             assert checker.check(response) is True
         ```"""
 
+    __slots__ = ("path", "search_query", "dictor_fallback", "ignore_case", "_accessor")
+    uses_response_context = True
+
     def __init__(
         self,
         comparer: Callable[[Any, Any], bool],
@@ -67,38 +81,64 @@ class JsonChecker(Checker):
         self.search_query = search_query
         self.dictor_fallback = dictor_fallback
         self.ignore_case = ignore_case
+        self._accessor = PathAccessor(
+            dict_path, search_query, dictor_fallback, ignore_case
+        )
+
+    def _get_accessor(self) -> PathAccessor:
+        """Returns the compiled path, compiling it again if the attributes of the
+        checker have been changed."""
+        key = (self.path, self.search_query, self.dictor_fallback, self.ignore_case)
+        if self._accessor.key != key:
+            self._accessor = PathAccessor(*key)
+        return self._accessor
+
+    def shared_accessor(self) -> PathAccessor | None:
+        """Returns the compiled path, if its value can be found in the JSON body
+        shared by all checkers of the attempt. ConditionsManager merges such paths
+        into the PathTrie, so they are resolved in a single traversal, and shares
+        the search index between checkers with `search_query`."""
+        if type(self).parse_response is not JsonChecker.parse_response:
+            return None
+        return self._get_accessor()
 
     @staticmethod
     def parse_response(
-        data: Response, run_uuid: str | None = None
+        data: Response | ResponseContext, run_uuid: str | None = None
     ) -> dict[str, Any] | list[Any]:
-        """Parse the response content as JSON for comparison.
+        """Parse the response content as JSON for comparison. The content is decoded
+        once per attempt and shared by all checkers using the same ResponseContext.
 
         Args:
-            data (Response): response containing the JSON data.
+            data (Response | ResponseContext): response containing the JSON data.
             run_uuid (str | None): unique run identifier. Defaults to None.
 
         Returns:
             dict[str, Any] | list[Any]: The parsed JSON response data for comparison."""
-        log.debug("Check uuid: %s | Response content: %s", run_uuid, data.content)
-        return data.json()
+        context = ResponseContext.of(data)
+        log.debug(
+            "Check uuid: %s | Response content: %s", run_uuid, context.loaded_content()
+        )
+        return context.json()
 
-    def prepare_data(self, data: Response, run_uuid: str | None = None) -> Any:
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> Any:
         """Prepare the response data for comparison.
 
         Args:
-            data (Response): The response containing the data.
+            data (Response | ResponseContext): The response containing the data.
             run_uuid (str | None): The unique run identifier. Defaults to None.
 
         Returns:
             Any: The prepared data for comparison."""
         try:
-            dictor_data = dictor(
-                data=self.parse_response(data, run_uuid),
-                path=self.path,
-                search=self.search_query,
-                default=self.dictor_fallback,
-                ignorecase=self.ignore_case,
+            accessor = self._get_accessor()
+            json_data = self.parse_response(data, run_uuid)
+            dictor_data = (
+                data.resolve(accessor, json_data)
+                if isinstance(data, ResponseContext)
+                else accessor(json_data)
             )
             log.debug(
                 "Check uuid: %s | Dictor path: %s"
@@ -120,9 +160,104 @@ class JsonChecker(Checker):
         return None
 
 
+class StreamingJsonChecker(JsonChecker):
+    """A JsonChecker which parses the JSON response incrementally and stops reading
+    the body as soon as the value under `dict_path` is found. It is meant for
+    responses with a small field at the beginning, followed by a large document.
+    Requires the `stream` extra: `pip install bepatient[stream]`.
+
+    The body is read only as far as needed, if the request has been sent with
+    `stream=True` (see `RequestsWaiter`). Checkers with `search_query`, without
+    `dict_path` or with negative list indexes parse the whole document.
+
+    Example:
+        To check the "status" field without downloading the following results:
+        ```
+            checker = StreamingJsonChecker(lambda a, b: a == b, "done", "status")
+            assert checker.check(response) is True
+        ```"""
+
+    __slots__ = ()
+
+    def _is_streamable(self) -> bool:
+        return (
+            self.path is not None
+            and self.search_query is None
+            and all(
+                index is None or index >= 0
+                for _, index, _ in self._get_accessor().steps
+            )
+        )
+
+    def shared_accessor(self) -> PathAccessor | None:
+        """Streamable paths are not shared, as they must not parse the whole body."""
+        if self._is_streamable():
+            return None
+        return super().shared_accessor()
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> Any:
+        """Prepare the response data for comparison, reading the body only as far as
+        the value under `dict_path`.
+
+        Args:
+            data (Response | ResponseContext): The response containing the data.
+            run_uuid (str | None): The unique run identifier. Defaults to None.
+
+        Returns:
+            Any: The prepared data for comparison."""
+        if not self._is_streamable():
+            return super().prepare_data(data, run_uuid)
+
+        # pylint: disable-next=import-outside-toplevel
+        from .json_stream import find_in_stream
+
+        context = ResponseContext.of(data)
+        try:
+            value = find_in_stream(
+                context.open_stream(), self._get_accessor().steps, self.ignore_case
+            )
+        except ValueError:
+            log.exception(
+                "Check uuid: %s | Expected: %s | Headers: %s | Content %s",
+                run_uuid,
+                self.expected_value,
+                data.headers,
+                context.loaded_content(),
+            )
+            return None
+        if value is MISSING:
+            value = self.dictor_fallback
+        log.debug(
+            "Check uuid: %s | Streamed path: %s | Data: %s", run_uuid, self.path, value
+        )
+        return value
+
+
 class HeadersChecker(JsonChecker):
     """A checker that compares response headers against expected values.
 
+    The header under `dict_path` is looked up directly in the case-insensitive
+    headers of the response, which are never copied. `search_query` and checks
+    without `dict_path` work on the same mapping.
+
+    Args:
+        comparer (Callable): A function that performs the comparison.
+        expected_value (Any): The expected value to compare against.
+        dict_path (str, optional): name of the header. Defaults to None.
+        search_query (str, optional): A search query to find the value in the
+            headers. Defaults to None.
+        dictor_fallback (str, optional): A value returned if the header is missing.
+            Defaults to None.
+        ignore_case (bool, optional): If set, upper/lower-case keys are treated the
+            same by `search_query`. Header names in `dict_path` are always
+            case-insensitive. Defaults to False.
+        header_type ("int" | "list" | "date" | "retry_after" | "cache_control" |
+            Callable, optional): parser of the header found under `dict_path`,
+            e.g. "int" for `Content-Length` or "cache_control" for the dictionary of
+            `Cache-Control` directives. See `HEADER_PARSERS`. Defaults to None.
+
     Example:
         To check if the "Content-Type" header in a response is "application/json":
         ```
@@ -131,18 +266,371 @@ class HeadersChecker(JsonChecker):
             )
             assert checker.check(response) is True
         ```
+        To check if the response may be cached for at least a minute:
+        ```
+            checker = HeadersChecker(
+                lambda a, b: a.get("max-age", 0) >= b,
+                60,
+                dict_path="Cache-Control",
+                header_type="cache_control",
+            )
+        ```
     """
 
+    __slots__ = ("header_type",)
+
+    def __init__(
+        self,
+        comparer: Callable[[Any, Any], bool],
+        expected_value: Any,
+        dict_path: str | None = None,
+        search_query: str | None = None,
+        dictor_fallback: str | None = None,
+        ignore_case: bool = False,
+        header_type: HEADER_TYPES | Callable[[str], Any] | None = None,
+    ):
+        if isinstance(header_type, str) and header_type not in HEADER_PARSERS:
+            raise ValueError(
+                f"Unknown header type: {header_type}."
+                f" Available: {', '.join(HEADER_PARSERS)}"
+            )
+        super().__init__(
+            comparer,
+            expected_value,
+            dict_path,
+            search_query,
+            dictor_fallback,
+            ignore_case,
+        )
+        self.header_type = header_type
+
     @staticmethod
-    def parse_response(data: Response, run_uuid: str | None = None) -> dict[str, str]:
-        """Parse the response headers for comparison.
+    def parse_response(  # type: ignore[override]
+        data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> CaseInsensitiveDict[str]:
+        """Returns the response headers for comparison, without copying them.
 
         Args:
-            data (Response): The response containing the headers.
+            data (Response | ResponseContext): The response containing the headers.
             run_uuid (str | None): The unique run identifier. Defaults to None.
 
         Returns:
-            dict[str, str]: The parsed response headers for comparison."""
-        headers = dict(data.headers)
+            CaseInsensitiveDict[str]: The response headers."""
+        headers = ResponseContext.of(data).headers
         log.debug("Check uuid: %s | Response headers: %s", run_uuid, headers)
         return headers
+
+    def _parse_header(self, value: str) -> Any:
+        if self.header_type is None:
+            return value
+        if callable(self.header_type):
+            return self.header_type(value)
+        return HEADER_PARSERS[self.header_type](value)
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> Any:
+        """Prepare the response header for comparison.
+
+        Args:
+            data (Response | ResponseContext): The response containing the headers.
+            run_uuid (str | None): The unique run identifier. Defaults to None.
+
+        Returns:
+            Any: The prepared data for comparison."""
+        headers = self.parse_response(data, run_uuid)
+        if self.path is None or self.search_query is not None:
+            value = self._get_accessor()(headers)
+        elif (header := headers.get(self.path)) is None:
+            value = self.dictor_fallback
+        else:
+            try:
+                value = self._parse_header(header)
+            except (TypeError, ValueError):
+                log.exception(
+                    "Check uuid: %s | Header %s could not be parsed as %s: %s",
+                    run_uuid,
+                    self.path,
+                    self.header_type,
+                    header,
+                )
+                return None
+        log.debug(
+            "Check uuid: %s | Dictor path: %s | Dictor search: %s | Dictor data: %s",
+            run_uuid,
+            self.path,
+            self.search_query,
+            value,
+        )
+        return value
+
+
+class BodyBytesChecker(Checker):
+    """A checker that compares the raw body of the response, without decoding it as
+    text or parsing it as JSON. It is meant for checks like "the body contains the
+    marker" with the `contain`, `starts_with`, `ends_with`, `match_regex` or
+    `have_len_*` comparers.
+
+    String expected values (also inside lists) are encoded once, and the pattern of
+    `match_regex` is precompiled. If the response is streamed, `starts_with` reads
+    only as many bytes as the prefix has.
+
+    Args:
+        comparer (Callable): A function that performs the comparison.
+        expected_value (Any): The expected value to compare against.
+        ignore_case (bool, optional): If set, upper/lower-case ASCII letters are
+            treated the same. Defaults to False.
+        encoding (str, optional): encoding of string expected values.
+            Defaults to "utf-8".
+
+    Example:
+        To check if the body contains the marker:
+        ```
+            checker = BodyBytesChecker(lambda a, b: b in a, b"<status>done</status>")
+            assert checker.check(response) is True
+        ```"""
+
+    __slots__ = ("ignore_case", "encoding")
+    uses_response_context = True
+
+    def __init__(
+        self,
+        comparer: Callable[[Any, Any], bool],
+        expected_value: Any,
+        ignore_case: bool = False,
+        encoding: str = "utf-8",
+    ):
+        super().__init__(comparer, expected_value)
+        self.ignore_case = ignore_case
+        self.encoding = encoding
+
+    def _encode(self, value: Any) -> Any:
+        if isinstance(value, str):
+            value = value.encode(self.encoding)
+        if isinstance(value, bytes) and self.ignore_case:
+            return value.lower()
+        if isinstance(value, (list, tuple, set)):
+            return type(value)(self._encode(item) for item in value)
+        return value
+
+    def prepare_expected_value(self) -> Any:
+        """Returns the expected value prepared for the comparison with bytes. It is
+        prepared again only if the attributes of the checker have been changed."""
+        source = (self.expected_value, self.comparer, self.ignore_case, self.encoding)
+        if self._expected_source != source:
+            if self.comparer is match_regex and isinstance(
+                self.expected_value, (str, bytes)
+            ):
+                pattern = self.expected_value
+                if isinstance(pattern, str):
+                    pattern = pattern.encode(self.encoding)
+                self._expected = re.compile(
+                    pattern, re.IGNORECASE if self.ignore_case else 0
+                )
+            else:
+                self._expected = self._encode(self.expected_value)
+            self._expected_source = source
+        return self._expected
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> bytes:
+        """Prepare the response body for comparison.
+
+        Args:
+            data (Response | ResponseContext): The response containing the body.
+            run_uuid (str | None): The unique run identifier. Defaults to None.
+
+        Returns:
+            bytes: the body, or its beginning for `starts_with` on the streamed
+                response."""
+        context = ResponseContext.of(data)
+        expected = self.prepare_expected_value()
+        if (
+            self.comparer is starts_with
+            and context.is_streamed
+            and isinstance(expected, bytes)
+        ):
+            body = context.open_stream().read(len(expected))
+        else:
+            body = context.content
+        if self.ignore_case and not isinstance(expected, re.Pattern):
+            body = body.lower()
+        log.debug("Check uuid: %s | Body length: %s", run_uuid, len(body))
+        return body
+
+
+class JmesPathChecker(Checker):
+    """A checker that compares the result of the JMESPath expression evaluated on
+    the JSON response. Unlike `dict_path`, expressions may filter and project the
+    data, e.g. `items[?state == 'done'].id`. Expressions are compiled once and cached
+    for the whole process. Requires the `jmespath` extra:
+    `pip install bepatient[jmespath]`.
+
+    Args:
+        comparer (Callable): A function that performs the comparison.
+        expected_value (Any): The expected value to compare against.
+        dict_path (str): JMESPath expression.
+
+    Raises:
+        jmespath.exceptions.ParseError: if the expression is not valid.
+
+    Example:
+        To check if all items are done:
+        ```
+            checker = JmesPathChecker(
+                lambda a, b: a == b, True, "length(items[?state != 'done']) == `0`"
+            )
+            assert checker.check(response) is True
+        ```"""
+
+    __slots__ = ("path", "_query")
+    uses_response_context = True
+
+    def __init__(
+        self, comparer: Callable[[Any, Any], bool], expected_value: Any, dict_path: str
+    ):
+        super().__init__(comparer, expected_value)
+        self.path = dict_path
+        self._query: Any = None
+        self._get_query()
+
+    def _get_query(self) -> Any:
+        """Returns the compiled expression, taking it from the cache again if the
+        path has been changed."""
+        if self._query is None or self._query.expression != self.path:
+            # pylint: disable-next=import-outside-toplevel
+            from .jmespath_query import compile_query
+
+            self._query = compile_query(self.path)
+        return self._query
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> Any:
+        """Prepare the response data for comparison.
+
+        Args:
+            data (Response | ResponseContext): The response containing the data.
+            run_uuid (str | None): The unique run identifier. Defaults to None.
+
+        Returns:
+            Any: The result of the expression."""
+        # pylint: disable-next=import-outside-toplevel
+        from .jmespath_query import QueryError
+
+        try:
+            value = self._get_query().search(JsonChecker.parse_response(data, run_uuid))
+        except (TypeError, JSONDecodeError, QueryError):
+            log.exception(
+                "Check uuid: %s | Expected: %s | Expression: %s | Content %s",
+                run_uuid,
+                self.expected_value,
+                self.path,
+                ResponseContext.of(data).loaded_content(),
+            )
+            return None
+        log.debug(
+            "Check uuid: %s | Expression: %s | Data: %s", run_uuid, self.path, value
+        )
+        return value
+
+
+class SchemaChecker(JsonChecker):
+    """A checker that validates the JSON response, or its part under `dict_path`,
+    against the JSON Schema given as the expected value. Use it with the
+    `match_schema` comparer. Validators are compiled once per schema and cached
+    across checkers and waiters. Validation stops at the first violation, whose
+    JSON pointer is shown in the error message. Requires the `schema` extra:
+    `pip install bepatient[schema]`.
+
+    Raises:
+        ValueError: if the comparer is not `match_schema`.
+        jsonschema.exceptions.SchemaError: if the schema is not valid.
+
+    Example:
+        To wait until the job has its result:
+        ```
+            checker = SchemaChecker(
+                match_schema,
+                {"type": "object", "required": ["result"]},
+                dict_path="job",
+            )
+            assert checker.check(response) is True
+        ```"""
+
+    __slots__ = ("_validator", "_schema", "_violation")
+
+    def __init__(
+        self,
+        comparer: Callable[[Any, Any], bool],
+        expected_value: Any,
+        dict_path: str | None = None,
+        search_query: str | None = None,
+        dictor_fallback: str | None = None,
+        ignore_case: bool = False,
+    ):
+        if comparer is not match_schema:
+            raise ValueError(
+                f"SchemaChecker requires the match_schema comparer, got: "
+                f"{getattr(comparer, '__name__', comparer)}"
+            )
+        super().__init__(
+            comparer,
+            expected_value,
+            dict_path,
+            search_query,
+            dictor_fallback,
+            ignore_case,
+        )
+        self._schema: Any = _NOT_PREPARED
+        self._validator: Any = None
+        self._violation: Any = None
+        self.prepare_expected_value()
+
+    def prepare_expected_value(self) -> Any:
+        """Returns the compiled validator of the schema, taking it from the cache
+        again only if the schema has been replaced."""
+        if self._schema is not self.expected_value:
+            # pylint: disable-next=import-outside-toplevel
+            from .json_schema import validator_cache
+
+            self._validator = validator_cache.get(self.expected_value)
+            self._schema = self.expected_value
+        return self._validator
+
+    def prepare_data(
+        self, data: Response | ResponseContext, run_uuid: str | None = None
+    ) -> Any:
+        self._violation = _NOT_PREPARED
+        return super().prepare_data(data, run_uuid)
+
+    def violation(self) -> str | None:
+        """Returns the JSON pointer and message of the first violation found in the
+        last checked data, or None if it is valid. It is computed only when needed,
+        i.e. for the error message."""
+        if self._violation is _NOT_PREPARED:
+            # pylint: disable-next=import-outside-toplevel
+            from .json_schema import first_violation
+
+            self._violation = first_violation(
+                self.prepare_expected_value(), self._prepared_data
+            )
+        return self._violation
+
+    def _public_attributes(self) -> dict[str, Any]:
+        # the schema may be long, the description shows its hash only
+        # pylint: disable-next=import-outside-toplevel
+        from .json_schema import ValidatorCache
+
+        attrs = super()._public_attributes()
+        schema_hash = ValidatorCache.schema_hash(self.expected_value)
+        attrs["expected_value"] = f"<schema {schema_hash[:12]}>"
+        return attrs
+
+    def error_message(self) -> str:
+        text = super().error_message()
+        violation = self.violation()
+        if violation is None:
+            return text
+        return f"{text} | Violation: {preview(violation, 300)}"
@@ -0,0 +1,225 @@
+import json
+import logging
+from io import BytesIO
+from typing import IO, Any
+
+from requests import Response
+from requests.exceptions import (
+    ChunkedEncodingError,
+)
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ContentDecodingError
+from requests.exceptions import SSLError as RequestsSSLError
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+
+from .json_decoders import JsonDecoder, get_default_json_decoder
+from .path_accessor import MISSING, PathAccessor, PathTrie, SearchIndex
+
+log = logging.getLogger(__name__)
+_NOT_PARSED = object()
+NOT_LOADED = "<body not loaded>"
+
+
+class _StreamReader:
+    """File-like reader of the streamed body. Every reader starts from the beginning
+    of the body, bytes already read by other readers are taken from the buffer."""
+
+    def __init__(self, context: "ResponseContext"):
+        self._context = context
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        # pylint: disable-next=protected-access
+        chunk = self._context._read_stream(self._position, size)
+        self._position += len(chunk)
+        return chunk
+
+
+# pylint: disable-next=too-many-instance-attributes
+class ResponseContext:
+    """Per-attempt view of a response, shared by all checkers of a single check.
+
+    The body is decoded at most once, no matter how many checkers read it. If the
+    request has been sent with `stream=True`, the body is read only as far as
+    checkers need it. Attributes which are not handled here are
+    taken from the wrapped response, so checkers written against `Response` keep
+    working.
+
+    Args:
+        response (Response): response received in the current attempt.
+        json_decoder (JsonDecoder | None, optional): function decoding JSON from the
+            content bytes. If not provided, the one set by `set_json_decoder` is used,
+            or `Response.json()` when there is none. Defaults to None."""
+
+    def __init__(self, response: Response, json_decoder: JsonDecoder | None = None):
+        self.response = response
+        self.json_decoder = json_decoder
+        self._json: Any = _NOT_PARSED
+        self._json_error: Exception | None = None
+        self._stream_buffer = bytearray()
+        self.path_trie: PathTrie | None = None
+        self._found_paths: dict[int, Any] | None = None
+        self.index_searches = False
+        self.search_indexes: dict[int, SearchIndex] = {}
+
+    @classmethod
+    def of(cls, data: "Response | ResponseContext") -> "ResponseContext":
+        """Returns the given context or wraps a response in the new one."""
+        if isinstance(data, cls):
+            return data
+        return cls(data)  # type: ignore[arg-type]
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def content(self) -> bytes:
+        self.load_body()
+        return self.response.content
+
+    @property
+    def is_streamed(self) -> bool:
+        """Whether the body is streamed and has not been entirely read yet."""
+        return (
+            getattr(self.response, "_content", None) is False
+            and getattr(self.response, "raw", None) is not None
+        )
+
+    def loaded_content(self) -> bytes | str:
+        """Returns the content, or a placeholder if the body is streamed and has not
+        been read yet. Used for logging, so it does not consume the stream."""
+        if self.is_streamed:
+            return NOT_LOADED
+        return self.response.content
+
+    def open_stream(self) -> IO[bytes]:
+        """Returns a file-like object reading the body from its beginning. The
+        streamed body is read from the connection only as far as it is needed."""
+        if not self.is_streamed:
+            return BytesIO(self.response.content)
+        return _StreamReader(self)  # type: ignore[return-value]
+
+    def _read_stream(self, position: int, size: int) -> bytes:
+        if size < 0:
+            self.load_body()
+        elif self.is_streamed:
+            missing = position + size - len(self._stream_buffer)
+            while missing > 0:
+                chunk = self._read_raw(missing)
+                if not chunk:
+                    break
+                self._stream_buffer += chunk
+                missing -= len(chunk)
+            return bytes(self._stream_buffer[position : position + size])
+
+        if size < 0:
+            return self.response.content[position:]
+        return self.response.content[position : position + size]
+
+    def _read_raw(self, size: int | None = None) -> bytes:
+        """Reads the streamed body from the connection. Errors of urllib3 are raised
+        as exceptions of requests, the same as by `Response.iter_content`."""
+        try:
+            return self.response.raw.read(size, decode_content=True)
+        except ProtocolError as exc:
+            raise ChunkedEncodingError(exc) from exc
+        except DecodeError as exc:
+            raise ContentDecodingError(exc) from exc
+        except ReadTimeoutError as exc:
+            raise RequestsConnectionError(exc) from exc
+        except SSLError as exc:
+            raise RequestsSSLError(exc) from exc
+
+    def load_body(self) -> None:
+        """Reads the rest of the streamed body, so it is available as the content of
+        the response."""
+        if not self.is_streamed:
+            return
+        self._stream_buffer += self._read_raw()
+        # pylint: disable=protected-access
+        self.response._content = bytes(self._stream_buffer)
+        self.response._content_consumed = True  # type: ignore[attr-defined]
+        self._stream_buffer = bytearray()
+
+    # noinspection PyUnresolvedReferences
+    @property
+    def headers(self) -> CaseInsensitiveDict[str]:
+        return self.response.headers
+
+    def json(self) -> Any:
+        """Returns the response body decoded as JSON. The body is decoded only once,
+        subsequent calls return the cached result or raise the cached error."""
+        if self._json is _NOT_PARSED:
+            json_decoder = self.json_decoder or get_default_json_decoder()
+            try:
+                if json_decoder is None and self.is_streamed:
+                    self._json = json.loads(self.content)
+                elif json_decoder is None:
+                    self._json = self.response.json()
+                else:
+                    self._json = json_decoder(self.content)
+            except (TypeError, ValueError) as exc:
+                self._json = None
+                self._json_error = exc
+                raise
+        if self._json_error is not None:
+            raise self._json_error
+        return self._json
+
+    def find_path(self, accessor: PathAccessor) -> Any:
+        """Returns the value found under the path of the accessor, if it is one of
+        the paths of `path_trie`. Values of all paths of the trie are found in
+        a single traversal of the JSON body, the first time any of them is needed.
+
+        Returns:
+            Any: value found under the path, before the search, or MISSING if the
+                accessor is not a part of the trie."""
+        if self.path_trie is None:
+            return MISSING
+        if self._found_paths is None:
+            self._found_paths = self.path_trie.resolve(self.json())
+        return self._found_paths.get(id(accessor), MISSING)
+
+    def search(self, data: Any, key: str, default: Any = None) -> Any:
+        """Searches the data for the key using the SearchIndex shared by all
+        checkers of the attempt. The index of the data is built on its first search.
+
+        Args:
+            data (Any): parsed body or its part found under the path.
+            key (str): key to search for.
+            default (Any, optional): value returned if nothing was found.
+                Defaults to None.
+
+        Returns:
+            Any: list of the found values or the default value."""
+        index = self.search_indexes.get(id(data))
+        if index is None or index.data is not data:
+            index = SearchIndex(data)
+            self.search_indexes[id(data)] = index
+            log.debug("Search index built | %s", index)
+        found = index.search(key, default)
+        log.debug("Search index | Key: %s | %s", key, index)
+        return found
+
+    def resolve(self, accessor: PathAccessor, data: Any) -> Any:
+        """Returns the value of the accessor in the parsed body, using the values
+        of `path_trie` and the shared search index, if they are enabled.
+
+        Args:
+            accessor (PathAccessor): compiled path of the checker.
+            data (Any): parsed body.
+
+        Returns:
+            Any: the value found in the data."""
+        searcher = self.search if self.index_searches else None
+        found = self.find_path(accessor)
+        if found is MISSING:
+            return accessor(data, searcher)
+        return accessor.finish(found, searcher)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "response":
+            raise AttributeError(name)
+        return getattr(self.response, name)
@@ -1,6 +1,14 @@
-from collections.abc import Iterable, Sized
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sized
+from math import isnan
 from typing import Any, Callable, Literal, TypeAlias
 
+# minimal len(data) * len(expected_value), from which `contain_all` and
+# `contain_any` prepare sets instead of scanning data for every expected element,
+# see benchmarks/bench_comparators.py
+LARGE_INPUT = 128
+
 
 def is_equal(data: Any, expected_value: Any) -> bool:
     """Returns True if data is equal to expected_value, False otherwise."""
@@ -62,10 +70,162 @@ def not_contain(data: Iterable[Any], expected_value: Any) -> bool:
         return False
 
 
+class ExpectedItems:
+    """Elements of the expected value of `contain_all` and `contain_any` prepared
+    for membership tests. Hashable elements are kept in a frozenset, the others in
+    a list. Checkers prepare it once and reuse it in every attempt.
+
+    Args:
+        items (Iterable[Any]): expected elements."""
+
+    __slots__ = ("items", "hashable", "unhashable")
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items if isinstance(items, (list, tuple)) else list(items)
+        hashable = set()
+        self.unhashable: list[Any] = []
+        for item in self.items:
+            try:
+                hashable.add(item)
+            except TypeError:
+                self.unhashable.append(item)
+        self.hashable = frozenset(hashable)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return f"ExpectedItems({self.items!r})"
+
+
+def prepare_expected_items(expected_value: Any) -> Any:
+    """Returns ExpectedItems of the list, tuple or set, or the expected value
+    unchanged if it is not a collection of elements."""
+    if isinstance(expected_value, (list, tuple, set, frozenset)):
+        return ExpectedItems(expected_value)
+    return expected_value
+
+
+def _expected_items(data: Any, expected_value: Any) -> ExpectedItems | None:
+    """Returns ExpectedItems, if the data is a list and sets are worth using."""
+    if not isinstance(data, (list, tuple)):
+        return None
+    if isinstance(expected_value, ExpectedItems):
+        return expected_value
+    if (
+        isinstance(expected_value, Sized)
+        and len(data) * len(expected_value) >= LARGE_INPUT
+    ):
+        return ExpectedItems(expected_value)  # type: ignore[arg-type]
+    return None
+
+
+def _hashable_elements(data: Iterable[Any]) -> set[Any]:
+    elements = set()
+    for element in data:
+        try:
+            elements.add(element)
+        except TypeError:
+            pass
+    return elements
+
+
+def _order_of(value: Any) -> tuple[type, type | None] | None:
+    """Returns the type of the list or tuple and the type of its elements, if they
+    are totally ordered: all strings or all numbers (without NaN). Other values,
+    e.g. sets ordered only partially by inclusion, return None."""
+    if type(value) not in (list, tuple):  # pylint: disable=unidiomatic-typecheck
+        return None
+    element_type: type | None = None
+    for element in value:
+        if isinstance(element, str):
+            current: type = str
+        elif isinstance(element, int) or (
+            isinstance(element, float) and not isnan(element)
+        ):
+            current = float
+        else:
+            return None
+        if element_type not in (None, current):
+            return None
+        element_type = current
+    return type(value), element_type
+
+
+def _merge_orders(
+    order: tuple[type, type | None] | None, other: tuple[type, type | None] | None
+) -> tuple[type, type | None] | None:
+    if order is None or other is None or order[0] is not other[0]:
+        return None
+    if order[1] is not None and other[1] is not None and order[1] is not other[1]:
+        return None
+    return order[0], order[1] or other[1]
+
+
+def _sequence_contains(data: list[Any] | tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Returns the membership test of unhashable elements: binary search in sorted
+    data if its elements are totally ordered, the scan of data otherwise."""
+    if not data:
+        return data.__contains__
+    order = _order_of(data[0])
+    for element in data:
+        order = _merge_orders(order, _order_of(element))
+        if order is None:
+            return data.__contains__
+    ordered = sorted(data)
+
+    def contains(item: Any) -> bool:
+        if _merge_orders(order, _order_of(item)) is None:
+            return item in data
+        index = bisect_left(ordered, item)
+        return index < len(ordered) and ordered[index] == item
+
+    return contains
+
+
+def _contain_all_items(
+    data: list[Any] | tuple[Any, ...], expected: ExpectedItems
+) -> bool:
+    if expected.hashable:
+        try:
+            missing = expected.hashable.difference(data)
+        except TypeError:
+            missing = expected.hashable.difference(_hashable_elements(data))
+        if missing:
+            return False
+    if not expected.unhashable:
+        return True
+    contains = _sequence_contains(data)
+    return all(contains(item) for item in expected.unhashable)
+
+
+def _contain_any_items(
+    data: list[Any] | tuple[Any, ...], expected: ExpectedItems
+) -> bool:
+    if expected.hashable:
+        try:
+            if not expected.hashable.isdisjoint(data):
+                return True
+        except TypeError:
+            if not expected.hashable.isdisjoint(_hashable_elements(data)):
+                return True
+    if not expected.unhashable:
+        return False
+    contains = _sequence_contains(data)
+    return any(contains(item) for item in expected.unhashable)
+
+
 def contain_all(data: Iterable[Any], expected_value: Iterable[Any]) -> bool:
     """Returns True if all elements in expected_value are present in data,
-    False otherwise."""
+    False otherwise. Large lists are compared using sets, expected_value may be
+    prepared once with `prepare_expected_items` (checkers do it themselves)."""
     try:
+        expected_items = _expected_items(data, expected_value)
+        if expected_items is not None:
+            return _contain_all_items(data, expected_items)  # type: ignore[arg-type]
         return all((i in data for i in expected_value))
     except TypeError:
         return False
@@ -73,8 +233,12 @@ def contain_all(data: Iterable[Any], expected_value: Iterable[Any]) -> bool:
 
 def contain_any(data: Iterable[Any], expected_value: Iterable[Any]) -> bool:
     """Returns True if any element in expected_value is present in data,
-    False otherwise."""
+    False otherwise. Large lists are compared using sets, expected_value may be
+    prepared once with `prepare_expected_items` (checkers do it themselves)."""
     try:
+        expected_items = _expected_items(data, expected_value)
+        if expected_items is not None:
+            return _contain_any_items(data, expected_items)  # type: ignore[arg-type]
         return any((i in data for i in expected_value))
     except TypeError:
         return False
@@ -107,7 +271,53 @@ def have_len_lesser(data: Sized, expected_value: int) -> bool:
         return False
 
 
+def starts_with(data: str | bytes, expected_value: str | bytes) -> bool:
+    """Returns True if data starts with expected_value, False otherwise."""
+    try:
+        return data.startswith(expected_value)  # type: ignore[arg-type]
+    except (AttributeError, TypeError):
+        return False
+
+
+def ends_with(data: str | bytes, expected_value: str | bytes) -> bool:
+    """Returns True if data ends with expected_value, False otherwise."""
+    try:
+        return data.endswith(expected_value)  # type: ignore[arg-type]
+    except (AttributeError, TypeError):
+        return False
+
+
+def match_regex(
+    data: str | bytes, expected_value: str | bytes | re.Pattern[Any]
+) -> bool:
+    """Returns True if the regular expression expected_value matches any part of
+    data, False otherwise. The pattern may be precompiled."""
+    try:
+        return re.search(expected_value, data) is not None  # type: ignore[arg-type]
+    except (TypeError, re.error):
+        return False
+
+
+def match_schema(data: Any, expected_value: Any) -> bool:
+    """Returns True if data is valid against the JSON Schema expected_value, False
+    otherwise. Validation stops at the first violation. The schema is compiled once
+    and cached, it may also be the compiled validator. Requires the `schema` extra."""
+    # pylint: disable-next=import-outside-toplevel
+    from .checkers.json_schema import validator_cache
+
+    if hasattr(expected_value, "iter_errors"):
+        validator = expected_value
+    else:
+        validator = validator_cache.get(expected_value)
+    return next(validator.iter_errors(data), None) is None
+
+
 Comparator: TypeAlias = Callable[[Any, Any], bool]
+# functions preparing the expected value of comparators once per checker
+EXPECTED_VALUE_PREPARERS: dict[Comparator, Callable[[Any], Any]] = {
+    contain_all: prepare_expected_items,
+    contain_any: prepare_expected_items,
+}
 COMPARATORS = Literal[
     "is_equal",
     "is_not_equal",
@@ -122,4 +332,8 @@ COMPARATORS = Literal[
     "have_len_equal",
     "have_len_greater",
     "have_len_lesser",
+    "starts_with",
+    "ends_with",
+    "match_regex",
+    "match_schema",
 ]
@@ -1,24 +1,314 @@
 import logging
-from typing import Any, Literal
+from time import perf_counter
+from typing import Any, Iterable, Iterator, Literal
+
+from requests import Response
 
 from bepatient.waiter_src.checkers.checker import Checker
+from bepatient.waiter_src.checkers.path_accessor import PathAccessor, PathTrie
+from bepatient.waiter_src.checkers.response_checkers import JsonChecker
+from bepatient.waiter_src.checkers.response_context import ResponseContext
 from bepatient.waiter_src.exceptions import ExceptionConditionNotMet, WaiterIsNotReady
 
 log = logging.getLogger(__name__)
 CONDITION_LEVEL = Literal["exception", "pre", "main"]  # pylint: disable=invalid-name
 
 
+class CheckerStatistics:
+    """Evaluation history of a single checker, used to order checkers in the
+    short-circuit mode.
+
+    Attributes:
+        checker (Checker): the checker.
+        level (CONDITION_LEVEL): condition level of the checker.
+        calls (int): number of evaluations.
+        failures (int): number of evaluations, which have not met the condition.
+        total_time (float): total time of evaluations in seconds."""
+
+    __slots__ = ("checker", "level", "calls", "failures", "total_time")
+
+    def __init__(self, checker: Checker, level: CONDITION_LEVEL):
+        self.checker = checker
+        self.level = level
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """Mean time of a single evaluation in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        """Estimated probability of failure. Laplace smoothing is used, so the
+        checker without history has the rate of 0.5."""
+        return (self.failures + 1) / (self.calls + 2)
+
+    @property
+    def score(self) -> float:
+        """Expected cost of finding the failed checker. Checkers are evaluated from
+        the lowest score - the cheapest and the most likely to fail."""
+        return self.mean_time / self.failure_rate
+
+    def record(self, elapsed: float, passed: bool) -> None:
+        self.calls += 1
+        self.total_time += elapsed
+        if not passed:
+            self.failures += 1
+
+    def __str__(self) -> str:
+        return (
+            f"{self.checker.__class__.__name__} | Level: {self.level}"
+            f" | Calls: {self.calls} | Failures: {self.failures}"
+            f" | Mean time: {self.mean_time:.6f} | Score: {self.score:.6f}"
+        )
+
+
+class CheckerSet:
+    """Set of checkers compared by identity, so checkers do not have to be hashable,
+    e.g. dataclasses defining `__eq__`."""
+
+    __slots__ = ("_checkers",)
+
+    def __init__(self, checkers: Iterable[Checker] = ()):
+        self._checkers = {id(checker): checker for checker in checkers}
+
+    def add(self, checker: Checker) -> None:
+        self._checkers[id(checker)] = checker
+
+    def discard(self, checker: Checker) -> None:
+        self._checkers.pop(id(checker), None)
+
+    def clear(self) -> None:
+        self._checkers.clear()
+
+    def __contains__(self, checker: object) -> bool:
+        return id(checker) in self._checkers
+
+    def __iter__(self) -> Iterator[Checker]:
+        return iter(self._checkers.values())
+
+    def __len__(self) -> int:
+        return len(self._checkers)
+
+
+# pylint: disable-next=too-many-instance-attributes
 class ConditionsManager:
     """Manages and evaluates conditions grouped into three levels:
     - exception_conditions - conditions that trigger an exception if not met,
     - precondition_conditions - conditions that are checked prior to the main
         conditions,
-    - main_conditions - core conditions, those are checked last."""
+    - main_conditions - core conditions, those are checked last.
+
+    Attributes:
+        short_circuit (bool): if set, checking of the level stops at its first failed
+            checker, unless `full_evaluation` is set. Failed exception conditions end
+            the wait, so all of them are still checked. Defaults to False.
+        full_evaluation (bool): if set, all checkers of the level are checked, even
+            in the short-circuit mode. Executors set it for the final attempt, so
+            the error message lists all failed checkers. Defaults to False.
+        last_order (dict[CONDITION_LEVEL, list[Checker]]): order in which checkers of
+            each level have been evaluated in the last check. In the short-circuit
+            mode, checkers are sorted by their `CheckerStatistics.score`, which are
+            recorded only in this mode.
+        latching_checkers (CheckerSet): checkers which, once passed, are treated as
+            satisfied and are not evaluated again until `reset_latches` is called.
+        latching_levels (set[CONDITION_LEVEL]): levels whose all checkers are
+            latching.
+        short_circuited (bool): whether the last check has stopped at the first
+            failed checker of a level, leaving other checkers unevaluated.
+
+    Containers of the order, statistics and latches are created on their first use,
+    so managers not using them stay small."""
+
+    __slots__ = (
+        "exception_conditions",
+        "pre_conditions",
+        "main_conditions",
+        "short_circuit",
+        "full_evaluation",
+        "_last_order",
+        "_statistics",
+        "_latching_checkers",
+        "_latching_levels",
+        "_satisfied",
+        "_path_trie",
+        "short_circuited",
+    )
 
     def __init__(self):
         self.exception_conditions = []
         self.pre_conditions = []
         self.main_conditions = []
+        self.short_circuit = False
+        self.full_evaluation = False
+        self._last_order: dict[CONDITION_LEVEL, list[Checker]] | None = None
+        self._statistics: dict[int, CheckerStatistics] | None = None
+        self._latching_checkers: CheckerSet | None = None
+        self._latching_levels: set[CONDITION_LEVEL] | None = None
+        self._satisfied: CheckerSet | None = None
+        self._path_trie: PathTrie | None = None
+        self.short_circuited = False
+
+    @property
+    def last_order(self) -> dict[CONDITION_LEVEL, list[Checker]]:
+        if self._last_order is None:
+            self._last_order = {}
+        return self._last_order
+
+    @property
+    def latching_checkers(self) -> CheckerSet:
+        if self._latching_checkers is None:
+            self._latching_checkers = CheckerSet()
+        return self._latching_checkers
+
+    @property
+    def latching_levels(self) -> set[CONDITION_LEVEL]:
+        if self._latching_levels is None:
+            self._latching_levels = set()
+        return self._latching_levels
+
+    @staticmethod
+    def build_context(result: Any) -> Any:
+        """Wraps the result of a single attempt into an object shared by all checkers.
+        Responses are wrapped into a ResponseContext, so their body is parsed only
+        once per attempt. Other results are returned unchanged."""
+        if isinstance(result, Response):
+            return ResponseContext(result)
+        return result
+
+    def _get_shared_accessors(self) -> list[PathAccessor]:
+        accessors: list[PathAccessor] = []
+        for checker in (
+            *self.exception_conditions,
+            *self.pre_conditions,
+            *self.main_conditions,
+        ):
+            if isinstance(checker, JsonChecker):
+                accessor = checker.shared_accessor()
+                if accessor is not None:
+                    accessors.append(accessor)
+        return accessors
+
+    def get_path_trie(self) -> PathTrie | None:
+        """Returns the PathTrie of paths shared by JsonCheckers of all levels. It is
+        built again only if the checkers or their paths have been changed.
+
+        Returns:
+            PathTrie | None: trie of the paths, or None if less than two checkers
+                share the JSON body."""
+        accessors = [
+            accessor for accessor in self._get_shared_accessors() if accessor.steps
+        ]
+        if len(accessors) < 2:
+            self._path_trie = None
+        elif (
+            self._path_trie is None
+            or len(self._path_trie.accessors) != len(accessors)
+            or any(
+                old is not new for old, new in zip(self._path_trie.accessors, accessors)
+            )
+        ):
+            self._path_trie = PathTrie(accessors)
+        return self._path_trie
+
+    def reset_latches(self) -> None:
+        """Forgets satisfied latching checkers, so they are evaluated again. Waiters
+        call it at the beginning of every run."""
+        if self._satisfied is not None:
+            self._satisfied.clear()
+
+    def get_statistics(
+        self, level: CONDITION_LEVEL | None = None
+    ) -> list[CheckerStatistics]:
+        """Returns evaluation statistics of checkers, sorted by their score.
+
+        Args:
+            level (CONDITION_LEVEL | None, optional): returns statistics of the
+                given level only. Defaults to None.
+
+        Returns:
+            list[CheckerStatistics]: statistics of checkers evaluated at least once
+                in the short-circuit mode."""
+        return sorted(
+            (
+                statistics
+                for statistics in (self._statistics or {}).values()
+                if level is None or statistics.level == level
+            ),
+            key=lambda statistics: statistics.score,
+        )
+
+    def _get_checker_statistics(
+        self, checker: Checker, level: CONDITION_LEVEL
+    ) -> CheckerStatistics:
+        if self._statistics is None:
+            self._statistics = {}
+        key = id(checker)
+        if key not in self._statistics:
+            self._statistics[key] = CheckerStatistics(checker, level)
+        return self._statistics[key]
+
+    def _check(
+        self, checker: Checker, level: CONDITION_LEVEL, result: Any, check_uuid: str
+    ) -> bool:
+        if isinstance(result, ResponseContext) and not checker.uses_response_context:
+            result.load_body()
+            result = result.response
+        if self.short_circuit:
+            start = perf_counter()
+            passed = checker.check(result, check_uuid)
+            self._get_checker_statistics(checker, level).record(
+                perf_counter() - start, passed
+            )
+        else:
+            passed = checker.check(result, check_uuid)
+        if passed and (
+            (self._latching_levels and level in self._latching_levels)
+            or (self._latching_checkers and checker in self._latching_checkers)
+        ):
+            log.debug("Check uuid: %s | Condition latched | %s", check_uuid, checker)
+            if self._satisfied is None:
+                self._satisfied = CheckerSet()
+            self._satisfied.add(checker)
+        return passed
+
+    def _get_failed_checkers(
+        self, level: CONDITION_LEVEL, checkers: list[Checker], result: Any, uuid: str
+    ) -> list[Checker]:
+        if self._satisfied:
+            checkers = [c for c in checkers if c not in self._satisfied]
+        if self.short_circuit and not self.full_evaluation:
+            order = sorted(
+                checkers,
+                key=lambda checker: self._get_checker_statistics(checker, level).score,
+            )
+            self.last_order[level] = order
+            log.debug(
+                "Check uuid: %s | Order of %s conditions: %s",
+                uuid,
+                level,
+                [checker.__class__.__name__ for checker in order],
+            )
+            for position, checker in enumerate(order, start=1):
+                if not self._check(checker, level, result, uuid):
+                    if level == "exception":
+                        # the exception ends the wait, so it lists all failed checkers
+                        return [checker] + [
+                            other
+                            for other in order[position:]
+                            if not self._check(other, level, result, uuid)
+                        ]
+                    self.short_circuited = position < len(order)
+                    return [checker]
+            return []
+        self.last_order[level] = list(checkers)
+        return [
+            checker
+            for checker in checkers
+            if not self._check(checker, level, result, uuid)
+        ]
 
     def check_all(self, result: Any, check_uuid: str) -> list[Checker]:
         """Simply checks all defined conditions."""
@@ -29,26 +319,29 @@ class ConditionsManager:
         if not self.main_conditions:
             log.info("No main conditions available")
 
+        self.short_circuited = False
+        result = self.build_context(result)
+        if isinstance(result, ResponseContext):
+            result.path_trie = self.get_path_trie()
+            searches = sum(bool(a.search) for a in self._get_shared_accessors())
+            result.index_searches = searches > 1
+
         if self.exception_conditions:
-            failed_checkers = [
-                checker
-                for checker in self.exception_conditions
-                if not checker.check(result, check_uuid)
-            ]
+            failed_checkers = self._get_failed_checkers(
+                "exception", self.exception_conditions, result, check_uuid
+            )
             if failed_checkers:
-                checkers = ", ".join((str(checker) for checker in failed_checkers))
+                checkers = ", ".join(
+                    (checker.error_message() for checker in failed_checkers)
+                )
                 raise ExceptionConditionNotMet(f"Failed checkers: {checkers}")
 
         if self.pre_conditions:
-            failed_checkers = [
-                checker
-                for checker in self.pre_conditions
-                if not checker.check(result, check_uuid)
-            ]
+            failed_checkers = self._get_failed_checkers(
+                "pre", self.pre_conditions, result, check_uuid
+            )
             if failed_checkers:
                 return failed_checkers
-        return [
-            checker
-            for checker in self.main_conditions
-            if not checker.check(result, check_uuid)
-        ]
+        return self._get_failed_checkers(
+            "main", self.main_conditions, result, check_uuid
+        )
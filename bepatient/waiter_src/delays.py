@@ -0,0 +1,124 @@
+import random
+from abc import ABC, abstractmethod
+from typing import TypeAlias
+
+
+class DelayPolicy(ABC):
+    """An abstract class defining how long to wait between two attempts."""
+
+    @abstractmethod
+    def get_delay(self, attempt: int) -> float:
+        """Returns the delay in seconds to wait after the given attempt.
+
+        Args:
+            attempt (int): number of the attempt which has just failed, starting
+                from 1.
+
+        Returns:
+            float: delay in seconds."""
+
+    def reset(self) -> None:
+        """Resets the internal state of the policy before a new run."""
+
+
+class ConstantDelay(DelayPolicy):
+    """Waits the same amount of time after every attempt.
+
+    Args:
+        delay (float): delay in seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def get_delay(self, attempt: int) -> float:
+        return self.delay
+
+
+class LinearDelay(DelayPolicy):
+    """The delay grows by `step` seconds after every attempt.
+
+    Args:
+        initial (float): delay after the first attempt in seconds.
+        step (float): value added to the delay after every next attempt."""
+
+    def __init__(self, initial: float, step: float):
+        self.initial = initial
+        self.step = step
+
+    def get_delay(self, attempt: int) -> float:
+        return self.initial + self.step * (attempt - 1)
+
+
+class ExponentialDelay(DelayPolicy):
+    """The delay is multiplied by `factor` after every attempt.
+
+    Args:
+        initial (float): delay after the first attempt in seconds.
+        factor (float, optional): multiplier of the delay. Defaults to 2.
+        jitter (bool, optional): if set, the random delay from the range
+            [0, computed delay] is used ("full jitter"). Defaults to False."""
+
+    def __init__(self, initial: float, factor: float = 2, jitter: bool = False):
+        self.initial = initial
+        self.factor = factor
+        self.jitter = jitter
+
+    def get_delay(self, attempt: int) -> float:
+        delay = self.initial * self.factor ** (attempt - 1)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+
+class DecorrelatedJitterDelay(DelayPolicy):
+    """Each delay is a random value between `initial` and three times the previous
+    delay, limited by `max_delay`. It spreads the attempts of many concurrent waiters
+    over time, so they do not hit the server at the same moment.
+
+    Args:
+        initial (float): minimal delay in seconds.
+        max_delay (float): maximal delay in seconds."""
+
+    def __init__(self, initial: float, max_delay: float):
+        self.initial = initial
+        self.max_delay = max_delay
+        self._previous = initial
+
+    def get_delay(self, attempt: int) -> float:
+        if attempt == 1:
+            self._previous = self.initial
+        self._previous = min(
+            self.max_delay, random.uniform(self.initial, self._previous * 3)
+        )
+        return self._previous
+
+    def reset(self) -> None:
+        self._previous = self.initial
+
+
+class CappedDelay(DelayPolicy):
+    """Limits the delay returned by another policy.
+
+    Args:
+        policy (DelayPolicy): policy computing the delay.
+        max_delay (float): maximal delay in seconds."""
+
+    def __init__(self, policy: DelayPolicy, max_delay: float):
+        self.policy = policy
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt: int) -> float:
+        return min(self.max_delay, self.policy.get_delay(attempt))
+
+    def reset(self) -> None:
+        self.policy.reset()
+
+
+Delay: TypeAlias = float | DelayPolicy
+
+
+def to_delay_policy(delay: Delay) -> DelayPolicy:
+    """Returns the given policy, or ConstantDelay if the number was given."""
+    if isinstance(delay, DelayPolicy):
+        return delay
+    return ConstantDelay(delay)
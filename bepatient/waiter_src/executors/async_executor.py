@@ -0,0 +1,28 @@
+from abc import abstractmethod
+
+from .executor import Executor
+
+
+class AsyncExecutor(Executor):
+    """An abstract base class for defining an executor that can be awaited. It uses
+    the same conditions as the synchronous Executor, but performs its actions without
+    blocking the event loop."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def is_condition_met_async(self) -> bool:
+        """Check whether the condition has been met.
+
+        Returns:
+            bool: True if the condition has been met, False otherwise."""
+
+    async def aclose(self) -> None:
+        """Releases resources created by the executor. Called when the wait ends,
+        the executor may be run again afterwards."""
+
+    def is_condition_met(self) -> bool:
+        raise TypeError(
+            f"{self.__class__.__name__} is asynchronous."
+            " Use `await is_condition_met_async()` instead."
+        )
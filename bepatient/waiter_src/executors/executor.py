@@ -1,3 +1,5 @@
+import logging
+import uuid
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -5,37 +7,94 @@ from bepatient.waiter_src.checkers.checker import Checker
 from bepatient.waiter_src.conditions_manager import ConditionsManager
 from bepatient.waiter_src.exceptions import ExecutorIsNotReady
 
+log = logging.getLogger(__name__)
+
 
 class Executor(ABC):
-    """An abstract base class for defining an executor that can be waited for."""
+    """An abstract base class for defining an executor that can be waited for.
+    Attributes are kept in `__slots__`. Subclasses without `__slots__` get
+    the instance `__dict__` back."""
+
+    __slots__ = (
+        "conditions_manager",
+        "_failed_checkers",
+        "_result",
+        "_input",
+        "_time_limit",
+    )
 
     def __init__(self):
         self.conditions_manager = ConditionsManager()
         self._failed_checkers: list[Checker] = []
         self._result: Any = None
-        self._input: str | None = None
+        self._input: Any = None
+        self._time_limit: float | None = None
 
-    def add_exception_condition(self, checker: Checker):
+    def add_exception_condition(self, checker: Checker, latch: bool = False):
         """Adds checker function to the condition's manager. If the checker condition
-        is not met, it raises ExceptionConditionNotMet."""
+        is not met, it raises ExceptionConditionNotMet. With `latch`, the checker is
+        not evaluated again once it has passed."""
         self.conditions_manager.exception_conditions.append(checker)
-        return self
+        return self._latch(checker, latch)
 
-    def add_pre_condition(self, checker: Checker):
+    def add_pre_condition(self, checker: Checker, latch: bool = False):
         """Adds checker function to the list of pre_conditions - conditions that will
         be checked before the main ones and after those that may result in an error.
         For example, when we want to check the response status code before verifying
-        the content of the body."""
+        the content of the body. With `latch`, the checker is not evaluated again
+        once it has passed."""
         self.conditions_manager.pre_conditions.append(checker)
-        return self
+        return self._latch(checker, latch)
 
-    def add_main_condition(self, checker: Checker):
+    def add_main_condition(self, checker: Checker, latch: bool = False):
         """Adds checker function to the list of main_conditions in ConditionsManager.
         These are the main conditions to be met. That which we really care about
-        checking the most."""
+        checking the most. With `latch`, the checker is not evaluated again once it
+        has passed."""
         self.conditions_manager.main_conditions.append(checker)
+        return self._latch(checker, latch)
+
+    def _latch(self, checker: Checker, latch: bool):
+        if latch:
+            self.conditions_manager.latching_checkers.add(checker)
+        return self
+
+    def reset_latches(self):
+        """Makes latching checkers, which have already passed, pending again."""
+        self.conditions_manager.reset_latches()
         return self
 
+    def set_time_limit(self, time_limit: float | None):
+        """Limits the time in seconds, that the next attempt may take. Executors
+        which support timeouts should not exceed it. None removes the limit."""
+        self._time_limit = time_limit
+        return self
+
+    def set_final_attempt(self, final_attempt: bool):
+        """Informs the executor whether the next attempt is the last one. On the final
+        attempt all checkers are evaluated, even in the short-circuit mode."""
+        self.conditions_manager.full_evaluation = final_attempt
+        return self
+
+    def evaluate_fully(self):
+        """Checks the last result again with all checkers, if its last evaluation has
+        been short-circuited, so `error_message` lists all failed checkers. No new
+        attempt is made."""
+        manager = self.conditions_manager
+        if self._result is None or not manager.short_circuited:
+            return self
+        log.info("Evaluating all conditions against the last result")
+        full_evaluation = manager.full_evaluation
+        manager.full_evaluation = True
+        try:
+            self._failed_checkers = self._evaluate(self._result, str(uuid.uuid4()))
+        finally:
+            manager.full_evaluation = full_evaluation
+        return self
+
+    def _evaluate(self, result: Any, run_uuid: str) -> list[Checker]:
+        return self.conditions_manager.check_all(result=result, check_uuid=run_uuid)
+
     @abstractmethod
     def is_condition_met(self) -> bool:
         """Check whether the condition has been met.
@@ -52,7 +111,9 @@ class Executor(ABC):
     def error_message(self) -> str:
         """Return a detailed error message if the condition has not been met."""
         if self._result is not None and len(self._failed_checkers) > 0:
-            checkers = ", ".join([str(checker) for checker in self._failed_checkers])
+            checkers = ", ".join(
+                [checker.error_message() for checker in self._failed_checkers]
+            )
             return (
                 "The condition has not been met!"
                 f" | Failed checkers: ({checkers})"
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import uuid
+from typing import Any
+
+from bepatient.curler import Curler
+from bepatient.waiter_src.checkers.checker import Checker
+from bepatient.waiter_src.checkers.json_decoders import (
+    JSON_DECODERS,
+    JsonDecoder,
+    get_json_decoder,
+)
+from bepatient.waiter_src.checkers.response_checkers import StatusCodeChecker
+from bepatient.waiter_src.checkers.response_context import ResponseContext
+from bepatient.waiter_src.comparators import is_equal
+
+from .async_executor import AsyncExecutor
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "HttpxExecutor requires the httpx library. Install it with:"
+        " pip install bepatient[async]"
+    ) from exc
+
+log = logging.getLogger(__name__)
+
+
+def httpx_to_curl(request: httpx.Request) -> str:
+    """Converts the httpx `Request` object to a `curl` command. Bytes of the body,
+    which are not valid UTF-8, are replaced, and the streamed body is omitted."""
+    curl_command = f"curl -X {request.method}"
+    curl_command += Curler._prepare_headers(request.headers)  # type: ignore[arg-type]
+    try:
+        content = request.content
+    except httpx.RequestNotRead:
+        content = b""
+    if content:
+        body = content.decode("utf-8", errors="replace")
+        curl_command += Curler._prepare_body(body, "utf-8")
+    return f"{curl_command} {request.url}"
+
+
+class LazyHttpxCurl:
+    """A `curl` command of the httpx request rendered only when it is converted to
+    a string, e.g. when the log record is actually emitted.
+
+    Args:
+        request (httpx.Request): request to render."""
+
+    __slots__ = ("request", "_curl")
+
+    def __init__(self, request: httpx.Request):
+        self.request = request
+        self._curl: str | None = None
+
+    def __str__(self) -> str:
+        if self._curl is None:
+            self._curl = httpx_to_curl(self.request)
+        return self._curl
+
+    def __repr__(self) -> str:
+        return f"LazyHttpxCurl({self})"
+
+
+# pylint: disable-next=too-many-instance-attributes
+class HttpxExecutor(AsyncExecutor):
+    """An asynchronous executor that sends a request using httpx and waits for
+    a certain condition to be met.
+
+    Args:
+        req_or_res (httpx.Request | httpx.Response): request to send.
+        expected_status_code (int): expected HTTP status code of the response
+        client (httpx.AsyncClient | None, optional): httpx client to use. If not
+            provided, the executor creates its own client, which is closed when
+            the wait ends.
+        timeout (int | tuple[int, int] | None, optional): request timeout in seconds.
+            Default value is 15 for connect and 30 for read (15, 30). If user provide
+            one value, it will be applied to both - connect and read timeouts.
+        json_decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None, optional): JSON decoder used by checkers of this executor. If not
+            provided, the one set by `set_json_decoder` is used. Defaults to None."""
+
+    __slots__ = (
+        "timeout",
+        "json_decoder",
+        "_take_from_result",
+        "client",
+        "_own_client",
+        "request",
+    )
+
+    def __init__(
+        self,
+        req_or_res: httpx.Request | httpx.Response,
+        expected_status_code: int,
+        client: httpx.AsyncClient | None = None,
+        timeout: int | tuple[int, int] | None = None,
+        json_decoder: JSON_DECODERS | JsonDecoder | None = None,
+    ):
+        super().__init__()
+        self.timeout = timeout or (15, 30)
+        self.json_decoder = get_json_decoder(json_decoder)
+        self._result: httpx.Response | None = None
+        self._take_from_result = isinstance(req_or_res, httpx.Response)
+        self.add_pre_condition(StatusCodeChecker(is_equal, expected_status_code))
+
+        self._own_client = client is None
+        if client is None:
+            log.debug("Creating a new AsyncClient object")
+            client = httpx.AsyncClient()
+        self.client = client
+
+        if isinstance(req_or_res, httpx.Response):
+            self._result = req_or_res
+            self.request = (req_or_res.history or [req_or_res])[0].request
+        else:
+            self.request = req_or_res
+
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+        else:
+            connect = read = self.timeout
+        self.request.extensions["timeout"] = httpx.Timeout(
+            read, connect=connect
+        ).as_dict()
+        self._input = LazyHttpxCurl(self.request)
+
+    async def is_condition_met_async(self) -> bool:
+        """Sends the request and check if all checkers pass or timeout occurs.
+
+        Returns:
+            bool: True if all checkers pass, False otherwise."""
+        run_uuid: str = str(uuid.uuid4())
+        if not self._take_from_result:
+            if self._own_client and self.client.is_closed:
+                log.debug("Creating a new AsyncClient object")
+                self.client = httpx.AsyncClient()
+            try:
+                self._result = await asyncio.wait_for(
+                    self.client.send(self.request), timeout=self._time_limit
+                )
+                log.debug("Sent: %s", self._input)
+            except (httpx.HTTPError, asyncio.TimeoutError):
+                log.exception("HTTPError! CURL: %s", self._input)
+                return False
+        else:
+            self._take_from_result = False
+
+        self._failed_checkers = self._evaluate(self._result, run_uuid)
+        if len(self._failed_checkers) == 0:
+            return True
+        return False
+
+    async def aclose(self) -> None:
+        """Closes the client created by the executor. The client provided by the user
+        is left open."""
+        if self._own_client and not self.client.is_closed:
+            log.debug("Closing the AsyncClient object")
+            await self.client.aclose()
+
+    def _evaluate(self, result: Any, run_uuid: str) -> list[Checker]:
+        return self.conditions_manager.check_all(
+            result=ResponseContext(result, self.json_decoder), check_uuid=run_uuid
+        )
@@ -1,17 +1,32 @@
 import logging
 import uuid
+from typing import Any, Literal
 
 from requests import PreparedRequest, Request, Response, Session
 from requests.exceptions import RequestException
 
-from bepatient.curler import Curler
-from bepatient.waiter_src.checkers.response_checkers import StatusCodeChecker
+from bepatient.curler import LazyCurl
+from bepatient.waiter_src.checkers.checker import Checker
+from bepatient.waiter_src.checkers.json_decoders import (
+    JSON_DECODERS,
+    JsonDecoder,
+    get_json_decoder,
+)
+from bepatient.waiter_src.checkers.response_checkers import (
+    HeadersChecker,
+    StatusCodeChecker,
+)
+from bepatient.waiter_src.checkers.response_context import ResponseContext
 from bepatient.waiter_src.comparators import is_equal
 
 from .executor import Executor
+from .session_registry import session_registry
 
 log = logging.getLogger(__name__)
 
+UNREAD_BODY = Literal["drain", "close"]  # pylint: disable=invalid-name
+VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
 
 # pylint: disable-next=too-many-instance-attributes
 class RequestsExecutor(Executor):
@@ -19,10 +34,47 @@ class RequestsExecutor(Executor):
     Args:
         req_or_res (PreparedRequest | Request | Response): request to send.
         expected_status_code (int): expected HTTP status code of the response
-        session (Session | None, optional): requests session to use.
+        session (Session | None, optional): requests session to use. If not provided,
+            the session shared by waiters with the same scheme, host and
+            authentication is taken from the `session_registry`.
         timeout (int | tuple[int, int] | None, optional): request timeout in seconds.
             Default value is 15 for connect and 30 for read (15, 30). If user provide
-            one value, it will be applied to both - connect and read timeouts."""
+            one value, it will be applied to both - connect and read timeouts.
+        conditional (bool, optional): if set, `ETag` and `Last-Modified` of the last
+            response are sent back as `If-None-Match` and `If-Modified-Since`. When
+            the server responds with 304 Not Modified, the last response and verdicts
+            of checkers are reused without checking them again. Defaults to False.
+        skip_unchanged_body (bool, optional): if set, the digest of the status code
+            and body of every response is kept. When it is the same as in the last
+            checked response, checkers are not run again and their last verdicts are
+            reused. If there are HeadersCheckers, the headers are a part of the
+            digest too. Defaults to False.
+        json_decoder ("auto" | "json" | "orjson" | "msgspec" | "simdjson" | Callable |
+            None, optional): JSON decoder used by checkers of this executor. If not
+            provided, the one set by `set_json_decoder` is used. Defaults to None.
+        stream (bool, optional): if set, the request is sent with `stream=True`, so
+            the body is downloaded only as far as checkers read it (see
+            StreamingJsonChecker). The body of the response meeting the conditions is
+            always read entirely. An error of reading the body, e.g. the broken
+            connection, fails the attempt. Defaults to False.
+        unread_body ("drain" | "close", optional): what to do with the unread part of
+            the streamed body of the rejected response. "drain" reads and discards
+            it, so the connection can be reused, "close" closes the connection.
+            Defaults to "drain"."""
+
+    __slots__ = (
+        "_take_from_result",
+        "conditional",
+        "_validators",
+        "skip_unchanged_body",
+        "_digest",
+        "json_decoder",
+        "stream",
+        "unread_body",
+        "timeout",
+        "session",
+        "request",
+    )
 
     def __init__(
         self,
@@ -30,10 +82,22 @@ class RequestsExecutor(Executor):
         expected_status_code: int,
         session: Session | None = None,
         timeout: int | tuple[int, int] | None = None,
+        conditional: bool = False,
+        skip_unchanged_body: bool = False,
+        json_decoder: JSON_DECODERS | JsonDecoder | None = None,
+        stream: bool = False,
+        unread_body: UNREAD_BODY = "drain",
     ):
         super().__init__()
         self._result: Response | None = None
         self._take_from_result: bool = False
+        self.conditional = conditional
+        self._validators: dict[str, str] = {}
+        self.skip_unchanged_body = skip_unchanged_body
+        self._digest: int | None = None
+        self.json_decoder = get_json_decoder(json_decoder)
+        self.stream = stream
+        self.unread_body = unread_body
         self.add_pre_condition(StatusCodeChecker(is_equal, expected_status_code))
 
         if timeout:
@@ -44,8 +108,8 @@ class RequestsExecutor(Executor):
         if session:
             self.session = session
         else:
-            log.debug("Creating a new Session object")
-            self.session = Session()
+            log.debug("Using the pooled Session object")
+            self.session = session_registry.get_session(req_or_res)
 
         if isinstance(req_or_res, Request):
             self.request = self.session.prepare_request(req_or_res)
@@ -60,7 +124,7 @@ class RequestsExecutor(Executor):
                 self.request = self._result.request
             self._merge_session_data_to_prepared_request()
 
-        self._input = Curler().to_curl(self.request)
+        self._input: LazyCurl = LazyCurl(self.request)
 
     def _merge_session_data_to_prepared_request(self):
         log.debug("Merging session.headers into PreparedRequest object")
@@ -76,6 +140,57 @@ class RequestsExecutor(Executor):
             )
             self.request.headers["Cookie"] = req_cookies + session_cookies
 
+    def _get_timeout(self) -> float | tuple[float, float]:
+        """Returns the request timeout reduced to the time limit of the attempt."""
+        if self._time_limit is None:
+            return self.timeout
+        time_limit = max(self._time_limit, 0.001)
+        if isinstance(self.timeout, tuple):
+            return min(self.timeout[0], time_limit), min(self.timeout[1], time_limit)
+        return min(self.timeout, time_limit)
+
+    def _prepare_conditional_request(self) -> PreparedRequest:
+        """Returns the request with validators of the last response, if any."""
+        if not self._validators:
+            return self.request
+        request = self.request.copy()
+        request.headers.update(self._validators)
+        return request
+
+    def _remember_validators(self, response: Response) -> None:
+        self._validators = {
+            header: response.headers[validator]
+            for validator, header in VALIDATORS.items()
+            if validator in response.headers
+        }
+
+    def _is_not_modified(self, response: Response) -> bool:
+        return (
+            response.status_code == 304
+            and self._result is not None
+            and bool(self._validators)
+        )
+
+    def _has_headers_checkers(self) -> bool:
+        manager = self.conditions_manager
+        return any(
+            isinstance(checker, HeadersChecker)
+            for checkers in (
+                manager.exception_conditions,
+                manager.pre_conditions,
+                manager.main_conditions,
+            )
+            for checker in checkers
+        )
+
+    def _get_digest(self, response: Response) -> int:
+        """Returns the digest of the status code and body. Headers are included, if
+        any HeadersChecker reads them."""
+        if self._has_headers_checkers():
+            headers = frozenset(response.headers.lower_items())
+            return hash((response.status_code, response.content, headers))
+        return hash((response.status_code, response.content))
+
     def is_condition_met(self) -> bool:
         """Sends the request and check if all checkers pass or timeout occurs.
 
@@ -86,21 +201,86 @@ class RequestsExecutor(Executor):
             ExecutorIsNotReady: If the executor is not ready to send the request."""
         run_uuid: str = str(uuid.uuid4())
         if not self._take_from_result:
+            request = self.request
+            if self.conditional:
+                request = self._prepare_conditional_request()
+            options: dict[str, Any] = {"stream": True} if self.stream else {}
             try:
-                self._result = self.session.send(
-                    request=self.request, timeout=self.timeout
+                response = self.session.send(
+                    request=request, timeout=self._get_timeout(), **options
                 )
-                self._input = Curler().to_curl(self._result)
+                self._input.source = response
                 log.debug("Sent: %s", self._input)
             except RequestException:
                 log.exception("RequestException! CURL: %s", self._input)
                 return False
+            if self.conditional and self._is_not_modified(response):
+                log.info("Resource has not been modified. Reusing the last verdicts")
+                return self._reuse_verdicts()
+            self._result = response
         else:
             self._take_from_result = False
 
-        self._failed_checkers = self.conditions_manager.check_all(
-            result=self._result, check_uuid=run_uuid
-        )
-        if len(self._failed_checkers) == 0:
-            return True
-        return False
+        try:
+            return self._check_response(
+                self._result, run_uuid  # type: ignore[arg-type]
+            )
+        except RequestException:
+            log.exception(
+                "RequestException while reading the body! CURL: %s", self._input
+            )
+            self._result.close()  # type: ignore[union-attr]
+            return False
+
+    def _check_response(self, response: Response, run_uuid: str) -> bool:
+        if self.conditional:
+            self._remember_validators(response)
+
+        digest = None
+        if self.skip_unchanged_body:
+            digest = self._get_digest(response)
+            if digest == self._digest:
+                log.info("Response has not changed. Reusing the last verdicts")
+                return self._reuse_verdicts()
+
+        context = ResponseContext(response, self.json_decoder)
+        condition_met = False
+        try:
+            self._failed_checkers = self._evaluate(context, run_uuid)
+            condition_met = len(self._failed_checkers) == 0
+        finally:
+            if self.stream:
+                self._release_body(context, condition_met)
+        self._digest = digest
+        return condition_met
+
+    def _reuse_verdicts(self) -> bool:
+        if self.conditions_manager.full_evaluation:
+            self.evaluate_fully()
+        return len(self._failed_checkers) == 0
+
+    def _evaluate(self, result: Any, run_uuid: str) -> list[Checker]:
+        if not isinstance(result, ResponseContext):
+            result = ResponseContext(result, self.json_decoder)
+        return self.conditions_manager.check_all(result=result, check_uuid=run_uuid)
+
+    def evaluate_fully(self):
+        """Checks the last response again with all checkers, if its last evaluation
+        has been short-circuited. The discarded body of a rejected streamed response
+        cannot be checked again, so its verdicts are kept."""
+        if self.stream and getattr(self._result, "_content", None) is False:
+            log.info("The body of the last response has been discarded")
+            return self
+        return super().evaluate_fully()
+
+    def _release_body(self, context: ResponseContext, condition_met: bool) -> None:
+        if not context.is_streamed:
+            return
+        if condition_met:
+            context.load_body()
+        elif self.unread_body == "drain":
+            log.debug("Discarding the unread part of the body")
+            context.response.raw.drain_conn()
+        else:
+            log.debug("Closing the connection with the unread part of the body")
+            context.response.close()
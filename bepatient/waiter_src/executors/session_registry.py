@@ -0,0 +1,222 @@
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from time import monotonic
+from typing import Any, Hashable
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+SessionKey = tuple[str, str, Hashable]
+
+
+class _PooledSession(Session):
+    """Session of the registry, which remembers when it has been used last time."""
+
+    def __init__(self, pool_maxsize: int):
+        super().__init__()
+        self.pool_maxsize = pool_maxsize
+        self.last_used = monotonic()
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        self.last_used = monotonic()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self.last_used = monotonic()
+
+
+def _auth_key(auth: Any) -> Hashable:
+    if auth is None or isinstance(auth, tuple):
+        return auth
+    return type(auth).__name__, id(auth)
+
+
+def session_key(request: PreparedRequest | Request | Response) -> SessionKey:
+    """Returns the key of the pooled session for the request: scheme, host and
+    authentication. The Authorization header is kept only as a hash.
+
+    Args:
+        request (PreparedRequest | Request | Response): request or response, whose
+            request is used.
+
+    Returns:
+        SessionKey: tuple of the scheme, host with port and authentication."""
+    if isinstance(request, Response):
+        request = (request.history or [request])[0].request
+    url = urlsplit(request.url or "")
+    if isinstance(request, Request):
+        auth = _auth_key(request.auth)
+    else:
+        authorization = request.headers.get("Authorization")
+        auth = None if authorization is None else hash(authorization)
+    return url.scheme.lower(), url.netloc.lower(), auth
+
+
+class SessionRegistry:
+    """Thread-safe registry of Session objects shared by waiters, which have not got
+    their own session. Waiters sending requests to the same scheme, host and with
+    the same authentication reuse one session, so keep-alive connections of its
+    pool are reused instead of opening a new TCP/TLS connection for each waiter.
+
+    Pooled sessions do not store cookies, so they never leak between waiters. Pass
+    your own Session to the waiter, if the polled endpoint relies on cookies.
+
+    Args:
+        pool_connections (int, optional): number of connection pools (hosts) cached
+            by the adapter of each session. Defaults to 10.
+        pool_maxsize (int, optional): maximal number of connections kept in the pool
+            of each host. Defaults to 10.
+        max_idle (float | None, optional): sessions neither requested nor used to
+            send a request for longer than `max_idle` seconds are closed and removed
+            from the registry. None keeps them forever. Defaults to 60.
+
+    Example:
+        ```
+            registry = SessionRegistry(pool_maxsize=20, max_idle=30)
+            session = registry.get_session(request)
+        ```"""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_idle: float | None = 60,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_idle = max_idle
+        self._sessions: dict[SessionKey, _PooledSession] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _create_session(self, pool_maxsize: int) -> _PooledSession:
+        session = _PooledSession(pool_maxsize)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._mount_adapter(session, pool_maxsize)
+        return session
+
+    def _mount_adapter(self, session: Session, pool_maxsize: int) -> None:
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def get_session(
+        self,
+        request: PreparedRequest | Request | Response,
+        pool_maxsize: int | None = None,
+    ) -> Session:
+        """Returns the pooled session for the request, creating it if needed.
+
+        Args:
+            request (PreparedRequest | Request | Response): request or response to
+                monitor.
+            pool_maxsize (int | None, optional): minimal size of the connection pool,
+                e.g. the number of waiters running at the same time. The pool of the
+                existing session is enlarged, if it is smaller. Defaults to None.
+
+        Returns:
+            Session: session shared by all waiters with the same key."""
+        key = session_key(request)
+        pool_maxsize = max(pool_maxsize or 0, self.pool_maxsize)
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(key)
+            if session is None:
+                log.debug("Creating a new pooled Session object for %s://%s", *key[:2])
+                session = self._create_session(pool_maxsize)
+                self._sessions[key] = session
+            elif session.pool_maxsize < pool_maxsize:
+                log.debug("Enlarging the connection pool to %s", pool_maxsize)
+                self._mount_adapter(session, pool_maxsize)
+                session.pool_maxsize = pool_maxsize
+            session.last_used = monotonic()
+            return session
+
+    def _evict_idle(self) -> int:
+        if self.max_idle is None:
+            return 0
+        deadline = monotonic() - self.max_idle
+        idle = [
+            key
+            for key, session in self._sessions.items()
+            if session.last_used < deadline
+        ]
+        for key in idle:
+            log.debug("Closing the idle pooled Session object for %s://%s", *key[:2])
+            # waiters still using the session open new connections, if needed
+            self._sessions.pop(key).close()
+        return len(idle)
+
+    def evict_idle(self) -> int:
+        """Closes sessions not used for longer than `max_idle` seconds.
+
+        Returns:
+            int: number of closed sessions."""
+        with self._lock:
+            return self._evict_idle()
+
+    def clear(self) -> None:
+        """Closes and removes all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def configure(
+        self,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        max_idle: float | None = None,
+    ) -> None:
+        """Changes the settings of the registry. Existing sessions are closed, so the
+        new pool sizes are used by all waiters created afterwards.
+
+        Args:
+            pool_connections (int | None, optional): number of connection pools
+                cached by each session. Defaults to None (unchanged).
+            pool_maxsize (int | None, optional): maximal number of connections kept
+                in the pool of each host. Defaults to None (unchanged).
+            max_idle (float | None, optional): idle time in seconds, after which
+                sessions are closed. Defaults to None (unchanged)."""
+        self.clear()
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if max_idle is not None:
+                self.max_idle = max_idle
+
+
+session_registry = SessionRegistry()
+
+
+def configure_session_pool(
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    max_idle: float | None = None,
+) -> None:
+    """Configures pooled sessions used by waiters, which have not got their own
+    Session. Existing pooled sessions are closed.
+
+    Args:
+        pool_connections (int | None, optional): number of connection pools cached by
+            each session. Defaults to None (unchanged).
+        pool_maxsize (int | None, optional): maximal number of connections kept in
+            the pool of each host. Defaults to None (unchanged).
+        max_idle (float | None, optional): idle time in seconds, after which sessions
+            are closed. Defaults to None (unchanged).
+
+    Example:
+        ```
+            configure_session_pool(pool_maxsize=50, max_idle=120)
+        ```"""
+    session_registry.configure(pool_connections, pool_maxsize, max_idle)
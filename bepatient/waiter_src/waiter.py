@@ -1,34 +1,157 @@
+import asyncio
 import logging
-from time import sleep
+from time import monotonic, sleep
 
+from bepatient.waiter_src.delays import Delay, to_delay_policy
 from bepatient.waiter_src.exceptions import WaiterConditionWasNotMet
+from bepatient.waiter_src.executors.async_executor import AsyncExecutor
 from bepatient.waiter_src.executors.executor import Executor
 
 log = logging.getLogger(__name__)
 
 
+class _Schedule:
+    """Computes delays between attempts. With the total timeout, attempts are
+    scheduled on the monotonic clock and the time spent on them is subtracted from
+    the next delay."""
+
+    def __init__(self, delay: Delay, total_timeout: float | None):
+        self.delay_policy = to_delay_policy(delay)
+        self.delay_policy.reset()
+        self.deadline = None if total_timeout is None else monotonic() + total_timeout
+        self._next_attempt = monotonic()
+
+    def time_left(self) -> float | None:
+        """Returns the remaining time in seconds or None without the deadline."""
+        if self.deadline is None:
+            return None
+        return self.deadline - monotonic()
+
+    def next_delay(self, attempt: int) -> float | None:
+        """Returns the delay after the given attempt, or None if the next attempt
+        would start after the deadline."""
+        waiting_time = self.delay_policy.get_delay(attempt)
+        if self.deadline is None:
+            return waiting_time
+        self._next_attempt = max(self._next_attempt + waiting_time, monotonic())
+        if self._next_attempt >= self.deadline:
+            log.info("The deadline has been reached")
+            return None
+        return max(self._next_attempt - monotonic(), 0)
+
+
 def wait_for_executor(
-    executor: Executor, retries: int, delay: int, raise_error: bool = True
-) -> None:
+    executor: Executor,
+    retries: int,
+    delay: Delay,
+    raise_error: bool = True,
+    waiting_times: list[float] | None = None,
+    total_timeout: float | None = None,
+) -> list[float]:
     """Wait for the given executor to meet its condition.
 
     Args:
         executor (Executor): The executor to wait for.
         retries (int): The number of times to retry the operation.
-        delay (int): The delay in seconds between retries.
+        delay (float | DelayPolicy): The delay in seconds between retries or the
+            policy computing it.
         raise_error (bool): raises WaiterConditionWasNotMet
+        waiting_times (list[float] | None, optional): list to which the actual
+            waiting time after each failed attempt is appended. Defaults to None.
+        total_timeout (float | None, optional): maximal duration of the whole wait in
+            seconds. If set, attempts are scheduled on the monotonic clock: the time
+            spent on the attempt is subtracted from the next delay and the executor
+            is not allowed to exceed the remaining time. The wait ends when the
+            retries are exhausted or the deadline is reached, whichever comes first.
+            Defaults to None.
+
+    Returns:
+        list[float]: actual waiting times after each failed attempt in seconds.
+
+    Raises:
+        WaiterConditionWasNotMet: if the condition is not met within the specified
+            number of attempts."""
+    if waiting_times is None:
+        waiting_times = []
+    schedule = _Schedule(delay, total_timeout)
+    executor.reset_latches()
+
+    try:
+        for attempt in range(1, retries + 1):
+            log.info(
+                "Checking whether the condition has been met. The %s approach", attempt
+            )
+            if schedule.deadline is not None:
+                executor.set_time_limit(schedule.time_left())
+            executor.set_final_attempt(attempt == retries)
+            if executor.is_condition_met():
+                log.info("Condition met!")
+                return waiting_times
+
+            waiting_time = schedule.next_delay(attempt)
+            if waiting_time is None:
+                break
+            log.info("The condition has not been met. Waiting time: %s", waiting_time)
+            sleep_start = monotonic()
+            sleep(waiting_time)
+            waiting_times.append(monotonic() - sleep_start)
+    finally:
+        executor.set_final_attempt(False)
+        if schedule.deadline is not None:
+            executor.set_time_limit(None)
+
+    if raise_error:
+        executor.evaluate_fully()
+        raise WaiterConditionWasNotMet(executor.error_message())
+    return waiting_times
+
+
+async def wait_for_executor_async(
+    executor: AsyncExecutor,
+    retries: int,
+    delay: Delay,
+    raise_error: bool = True,
+    waiting_times: list[float] | None = None,
+    total_timeout: float | None = None,
+) -> list[float]:
+    """Asynchronous version of `wait_for_executor`. Waits for the given executor to
+    meet its condition without blocking the event loop, so many waits can share one
+    loop. Arguments and returned value are the same as in `wait_for_executor`.
 
     Raises:
         WaiterConditionWasNotMet: if the condition is not met within the specified
             number of attempts."""
-    for attempt in range(retries):
-        log.info(
-            "Checking whether the condition has been met. The %s approach", attempt + 1
-        )
-        if executor.is_condition_met():
-            log.info("Condition met!")
-            return
-        log.info("The condition has not been met. Waiting time: %s", delay)
-        sleep(delay)
+    if waiting_times is None:
+        waiting_times = []
+    schedule = _Schedule(delay, total_timeout)
+    executor.reset_latches()
+
+    try:
+        for attempt in range(1, retries + 1):
+            log.info(
+                "Checking whether the condition has been met. The %s approach", attempt
+            )
+            if schedule.deadline is not None:
+                executor.set_time_limit(schedule.time_left())
+            executor.set_final_attempt(attempt == retries)
+            if await executor.is_condition_met_async():
+                log.info("Condition met!")
+                return waiting_times
+
+            waiting_time = schedule.next_delay(attempt)
+            if waiting_time is None:
+                break
+            log.info("The condition has not been met. Waiting time: %s", waiting_time)
+            sleep_start = monotonic()
+            await asyncio.sleep(waiting_time)
+            waiting_times.append(monotonic() - sleep_start)
+    finally:
+        executor.set_final_attempt(False)
+        if schedule.deadline is not None:
+            executor.set_time_limit(None)
+        await executor.aclose()
+
     if raise_error:
+        executor.evaluate_fully()
         raise WaiterConditionWasNotMet(executor.error_message())
+    return waiting_times
@@ -0,0 +1,250 @@
+import copy
+import heapq
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic, sleep
+from typing import Iterable, Literal, NamedTuple
+
+from bepatient.waiter_src.delays import Delay, DelayPolicy, to_delay_policy
+from bepatient.waiter_src.exceptions import (
+    BePatientException,
+    ExecutorIsNotReady,
+    WaiterConditionWasNotMet,
+)
+from bepatient.waiter_src.executors.executor import Executor
+
+log = logging.getLogger(__name__)
+
+
+class GroupResult(NamedTuple):
+    """Outcome of a single executor from the WaiterGroup.
+
+    Attributes:
+        executor (Executor): the executor.
+        condition_met (bool): whether the condition has been met.
+        attempts (int): number of performed attempts.
+        error (Exception | None): exception raised by the executor, if any."""
+
+    executor: Executor
+    condition_met: bool
+    attempts: int
+    error: Exception | None
+
+
+class _Entry:
+    def __init__(self, index: int, executor: Executor, delay_policy: DelayPolicy):
+        self.index = index
+        self.executor = executor
+        self.delay_policy = delay_policy
+        self.attempts = 0
+        self.condition_met = False
+        self.finished = False
+        self.error: Exception | None = None
+
+    def to_result(self) -> GroupResult:
+        return GroupResult(self.executor, self.condition_met, self.attempts, self.error)
+
+
+class _GroupRun:
+    """State of a single WaiterGroup run."""
+
+    def __init__(
+        self,
+        executors: list[Executor],
+        delay: Delay,
+        retries: int,
+        max_workers: int,
+        total_timeout: float | None,
+    ):
+        delay_policy = to_delay_policy(delay)
+        self.entries = []
+        for index, executor in enumerate(executors):
+            # every executor gets its own copy, as the policy may keep a state
+            entry = _Entry(index, executor, copy.deepcopy(delay_policy))
+            executor.reset_latches()
+            entry.delay_policy.reset()
+            self.entries.append(entry)
+        self.retries = retries
+        self.max_workers = max_workers
+        now = monotonic()
+        self.deadline = None if total_timeout is None else now + total_timeout
+        self.queue = [(now, entry.index) for entry in self.entries]
+        self.in_flight: dict[Future[bool], _Entry] = {}
+
+    def is_pending(self, required: int) -> bool:
+        met = sum(entry.condition_met for entry in self.entries)
+        possible = met + sum(not entry.finished for entry in self.entries)
+        return met < required <= possible and (
+            self.deadline is None or monotonic() < self.deadline
+        )
+
+    def submit_due(self, pool: ThreadPoolExecutor) -> None:
+        """Starts the attempts of all executors that are due."""
+        now = monotonic()
+        while (
+            self.queue
+            and self.queue[0][0] <= now
+            and len(self.in_flight) < self.max_workers
+        ):
+            entry = self.entries[heapq.heappop(self.queue)[1]]
+            if self.deadline is not None:
+                entry.executor.set_time_limit(self.deadline - now)
+            entry.attempts += 1
+            entry.executor.set_final_attempt(entry.attempts == self.retries)
+            self.in_flight[pool.submit(entry.executor.is_condition_met)] = entry
+
+    def wait_for_attempts(self) -> None:
+        """Waits until any attempt finishes or the next executor is due."""
+        timeouts = []
+        if self.queue and len(self.in_flight) < self.max_workers:
+            timeouts.append(self.queue[0][0] - monotonic())
+        if self.deadline is not None:
+            timeouts.append(self.deadline - monotonic())
+        timeout = max(min(timeouts), 0) if timeouts else None
+
+        if not self.in_flight:
+            sleep(timeout or 0)
+            return
+        done, _ = wait(self.in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            self.finish_attempt(self.in_flight.pop(future), future)
+
+    def finish_attempt(self, entry: _Entry, future: Future[bool]) -> None:
+        try:
+            entry.condition_met = future.result()
+        except BePatientException as exc:
+            log.exception("Executor has raised an exception")
+            entry.error = exc
+            entry.finished = True
+            return
+        if entry.condition_met or entry.attempts >= self.retries:
+            entry.finished = True
+            return
+        next_attempt = monotonic() + entry.delay_policy.get_delay(entry.attempts)
+        heapq.heappush(self.queue, (next_attempt, entry.index))
+
+
+class WaiterGroup:
+    """Waits for many executors at the same time. A single scheduling thread keeps
+    a heap of next-due times and fires only the executors that are due, on a bounded
+    pool of worker threads. Threads are never blocked by sleeping between attempts.
+
+    Args:
+        executors (Iterable[Executor] | None, optional): executors to wait for.
+            Defaults to None.
+        max_workers (int, optional): maximal number of attempts performed at the
+            same time. Defaults to 10.
+
+    Example:
+        To wait until at least 450 of 500 created resources are ready:
+        ```
+            group = WaiterGroup(max_workers=20)
+            for request in requests:
+                group.add_executor(
+                    RequestsWaiter(request, session=session)
+                    .add_checker("ready", "is_equal", dict_path="status")
+                    .executor
+                )
+            results = group.run(retries=30, delay=ExponentialDelay(1), until=450)
+        ```"""
+
+    def __init__(
+        self, executors: Iterable[Executor] | None = None, max_workers: int = 10
+    ):
+        self.executors: list[Executor] = list(executors or [])
+        self.max_workers = max_workers
+
+    def add_executor(self, executor: Executor):
+        """Adds the executor to the group.
+
+        Returns:
+            self: updated WaiterGroup instance."""
+        self.executors.append(executor)
+        return self
+
+    def _required(self, until: Literal["all", "any"] | int) -> int:
+        match until:
+            case "all":
+                return len(self.executors)
+            case "any":
+                return min(1, len(self.executors))
+            case int() if 0 <= until <= len(self.executors):
+                return until
+            case _:
+                raise ValueError(
+                    "You have to choose between 'all', 'any' and the number of"
+                    f" executors from 0 to {len(self.executors)}!"
+                )
+
+    def run(
+        self,
+        retries: int = 60,
+        delay: Delay = 1,
+        until: Literal["all", "any"] | int = "all",
+        raise_error: bool = True,
+        total_timeout: float | None = None,
+    ) -> list[GroupResult]:
+        """Run all executors until the required number of them meets its condition.
+
+        Args:
+            retries (int, optional): The number of retries to perform by every
+                executor. Defaults to 60.
+            delay (float | DelayPolicy, optional): The delay between retries of
+                a single executor in seconds or the policy computing it. Every
+                executor gets its own copy of the policy. Defaults to 1.
+            until ("all" | "any" | int, optional): how many executors have to meet
+                their conditions. Defaults to "all".
+            raise_error (bool): raises WaiterConditionWasNotMet.
+            total_timeout (float | None, optional): maximal duration of the whole
+                wait in seconds. Defaults to None.
+
+        Returns:
+            list[GroupResult]: outcome of every executor, in the order of adding.
+
+        Raises:
+            WaiterConditionWasNotMet: if the required number of executors has not
+                met their conditions."""
+        required = self._required(until)
+        group_run = _GroupRun(
+            self.executors, delay, retries, self.max_workers, total_timeout
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while group_run.is_pending(required):
+                group_run.submit_due(pool)
+                group_run.wait_for_attempts()
+            for future in group_run.in_flight:
+                future.cancel()
+
+        for executor in self.executors:
+            executor.set_final_attempt(False)
+            if group_run.deadline is not None:
+                executor.set_time_limit(None)
+        results = [entry.to_result() for entry in group_run.entries]
+        met = sum(result.condition_met for result in results)
+        log.info("Conditions met by %s of %s executors", met, len(results))
+        if raise_error and met < required:
+            for result in results:
+                if not result.condition_met and result.error is None:
+                    result.executor.evaluate_fully()
+            raise WaiterConditionWasNotMet(self._error_message(results, required))
+        return results
+
+    @staticmethod
+    def _error_message(results: list[GroupResult], required: int) -> str:
+        met = sum(result.condition_met for result in results)
+        messages = []
+        for index, result in enumerate(results):
+            if result.condition_met:
+                continue
+            if result.error is not None:
+                messages.append(f"{index}: {result.error}")
+            else:
+                try:
+                    messages.append(f"{index}: {result.executor.error_message()}")
+                except ExecutorIsNotReady as exc:
+                    messages.append(f"{index}: {exc}")
+        return (
+            f"Conditions were met by {met} of {len(results)} executors,"
+            f" required: {required}. | " + " | ".join(messages)
+        )
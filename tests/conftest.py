@@ -1,5 +1,6 @@
 # pylint: disable=redefined-outer-name
 import json
+from io import BytesIO
 from typing import Any, Callable
 
 import pytest
@@ -7,8 +8,17 @@ from pytest_mock import MockerFixture
 from requests import PreparedRequest, Request, Response, Session
 from requests.models import CaseInsensitiveDict
 from responses import RequestsMock
+from urllib3 import HTTPResponse
 
 from bepatient import Checker
+from bepatient.waiter_src.executors.session_registry import session_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_session_registry():  # type: ignore
+    """Pooled sessions are not shared between tests."""
+    yield
+    session_registry.clear()
 
 
 @pytest.fixture
@@ -159,3 +169,16 @@ def checker_false(
     checker_mocker: type[Checker], is_equal_comparer: Callable[[Any, Any], bool]
 ) -> Checker:
     return checker_mocker(comparer=is_equal_comparer, expected_value="TEST")
+
+
+@pytest.fixture
+def streamed_content() -> bytes:
+    return json.dumps({"status": "done", "results": ["x" * 1000] * 1000}).encode()
+
+
+@pytest.fixture
+def streamed_response(streamed_content: bytes) -> Response:
+    res = Response()
+    res.status_code = 200
+    res.raw = HTTPResponse(body=BytesIO(streamed_content), preload_content=False)
+    return res
@@ -1,7 +1,9 @@
+import asyncio
 import json
 from typing import Any
 from uuid import uuid4
 
+import httpx
 import pytest
 from _pytest.logging import LogCaptureFixture
 from pytest_mock import MockerFixture
@@ -9,7 +11,9 @@ from requests import PreparedRequest, Request, Response, Session
 from responses import RequestsMock
 
 from bepatient import (
+    AsyncRequestsWaiter,
     Checker,
+    LinearDelay,
     RequestsWaiter,
     delete_none_values_from_dict,
     dict_differences,
@@ -19,6 +23,7 @@ from bepatient import (
     to_curl,
     wait_for_value_in_request,
     wait_for_values_in_request,
+    wait_for_values_in_requests,
 )
 from bepatient.waiter_src.checkers.response_checkers import (
     HeadersChecker,
@@ -70,36 +75,43 @@ class TestRequestsWaiter:
         )
 
         conditions_manager = waiter.executor.conditions_manager
+        assert [type(checker) for checker in conditions_manager.pre_conditions] == [
+            StatusCodeChecker,
+            JsonChecker,
+        ]
+        assert isinstance(conditions_manager.main_conditions[0], HeadersChecker)
         assert (
-            conditions_manager.main_conditions[0].__dict__
+            conditions_manager.main_conditions[0]._public_attributes()
             == HeadersChecker(
                 comparer=is_equal,
                 expected_value="TEST_1",
                 dict_path="dict",
                 search_query="search",
-            ).__dict__
+            )._public_attributes()
         )
         assert (
-            conditions_manager.exception_conditions[0].__dict__
+            conditions_manager.exception_conditions[0]._public_attributes()
             == JsonChecker(
                 comparer=is_not_equal,
                 expected_value="TEST_2",
                 dict_path="dict_2",
                 search_query="search_2",
-            ).__dict__
+            )._public_attributes()
         )
         assert (
-            conditions_manager.pre_conditions[0].__dict__
-            == StatusCodeChecker(comparer=is_equal, expected_value=200).__dict__
+            conditions_manager.pre_conditions[0]._public_attributes()
+            == StatusCodeChecker(
+                comparer=is_equal, expected_value=200
+            )._public_attributes()
         )
         assert (
-            conditions_manager.pre_conditions[1].__dict__
+            conditions_manager.pre_conditions[1]._public_attributes()
             == JsonChecker(
                 comparer=is_equal,
                 expected_value="TEST_3",
                 dict_path="dict_3",
                 search_query="search_3",
-            ).__dict__
+            )._public_attributes()
         )
 
     def test_happy_path_prepared_request(
@@ -114,6 +126,18 @@ class TestRequestsWaiter:
 
         assert response == example_response
 
+    def test_waiting_times(
+        self,
+        prepared_request: PreparedRequest,
+        session_mock: Session,
+    ):
+        waiter = RequestsWaiter(request=prepared_request, session=session_mock)
+        waiter.add_checker(expected_value=False, comparer="is_equal", dict_path="ok")
+        waiter.run(retries=3, delay=LinearDelay(0, 0.01), raise_error=False)
+
+        assert len(waiter.waiting_times) == 3
+        assert waiter.waiting_times[2] >= 0.02
+
     def test_happy_path_request(
         self,
         mocked_responses: RequestsMock,
@@ -335,7 +359,8 @@ class TestRequestsWaiter:
             "The condition has not been met!"
             " | Failed checkers: (Checker: HeadersChecker | Comparer: is_equal"
             " | Dictor_fallback: None | Expected_value: WebLudus.pl"
-            " | Ignore_case: False | Path: Server | Search_query: None | Data: None)"
+            " | Header_type: None | Ignore_case: False"
+            " | Path: Server | Search_query: None | Data: None)"
             " | curl -X GET -H 'task: test' -H 'Cookie: user-token=abc-123;"
             " pytest=fixture' -H 'Content-Type: application/json' -H 'Accept-Language:"
             " en-US,en;' -H 'Host: webludus.pl' -H 'User-Agent: Mozilla/5.0"
@@ -433,7 +458,12 @@ class TestRequestsWaiter:
             (
                 "bepatient.waiter_src.executors.requests_executor",
                 10,
-                "Creating a new Session object",
+                "Using the pooled Session object",
+            ),
+            (
+                "bepatient.waiter_src.executors.session_registry",
+                10,
+                "Creating a new pooled Session object for https://webludus.pl",
             ),
             (
                 "bepatient.waiter_src.waiter",
@@ -469,7 +499,8 @@ class TestRequestsWaiter:
                 10,
                 "Check uuid: TEST1 | Checker: HeadersChecker | Comparer: is_equal"
                 " | Dictor_fallback: None | Expected_value: WebLudus.pl"
-                " | Ignore_case: False | Path: Server | Search_query: None"
+                " | Header_type: None | Ignore_case: False"
+                " | Path: Server | Search_query: None"
                 " | Data: WebLudus.pl",
             ),
             (
@@ -488,7 +519,8 @@ class TestRequestsWaiter:
                 20,
                 "Check uuid: TEST1 | Condition not met | Checker: HeadersChecker"
                 " | Comparer: is_equal | Dictor_fallback: None"
-                " | Expected_value: WebLudus.pl | Ignore_case: False | Path: Server"
+                " | Expected_value: WebLudus.pl"
+                " | Header_type: None | Ignore_case: False | Path: Server"
                 " | Search_query: None | Data: WebLudus.pl",
             ),
             (
@@ -533,7 +565,8 @@ class TestRequestsWaiter:
                 10,
                 "Check uuid: TEST2 | Checker: HeadersChecker | Comparer: is_equal"
                 " | Dictor_fallback: None | Expected_value: WebLudus.pl"
-                " | Ignore_case: False | Path: Server | Search_query: None"
+                " | Header_type: None | Ignore_case: False"
+                " | Path: Server | Search_query: None"
                 " | Data: WebLudus.pl",
             ),
             (
@@ -554,7 +587,8 @@ class TestRequestsWaiter:
                 20,
                 "Check success! | uuid: TEST2 | Checker: HeadersChecker"
                 " | Comparer: is_equal | Dictor_fallback: None"
-                " | Expected_value: WebLudus.pl | Ignore_case: False | Path: Server"
+                " | Expected_value: WebLudus.pl"
+                " | Header_type: None | Ignore_case: False | Path: Server"
                 " | Search_query: None | Data: WebLudus.pl",
             ),
             ("bepatient.waiter_src.waiter", 20, "Condition met!"),
@@ -573,6 +607,43 @@ class TestRequestsWaiter:
         assert caplog.record_tuples == logs
 
 
+class TestAsyncRequestsWaiter:
+    def test_happy_path(self, example_dict_content: dict[str, Any]):
+        responses = [
+            httpx.Response(404),
+            httpx.Response(200, json={"name": "Mike"}),
+            httpx.Response(200, json=example_dict_content),
+        ]
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        waiter = AsyncRequestsWaiter(
+            request=httpx.Request("GET", "https://webludus.pl"), client=client
+        )
+        waiter.add_checker(expected_value="Jack", comparer="is_equal", dict_path="name")
+
+        response = asyncio.run(waiter.run(retries=3, delay=0)).get_result()
+
+        assert response.json() == example_dict_content
+        assert len(waiter.waiting_times) == 2
+
+    def test_condition_not_met_raise_error(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+        waiter = AsyncRequestsWaiter(
+            request=httpx.Request("GET", "https://webludus.pl"), client=client
+        ).add_checker(
+            expected_value="WebLudus.pl",
+            comparer="is_equal",
+            checker="headers_checker",
+            dict_path="Server",
+        )
+
+        with pytest.raises(WaiterConditionWasNotMet, match="HeadersChecker"):
+            asyncio.run(waiter.run(retries=2, delay=0))
+
+
 class TestWaitForValueInRequests:
     def test_happy_path(
         self,
@@ -607,6 +678,27 @@ class TestWaitForValueInRequests:
                 retries=1,
             )
 
+    def test_body_checker(
+        self,
+        mocker: MockerFixture,
+        prepared_request: PreparedRequest,
+        session_mock: Session,
+        example_response: Response,
+    ):
+        json_spy = mocker.spy(example_response, "json")
+
+        result = wait_for_value_in_request(
+            request=prepared_request,
+            session=session_mock,
+            checker="body_checker",
+            comparer="contain",
+            expected_value='"name": "Jack"',
+            retries=1,
+        )
+
+        assert result == example_response
+        json_spy.assert_not_called()
+
 
 class TestWaitForValuesInRequests:
     def test_happy_path(
@@ -677,6 +769,134 @@ class TestWaitForValuesInRequests:
             )
 
 
+class TestWaitForValuesInRequestsBatch:
+    checkers = [
+        {
+            "checker": "json_checker",
+            "comparer": "is_equal",
+            "expected_value": "done",
+            "dict_path": "status",
+        }
+    ]
+
+    def test_request_template(self, mocked_responses: RequestsMock):
+        for job_id in range(5):
+            mocked_responses.get(
+                f"https://webludus.pl/jobs/{job_id}", json={"status": "pending"}
+            )
+            mocked_responses.get(
+                f"https://webludus.pl/jobs/{job_id}",
+                json={"status": "done", "id": job_id},
+            )
+
+        responses = wait_for_values_in_requests(
+            requests=Request("get", "https://webludus.pl"),
+            params=[{"url": f"https://webludus.pl/jobs/{i}"} for i in range(5)],
+            checkers=self.checkers,
+            retries=2,
+            delay=0,
+            max_workers=3,
+        )
+
+        assert all(isinstance(response, Response) for response in responses)
+        assert [
+            response.json()["id"] for response in responses  # type: ignore[union-attr]
+        ] == [0, 1, 2, 3, 4]
+
+    def test_failures_are_gathered(self, mocked_responses: RequestsMock):
+        mocked_responses.get("https://webludus.pl/1", json={"status": "done"})
+        mocked_responses.get("https://webludus.pl/2", json={"status": "pending"})
+        mocked_responses.get("https://webludus.pl/3", json={"status": "done"})
+        requests = [
+            Request("get", f"https://webludus.pl/{number}") for number in range(1, 4)
+        ]
+
+        results = wait_for_values_in_requests(
+            requests=requests,  # type: ignore[arg-type]
+            checkers=self.checkers,
+            retries=1,
+            delay=0,
+            raise_error=False,
+        )
+
+        assert isinstance(results[0], Response)
+        assert isinstance(results[1], WaiterConditionWasNotMet)
+        assert isinstance(results[2], Response)
+        assert mocked_responses.assert_call_count("https://webludus.pl/3", 1)
+
+    def test_raise_error_after_all_requests(
+        self, mocked_responses: RequestsMock, mocker: MockerFixture
+    ):
+        mocked_responses.get("https://webludus.pl/1", json={"status": "pending"})
+        mocked_responses.get("https://webludus.pl/2", json={"status": "done"})
+        mocker.patch("bepatient.api.as_completed", side_effect=reversed)
+
+        with pytest.raises(
+            WaiterConditionWasNotMet,
+            match=r"Conditions were not met for 1 of 2 requests \| 0: ",
+        ):
+            wait_for_values_in_requests(
+                requests=Request("get", "https://webludus.pl"),
+                params=[
+                    {"url": "https://webludus.pl/1"},
+                    {"url": "https://webludus.pl/2"},
+                ],
+                checkers=self.checkers,
+                retries=1,
+                delay=0,
+                ordered=False,
+            )
+        mocked_responses.assert_call_count("https://webludus.pl/2", 1)
+
+    def test_every_waiter_gets_own_delay_policy(self, mocker: MockerFixture):
+        waiter_mock = mocker.patch("bepatient.api.wait_for_values_in_request")
+        delay = LinearDelay(0, 1)
+
+        wait_for_values_in_requests(
+            requests=Request("get", "https://webludus.pl"),
+            params=[{}, {}],
+            checkers=self.checkers,
+            delay=delay,
+        )
+
+        delays = {id(call.kwargs["delay"]) for call in waiter_mock.call_args_list}
+        assert len(delays - {id(delay)}) == 2
+
+    def test_params_require_request_template(self, prepared_request: PreparedRequest):
+        with pytest.raises(ValueError, match="Params can be used only"):
+            wait_for_values_in_requests(
+                requests=[prepared_request], checkers=self.checkers, params=[{}]
+            )
+
+    def test_unknown_request_attribute(self):
+        with pytest.raises(ValueError, match="Request has no attribute: uri"):
+            wait_for_values_in_requests(
+                requests=Request("get", "https://webludus.pl"),
+                checkers=self.checkers,
+                params=[{"uri": "https://webludus.pl"}],
+            )
+
+
+class TestLatchingCheckers:
+    def test_latched_checker_is_skipped(
+        self, mocked_responses: RequestsMock, prepared_request: PreparedRequest
+    ):
+        mocked_responses.get(
+            "https://webludus.pl", json={"id": "abc", "status": "pending"}
+        )
+        mocked_responses.get("https://webludus.pl", json={"status": "done"})
+        waiter = (
+            RequestsWaiter(request=prepared_request)
+            .add_checker(
+                expected_value="abc", comparer="is_equal", dict_path="id", latch=True
+            )
+            .add_checker(expected_value="done", comparer="is_equal", dict_path="status")
+        )
+
+        assert waiter.run(retries=2, delay=0).get_result().json() == {"status": "done"}
+        assert len(waiter.executor.conditions_manager.latching_checkers) == 1
+
+
 def test_dict_differences():
     expected_dict = {
         "Key1": 1,
@@ -1,6 +1,12 @@
+import logging
+
+from _pytest.logging import LogCaptureFixture
+from pytest_mock import MockerFixture
 from requests import PreparedRequest, Response
+from responses import RequestsMock
 
-from bepatient.curler import Curler
+from bepatient.curler import Curler, LazyCurl
+from bepatient.waiter_src.executors.requests_executor import RequestsExecutor
 
 
 class TestRequestCurl:
@@ -101,3 +107,53 @@ class TestRequestCurl:
         )
 
         assert Curler().to_curl(response) == curl
+
+
+class TestLazyCurl:
+    def test_rendered_once(
+        self, prepared_request: PreparedRequest, mocker: MockerFixture
+    ):
+        to_curl_spy = mocker.spy(Curler, "to_curl")
+        curl = LazyCurl(prepared_request)
+
+        to_curl_spy.assert_not_called()
+        assert str(curl) == Curler().to_curl(prepared_request)
+        assert str(curl) == f"{curl}"
+        assert to_curl_spy.call_count == 2
+
+    def test_rendered_again_after_change(self, prepared_request: PreparedRequest):
+        curl = LazyCurl(prepared_request)
+        str(curl)
+        prepared_request.headers["task"] = "changed"
+
+        assert str(curl) == (
+            "curl -X GET -H 'task: changed' -H 'Cookie: user-token=abc-123' "
+            "https://webludus.pl/"
+        )
+
+    def test_response(self, prepared_request: PreparedRequest):
+        prepared_request.headers.update({"content-length": "44"})
+        response = Response()
+        response.request = prepared_request
+
+        assert str(LazyCurl(response)) == (
+            "curl -X GET -H 'task: test' -H 'Cookie: user-token=abc-123'"
+            " https://webludus.pl/"
+        )
+
+    def test_not_rendered_without_log_records(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+    ):
+        caplog.set_level(logging.INFO)
+        mocked_responses.get("https://webludus.pl", json={"status": "ok"})
+        to_curl_spy = mocker.spy(Curler, "to_curl")
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200
+        )
+
+        assert executor.is_condition_met() is True
+        to_curl_spy.assert_not_called()
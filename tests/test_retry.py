@@ -7,6 +7,7 @@ from pytest_mock import MockerFixture
 
 from bepatient import retry
 from bepatient.waiter_src.comparators import Comparator
+from bepatient.waiter_src.delays import ExponentialDelay
 from bepatient.waiter_src.exceptions import WaiterConditionWasNotMet
 
 
@@ -67,3 +68,14 @@ class TestRetry:
 
         mocker.patch("requests.get", side_effect=[AssertionError(), res1, res2])
         assert simple_function() == 200
+
+    def test_delay_policy(self, mocker: MockerFixture):
+        sleep = mocker.patch("bepatient.retry.sleep")
+
+        @retry(3, delay=ExponentialDelay(initial=1))
+        def simple_function(results: list[int]) -> int:
+            return results.pop(0)
+
+        assert simple_function([1, 2, 3]) == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+        assert len(simple_function.waiting_times) == 2  # type: ignore[attr-defined]
@@ -0,0 +1,119 @@
+import logging
+from typing import Any, Callable
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from pytest_mock import MockerFixture
+from requests import Response
+
+from bepatient.waiter_src.checkers.checker import Checker, preview
+from bepatient.waiter_src.checkers.response_checkers import JsonChecker
+from bepatient.waiter_src.comparators import ExpectedItems, contain_all, is_equal
+
+
+class TestPreview:
+    @pytest.mark.parametrize(
+        "data",
+        [None, 1, 1.5, True, "text", {"c": [1, {"b": None}], "a": "d"}, [1, "2"]],
+    )
+    def test_small_data_as_str(self, data: Any):
+        assert preview(data) == str(data)
+
+    def test_long_string_is_capped(self):
+        assert preview("x" * 5000, max_length=10) == "x" * 10 + "..."
+
+    def test_large_document_is_not_rendered_entirely(self):
+        data = {"results": [{"id": i, "name": "x" * 500} for i in range(10_000)]}
+
+        text = preview(data)
+
+        assert len(text) == 1003
+        assert text.startswith("{'results': [{'id': 0, 'name': 'xxx")
+
+
+class TestCheckerDescription:
+    def test_description_is_cached(self, is_equal_comparer: Callable[[Any, Any], bool]):
+        checker = JsonChecker(is_equal_comparer, "done", dict_path="status")
+
+        assert checker.describe() is checker.describe()
+        assert str(checker) == (
+            "Checker: JsonChecker | Comparer: comparer | Dictor_fallback: None"
+            " | Expected_value: done | Ignore_case: False | Path: status"
+            " | Search_query: None | Data: None"
+        )
+
+    def test_description_is_rebuilt_after_change(
+        self, is_equal_comparer: Callable[[Any, Any], bool]
+    ):
+        checker = JsonChecker(is_equal_comparer, "done", dict_path="status")
+        checker.describe()
+        checker.expected_value = "pending"
+
+        assert "Expected_value: pending" in checker.describe()
+
+    def test_nothing_is_rendered_without_log_records(
+        self,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+        checker_true: Checker,
+        example_response: Response,
+    ):
+        caplog.set_level(logging.WARNING)
+        describe_spy = mocker.spy(checker_true, "describe")
+
+        assert checker_true.check(example_response, "UUID") is True
+        describe_spy.assert_not_called()
+
+
+class TestCheckerSlots:
+    def test_built_in_checker_has_no_dict(
+        self, is_equal_comparer: Callable[[Any, Any], bool]
+    ):
+        checker = JsonChecker(is_equal_comparer, "done", dict_path="status")
+
+        assert not hasattr(checker, "__dict__")
+        with pytest.raises(AttributeError):
+            checker.unknown = 1  # type: ignore[attr-defined]
+
+    def test_subclass_without_slots_keeps_its_attributes(
+        self, is_equal_comparer: Callable[[Any, Any], bool]
+    ):
+        class LengthChecker(JsonChecker):
+            def __init__(self, comparer: Callable[[Any, Any], bool], length: int):
+                super().__init__(comparer, length, dict_path="items")
+                self.unit = "items"
+
+        checker = LengthChecker(is_equal_comparer, 3)
+
+        assert checker._public_attributes() == {
+            "comparer": is_equal_comparer,
+            "expected_value": 3,
+            "path": "items",
+            "search_query": None,
+            "dictor_fallback": None,
+            "ignore_case": False,
+            "unit": "items",
+        }
+        assert "Unit: items" in str(checker)
+
+
+class TestPreparedExpectedValue:
+    def test_expected_items_are_prepared_once(self, checker_mocker: type[Checker]):
+        checker = checker_mocker(comparer=contain_all, expected_value=[1, [2], 3])
+        prepared = checker.prepare_expected_value()
+
+        assert isinstance(prepared, ExpectedItems)
+        assert prepared.hashable == {1, 3}
+        assert prepared.unhashable == [[2]]
+        assert checker.prepare_expected_value() is prepared
+
+        checker.expected_value = [4]
+        assert list(checker.prepare_expected_value()) == [4]
+
+    def test_other_comparers_get_expected_value(self, checker_mocker: type[Checker]):
+        checker = checker_mocker(comparer=contain_all, expected_value="Ok")
+
+        assert checker.prepare_expected_value() == "Ok"
+        checker.comparer = is_equal
+        checker.expected_value = [1, 2]
+        assert checker.prepare_expected_value() == [1, 2]
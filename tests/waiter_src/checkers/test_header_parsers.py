@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from bepatient.waiter_src.checkers.header_parsers import (
+    parse_cache_control,
+    parse_date,
+    parse_int,
+    parse_list,
+    parse_retry_after,
+)
+
+
+def test_parse_int():
+    assert parse_int(" 42 ") == 42
+    with pytest.raises(ValueError):
+        parse_int("42 bytes")
+
+
+def test_parse_list():
+    assert parse_list("GET, HEAD,  OPTIONS") == ["GET", "HEAD", "OPTIONS"]
+
+
+def test_parse_date():
+    assert parse_date("Wed, 21 Oct 2015 07:28:00 GMT") == datetime(
+        2015, 10, 21, 7, 28, tzinfo=timezone.utc
+    )
+
+
+def test_parse_retry_after_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=100)
+
+    assert 90 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 100
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('Max-Age=0, must-revalidate, s-maxage="10"') == {
+        "max-age": 0,
+        "must-revalidate": True,
+        "s-maxage": 10,
+    }
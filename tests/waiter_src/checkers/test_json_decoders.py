@@ -0,0 +1,102 @@
+import sys
+from json import JSONDecodeError
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+from requests import PreparedRequest, Response
+from responses import RequestsMock
+
+from bepatient.waiter_src.checkers.json_decoders import (
+    get_default_json_decoder,
+    get_json_decoder,
+    set_json_decoder,
+)
+from bepatient.waiter_src.checkers.response_context import ResponseContext
+from bepatient.waiter_src.executors.requests_executor import RequestsExecutor
+
+
+@pytest.fixture(autouse=True)
+def restore_default_decoder() -> Iterator[None]:
+    yield
+    set_json_decoder(None)
+
+
+class TestGetJsonDecoder:
+    @pytest.mark.parametrize("name", ["auto", "json", "orjson"])
+    def test_decode_bytes(self, name: str):
+        decoder = get_json_decoder(name)  # type: ignore[arg-type]
+
+        assert decoder(b'{"status": "done", "list": [1, 2]}') == {  # type: ignore
+            "status": "done",
+            "list": [1, 2],
+        }
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_decode_error(self, name: str):
+        decoder = get_json_decoder(name)  # type: ignore[arg-type]
+
+        with pytest.raises(JSONDecodeError):
+            decoder(b'{"status": ')  # type: ignore[misc]
+
+    def test_auto_falls_back_to_stdlib(self, mocker: MockerFixture):
+        mocker.patch.dict(
+            sys.modules, {"orjson": None, "msgspec": None, "simdjson": None}
+        )
+
+        assert get_json_decoder("auto").__module__ == "json"  # type: ignore
+
+    def test_missing_library(self, mocker: MockerFixture):
+        mocker.patch.dict(sys.modules, {"orjson": None})
+
+        with pytest.raises(ImportError, match="pip install orjson"):
+            get_json_decoder("orjson")
+
+    def test_unknown_decoder(self):
+        with pytest.raises(ValueError, match="Unknown JSON decoder: ujson"):
+            get_json_decoder("ujson")  # type: ignore[arg-type]
+
+    def test_custom_decoder_and_none(self):
+        def decoder(content: bytes) -> str:
+            return content.decode()
+
+        assert get_json_decoder(decoder) is decoder
+        assert get_json_decoder(None) is None
+
+
+class TestSetJsonDecoder:
+    def test_global_decoder(self, mocker: MockerFixture, example_response: Response):
+        decoder = mocker.MagicMock(return_value={"decoded": True})
+        json_spy = mocker.spy(example_response, "json")
+        set_json_decoder(decoder)
+
+        assert ResponseContext(example_response).json() == {"decoded": True}
+        decoder.assert_called_once_with(example_response.content)
+        json_spy.assert_not_called()
+        assert get_default_json_decoder() is decoder
+
+    def test_own_decoder_has_priority(
+        self, mocker: MockerFixture, example_response: Response
+    ):
+        set_json_decoder(mocker.MagicMock(return_value="global"))
+        context = ResponseContext(example_response, mocker.MagicMock(return_value=1))
+
+        assert context.json() == 1
+
+    def test_executor_decoder(
+        self,
+        mocker: MockerFixture,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+    ):
+        mocked_responses.get("https://webludus.pl", body=b'{"status": "done"}')
+        decoder = mocker.MagicMock(return_value={"status": "done"})
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, json_decoder=decoder
+        )
+        executor.add_main_condition(
+            mocker.MagicMock(check=lambda data, _: data.json()["status"] == "done")
+        )
+
+        assert executor.is_condition_met() is True
+        decoder.assert_called_once_with(b'{"status": "done"}')
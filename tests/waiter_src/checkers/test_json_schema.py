@@ -0,0 +1,48 @@
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from bepatient.waiter_src.checkers.json_schema import (
+    ValidatorCache,
+    first_violation,
+    json_pointer,
+)
+
+
+class TestValidatorCache:
+    def test_equal_schemas_share_validator(self):
+        cache = ValidatorCache()
+        validator = cache.get({"type": "object", "required": ["id"]})
+
+        assert cache.get({"required": ["id"], "type": "object"}) is validator
+        assert len(cache) == 1
+
+    def test_least_recently_used_is_removed(self):
+        cache = ValidatorCache(maxsize=2)
+        integer = cache.get({"type": "integer"})
+        cache.get({"type": "string"})
+        cache.get({"type": "integer"})
+        cache.get({"type": "null"})
+
+        assert len(cache) == 2
+        assert cache.get({"type": "integer"}) is integer
+
+    def test_invalid_schema(self):
+        with pytest.raises(SchemaError):
+            ValidatorCache().get({"type": "unknown"})
+
+
+def test_json_pointer():
+    assert json_pointer([]) == "#"
+    assert json_pointer(["items", 0, "a/b~c"]) == "#/items/0/a~1b~0c"
+
+
+def test_first_violation():
+    validator = ValidatorCache().get(
+        {"type": "array", "items": {"enum": ["done"]}, "minItems": 3}
+    )
+
+    assert first_violation(validator, ["done"] * 3) is None
+    assert (
+        first_violation(validator, ["done", "new"])
+        == "#/1: 'new' is not one of ['done']"
+    )
@@ -0,0 +1,78 @@
+import json
+from io import BytesIO
+from json import JSONDecodeError
+from typing import Any
+
+import pytest
+from dictor import dictor
+
+from bepatient.waiter_src.checkers.json_stream import find_in_stream
+from bepatient.waiter_src.checkers.path_accessor import MISSING, PathAccessor
+
+DATA = {
+    "status": "done",
+    "Progress": {"done": 5, "total": 10.5, "flags": [True, None]},
+    "results": [{"id": 1}, {"id": 2, "items": [[1, 2], [3, 4]]}],
+    "empty": {},
+    "tail": ["x" * 100] * 100,
+}
+
+
+class _CountingStream(BytesIO):
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.bytes_read = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def find(data: Any, path: str, ignore_case: bool = False) -> Any:
+    stream = BytesIO(json.dumps(data).encode("utf-8"))
+    return find_in_stream(stream, PathAccessor(path).steps, ignore_case)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "status",
+        "Progress.done",
+        "Progress.total",
+        "Progress.flags.0",
+        "Progress.flags.1",
+        "Progress",
+        "results.1.id",
+        "results.1.items.1",
+        "results.1.items.1.0",
+        "empty",
+    ],
+)
+def test_same_as_dictor(path: str):
+    assert find(DATA, path) == dictor(DATA, path)
+
+
+@pytest.mark.parametrize(
+    "path", ["missing", "Progress.missing", "results.5.id", "results.x", "empty.key"]
+)
+def test_missing(path: str):
+    assert find(DATA, path) is MISSING
+
+
+def test_ignore_case():
+    assert find(DATA, "progress.DONE", ignore_case=True) == 5
+    assert find(DATA, "progress.DONE") is MISSING
+
+
+def test_stops_reading():
+    content = json.dumps({"status": "done", "results": ["x" * 1000] * 1000}).encode()
+    stream = _CountingStream(content)
+
+    assert find_in_stream(stream, PathAccessor("status").steps, False) == "done"
+    assert stream.bytes_read < len(content) / 10
+
+
+def test_invalid_json():
+    with pytest.raises(JSONDecodeError):
+        find_in_stream(BytesIO(b'{"status": '), PathAccessor("status").steps, False)
@@ -0,0 +1,124 @@
+from typing import Any
+
+import pytest
+from dictor import dictor
+
+from bepatient.waiter_src.checkers.path_accessor import (
+    PathAccessor,
+    PathTrie,
+    SearchIndex,
+)
+
+DATA = {
+    "status": "done",
+    "Items": [
+        {"id": 1, "name": "first", "tags": [{"name": "a"}, {"name": None}]},
+        {"id": 2, "name": "second", "nested": {"name": "deep"}},
+    ],
+    "dotted.key": {"value": 5},
+    "empty": {},
+    "text": "just a string",
+    "matrix": [[1, 2], [3, 4]],
+}
+NESTED = [
+    {"name": {"name": "inner", "id": 1}, "id": None},
+    {"list": [{"id": 2}, [{"id": 3}], {"name": None}]},
+    "not a dict",
+]
+
+
+ACCESSOR_ARGUMENTS = [
+    (None, None, None, False),
+    ("status", None, None, False),
+    ("Items.1.name", None, None, False),
+    ("Items.-1.id", None, None, False),
+    ("Items.5.name", None, "fallback", False),
+    ("Items.x.name", None, "fallback", False),
+    ("items.0.name", None, None, True),
+    ("items.0.name", None, "fallback", False),
+    (r"dotted\.key.value", None, None, False),
+    ("empty.value", None, "fallback", False),
+    ("text.just", None, "fallback", False),
+    ("matrix.1.0", None, None, False),
+    ("status.missing.deeper", None, None, False),
+    (None, "name", None, False),
+    (None, "name", "fallback", False),
+    ("Items", "name", None, False),
+    ("Items.0", "id", None, False),
+    ("missing", "name", "fallback", False),
+    (None, "missing", "fallback", False),
+    ("", None, "fallback", False),
+]
+
+
+@pytest.mark.parametrize("path,search,default,ignore_case", ACCESSOR_ARGUMENTS)
+def test_same_as_dictor(
+    path: str | None, search: str | None, default: Any, ignore_case: bool
+):
+    accessor = PathAccessor(path, search, default, ignore_case)
+
+    assert accessor(DATA) == dictor(
+        DATA, path=path, search=search, default=default, ignorecase=ignore_case
+    )
+
+
+@pytest.mark.parametrize("data", [[{"name": "a"}, {"name": "b"}], [], "string", None])
+def test_search_in_other_types(data: Any):
+    assert PathAccessor(search="name")(data) == dictor(data, search="name")
+
+
+def test_compiled_once():
+    accessor = PathAccessor(r"a.0.b\.c", ignore_case=True)
+
+    assert accessor.steps == [("a", None, "a"), ("0", 0, "0"), ("b.c", None, "b.c")]
+    assert accessor == PathAccessor(r"a.0.b\.c", ignore_case=True)
+    assert accessor != PathAccessor(r"a.0.b\.c")
+
+
+class TestPathTrie:
+    def test_same_as_accessors(self):
+        accessors = [PathAccessor(*arguments) for arguments in ACCESSOR_ARGUMENTS]
+        trie = PathTrie(accessors)
+
+        found = trie.resolve(DATA)
+
+        assert len(trie.accessors) == len(found) == 15
+        for accessor in trie.accessors:
+            assert accessor.finish(found[id(accessor)]) == accessor(DATA)
+
+    def test_shared_prefix_is_walked_once(self):
+        class CountingList(list[Any]):
+            reads = 0
+
+            def __getitem__(self, index):
+                CountingList.reads += 1
+                return super().__getitem__(index)
+
+        accessors = [PathAccessor(f"Items.0.{key}") for key in ("id", "name", "tags")]
+        data = {"Items": CountingList([{"id": 1, "name": "first", "tags": []}])}
+
+        found = PathTrie(accessors).resolve(data)
+
+        assert [found[id(accessor)] for accessor in accessors] == [1, "first", []]
+        assert CountingList.reads == 1
+
+
+class TestSearchIndex:
+    @pytest.mark.parametrize("data", [DATA, NESTED, DATA["Items"], "string", None])
+    @pytest.mark.parametrize("search", ["name", "id", "value", "missing"])
+    @pytest.mark.parametrize("default", [None, "fallback"])
+    def test_same_as_accessor(self, data: Any, search: str, default: Any):
+        accessor = PathAccessor(search=search, default=default)
+
+        assert SearchIndex(data).search(search, default) == accessor(data)
+
+    def test_statistics(self):
+        index = SearchIndex(NESTED)
+        found = index.search("id")
+        found.append("changed")
+
+        assert index.search("id") == [1, None, 2]
+        assert index.search("missing") is None
+        assert (index.hits, index.misses) == (2, 1)
+        assert str(index).startswith("Keys: 3 | Values: 6 | Build time: ")
+        assert str(index).endswith(" | Hits: 2 | Misses: 1")
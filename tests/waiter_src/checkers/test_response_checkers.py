@@ -1,3 +1,4 @@
+import json
 from json import JSONDecodeError
 from typing import Any, Callable
 
@@ -6,11 +7,30 @@ from _pytest.logging import LogCaptureFixture
 from pytest_mock import MockerFixture
 from requests import Response
 
+from bepatient import RequestsWaiter
+from bepatient.waiter_src.checkers import json_schema
+from bepatient.waiter_src.checkers.jmespath_query import QueryError, compile_query
+from bepatient.waiter_src.checkers.json_schema import ValidatorCache
 from bepatient.waiter_src.checkers.response_checkers import (
+    BodyBytesChecker,
     HeadersChecker,
+    JmesPathChecker,
     JsonChecker,
+    SchemaChecker,
     StatusCodeChecker,
+    StreamingJsonChecker,
 )
+from bepatient.waiter_src.checkers.response_context import ResponseContext
+from bepatient.waiter_src.comparators import (
+    contain,
+    contain_all,
+    have_len_greater,
+    is_equal,
+    match_regex,
+    match_schema,
+    starts_with,
+)
+from bepatient.waiter_src.exceptions import WaiterConditionWasNotMet
 
 
 class TestStatusCodeChecker:
@@ -338,13 +358,23 @@ class TestJsonChecker:
         )
         assert checker.prepare_data(example_response) == expected_value
 
+    def test_changed_path_is_compiled_again(
+        self, is_equal_comparer: Callable[[Any, Any], bool], example_response: Response
+    ):
+        checker = JsonChecker(
+            comparer=is_equal_comparer, expected_value=18, dict_path="list_of_dicts.0"
+        )
+        checker.path = "list_of_dicts.1.age"
+
+        assert checker.prepare_data(example_response) < 18
+
 
 class TestHeadersChecker:
     def test_str(self, is_equal_comparer: Callable[[Any, Any], bool]):
         checker = HeadersChecker(is_equal_comparer, 5)
         msg = (
             "Checker: HeadersChecker | Comparer: comparer | Dictor_fallback: None"
-            " | Expected_value: 5 | Ignore_case: False | Path: None"
+            " | Expected_value: 5 | Header_type: None | Ignore_case: False | Path: None"
             " | Search_query: None | Data: None"
         )
 
@@ -366,7 +396,8 @@ class TestHeadersChecker:
                 10,
                 "Check uuid: TEST | Checker: HeadersChecker | Comparer: comparer"
                 " | Dictor_fallback: None | Expected_value: WebLudus.pl"
-                " | Ignore_case: False | Path: Server | Search_query: None"
+                " | Header_type: None | Ignore_case: False"
+                " | Path: Server | Search_query: None"
                 " | Data: WebLudus.pl",
             ),
             (
@@ -387,7 +418,8 @@ class TestHeadersChecker:
                 20,
                 "Check success! | uuid: TEST | Checker: HeadersChecker"
                 " | Comparer: comparer | Dictor_fallback: None"
-                " | Expected_value: WebLudus.pl | Ignore_case: False | Path: Server"
+                " | Expected_value: WebLudus.pl"
+                " | Header_type: None | Ignore_case: False | Path: Server"
                 " | Search_query: None | Data: WebLudus.pl",
             ),
         ]
@@ -420,8 +452,8 @@ class TestHeadersChecker:
                 10,
                 "Check uuid: TEST | Checker: HeadersChecker | Comparer: comparer"
                 " | Dictor_fallback: None | Expected_value: example.com"
-                " | Ignore_case: False | Path: Server | Search_query: None"
-                " | Data: WebLudus.pl",
+                " | Header_type: None | Ignore_case: False | Path: Server"
+                " | Search_query: None | Data: WebLudus.pl",
             ),
             (
                 "bepatient.waiter_src.checkers.response_checkers",
@@ -441,7 +473,8 @@ class TestHeadersChecker:
                 20,
                 "Check uuid: TEST | Condition not met | Checker: HeadersChecker"
                 " | Comparer: comparer | Dictor_fallback: None"
-                " | Expected_value: example.com | Ignore_case: False | Path: Server"
+                " | Expected_value: example.com"
+                " | Header_type: None | Ignore_case: False | Path: Server"
                 " | Search_query: None | Data: WebLudus.pl",
             ),
         ]
@@ -463,3 +496,391 @@ class TestHeadersChecker:
             comparer=is_equal_comparer, expected_value="TEST", search_query="name"
         )
         assert checker.check(data=example_response, run_uuid="TEST") is False
+
+
+class TestParsedHeadersChecker:
+    def test_headers_are_not_copied(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+    ):
+        checker = HeadersChecker(
+            is_equal_comparer, "WebLudus.pl", dict_path="server", ignore_case=False
+        )
+
+        assert checker.check(example_response, "TEST") is True
+        assert checker.parse_response(example_response) is example_response.headers
+
+    @pytest.mark.parametrize(
+        "header_type, header, expected_value",
+        [
+            ("int", " 1024", 1024),
+            ("list", "Accept, Accept-Encoding,", ["Accept", "Accept-Encoding"]),
+            (
+                "cache_control",
+                'no-cache, max-age=60, private="Set-Cookie"',
+                {"no-cache": True, "max-age": 60, "private": "Set-Cookie"},
+            ),
+            ("retry_after", "120", 120.0),
+            ("retry_after", "Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            (len, "abc", 3),
+        ],
+    )
+    def test_header_type(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        header_type: Any,
+        header: str,
+        expected_value: Any,
+    ):
+        example_response.headers["X-Test"] = header
+        checker = HeadersChecker(
+            is_equal_comparer, expected_value, "x-test", header_type=header_type
+        )
+
+        assert checker.check(example_response, "TEST") is True
+
+    def test_missing_header_is_not_parsed(
+        self, is_equal_comparer: Callable[[Any, Any], bool], example_response: Response
+    ):
+        checker = HeadersChecker(
+            is_equal_comparer,
+            "0",
+            dict_path="Content-Length",
+            dictor_fallback="0",
+            header_type="int",
+        )
+
+        assert checker.check(example_response, "TEST") is True
+
+    def test_invalid_header(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        caplog: LogCaptureFixture,
+    ):
+        checker = HeadersChecker(
+            is_equal_comparer, 1, dict_path="Server", header_type="int"
+        )
+
+        assert checker.prepare_data(example_response, "TEST") is None
+        assert caplog.record_tuples[-1] == (
+            "bepatient.waiter_src.checkers.response_checkers",
+            40,
+            "Check uuid: TEST | Header Server could not be parsed as int: WebLudus.pl",
+        )
+
+    def test_unknown_header_type(self, is_equal_comparer: Callable[[Any, Any], bool]):
+        with pytest.raises(ValueError, match="Unknown header type: float"):
+            HeadersChecker(
+                is_equal_comparer, 1, "Age", header_type="float"  # type: ignore
+            )
+
+
+class TestStreamingJsonChecker:
+    def test_stops_reading(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        streamed_response: Response,
+        streamed_content: bytes,
+    ):
+        context = ResponseContext(streamed_response)
+        checker = StreamingJsonChecker(
+            comparer=is_equal_comparer, expected_value="done", dict_path="status"
+        )
+
+        assert checker.check(data=context, run_uuid="TEST") is True
+        assert context.is_streamed is True
+        assert len(context._stream_buffer) < len(streamed_content) / 10
+
+    def test_json_checker_after_streaming_with_custom_decoder(
+        self, is_equal_comparer: Callable[[Any, Any], bool], streamed_response: Response
+    ):
+        context = ResponseContext(streamed_response, json_decoder=json.loads)
+        streaming_checker = StreamingJsonChecker(
+            comparer=is_equal_comparer, expected_value="done", dict_path="status"
+        )
+        json_checker = JsonChecker(
+            comparer=is_equal_comparer, expected_value="x" * 1000, dict_path="results.0"
+        )
+
+        assert streaming_checker.check(data=context, run_uuid="TEST") is True
+        assert json_checker.check(data=context, run_uuid="TEST") is True
+
+    def test_fallback(
+        self, is_equal_comparer: Callable[[Any, Any], bool], example_response: Response
+    ):
+        checker = StreamingJsonChecker(
+            comparer=is_equal_comparer,
+            expected_value="TEST",
+            dict_path="missing.path",
+            dictor_fallback="TEST",
+        )
+        assert checker.check(data=example_response, run_uuid="TEST") is True
+
+    @pytest.mark.parametrize(
+        "dict_path,search_query", [(None, "name"), ("list_of_dicts.-1.age", None)]
+    )
+    def test_not_streamable_path(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        mocker: MockerFixture,
+        dict_path: str | None,
+        search_query: str | None,
+    ):
+        json_spy = mocker.spy(example_response, "json")
+        checker = StreamingJsonChecker(
+            comparer=is_equal_comparer,
+            expected_value="TEST",
+            dict_path=dict_path,
+            search_query=search_query,
+        )
+
+        assert checker.prepare_data(example_response) == JsonChecker(
+            comparer=is_equal_comparer,
+            expected_value="TEST",
+            dict_path=dict_path,
+            search_query=search_query,
+        ).prepare_data(example_response)
+        json_spy.assert_called()
+
+    def test_invalid_json(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        caplog: LogCaptureFixture,
+    ):
+        example_response._content = b'{"status": '
+        checker = StreamingJsonChecker(
+            comparer=is_equal_comparer, expected_value="TEST", dict_path="status"
+        )
+
+        assert checker.prepare_data(example_response, "TEST") is None
+        assert caplog.records[-1].levelname == "ERROR"
+
+
+class TestBodyBytesChecker:
+    def test_str(self):
+        checker = BodyBytesChecker(contain, "done")
+
+        assert str(checker) == (
+            "Checker: BodyBytesChecker | Comparer: contain | Encoding: utf-8"
+            " | Expected_value: done | Ignore_case: False | Data: None"
+        )
+
+    @pytest.mark.parametrize(
+        "comparer, expected_value, ignore_case",
+        [
+            (contain, '"name": "Jack"', False),
+            (contain, b'"NAME": "JACK"', True),
+            (contain_all, ["Cracow", b"Mike"], False),
+            (starts_with, '{"list_of_dicts"', False),
+            (match_regex, r'"age": \d{2}', False),
+            (match_regex, '"CITY": "C\\w+"', True),
+            (have_len_greater, 100, False),
+        ],
+    )
+    def test_comparers(
+        self,
+        mocker: MockerFixture,
+        example_response: Response,
+        comparer: Callable[[Any, Any], bool],
+        expected_value: Any,
+        ignore_case: bool,
+    ):
+        json_spy = mocker.spy(example_response, "json")
+        checker = BodyBytesChecker(comparer, expected_value, ignore_case=ignore_case)
+
+        assert checker.check(example_response, "TEST") is True
+        json_spy.assert_not_called()
+
+    def test_condition_not_met(self, example_response: Response):
+        checker = BodyBytesChecker(contain, '"name": "Mark"')
+
+        assert checker.check(example_response, "TEST") is False
+        assert checker._prepared_data == example_response.content
+
+    def test_expected_value_is_prepared_once(self):
+        checker = BodyBytesChecker(match_regex, "id=[0-9]+")
+        pattern = checker.prepare_expected_value()
+
+        assert pattern.pattern == b"id=[0-9]+"
+        assert checker.prepare_expected_value() is pattern
+
+        checker.expected_value = "id=[a-z]+"
+
+        assert checker.prepare_expected_value().pattern == b"id=[a-z]+"
+
+    def test_starts_with_reads_prefix_only(
+        self, streamed_response: Response, streamed_content: bytes
+    ):
+        context = ResponseContext(streamed_response)
+        checker = BodyBytesChecker(starts_with, '{"status": "done"')
+
+        assert checker.check(context, "TEST") is True
+        assert context.is_streamed is True
+        assert len(context._stream_buffer) < len(streamed_content) / 10
+
+    def test_streamed_body_is_read_for_other_comparers(
+        self, streamed_response: Response, streamed_content: bytes
+    ):
+        context = ResponseContext(streamed_response)
+        checker = BodyBytesChecker(contain, b"xxx")
+
+        assert checker.check(context, "TEST") is True
+        assert context.content == streamed_content
+
+
+class TestJmesPathChecker:
+    def test_str(self, is_equal_comparer: Callable[[Any, Any], bool]):
+        checker = JmesPathChecker(is_equal_comparer, 5, "items[0]")
+
+        assert str(checker) == (
+            "Checker: JmesPathChecker | Comparer: comparer | Expected_value: 5"
+            " | Path: items[0] | Data: None"
+        )
+
+    @pytest.mark.parametrize(
+        "expression, expected_value",
+        [
+            ("list_of_dicts[?age > `18`].name", ["John"]),
+            ("list_of_dicts[*].age", [30, 15]),
+            ("length(list_of_dicts[?age < `18`]) == `1`", True),
+            ("{name: name, city: City}", {"name": "Jack", "city": "Cracow"}),
+            ("missing.key", None),
+        ],
+    )
+    def test_expression(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        expression: str,
+        expected_value: Any,
+    ):
+        checker = JmesPathChecker(is_equal_comparer, expected_value, expression)
+
+        assert checker.check(example_response, "TEST") is True
+
+    def test_expression_is_compiled_once(
+        self, is_equal_comparer: Callable[[Any, Any], bool], example_response: Response
+    ):
+        compile_query.cache_clear()
+        checker = JmesPathChecker(is_equal_comparer, "Jack", "name")
+        JmesPathChecker(is_equal_comparer, "John", "name")
+        checker.check(example_response, "TEST")
+
+        assert compile_query.cache_info().misses == 1
+        assert compile_query.cache_info().hits == 1
+
+        checker.path = "City"
+
+        assert checker.check(example_response, "TEST") is False
+        assert checker._prepared_data == "Cracow"
+
+    def test_invalid_expression(self, is_equal_comparer: Callable[[Any, Any], bool]):
+        with pytest.raises(QueryError):
+            JmesPathChecker(is_equal_comparer, 1, "items[?")
+
+    def test_runtime_error(
+        self,
+        is_equal_comparer: Callable[[Any, Any], bool],
+        example_response: Response,
+        caplog: LogCaptureFixture,
+    ):
+        checker = JmesPathChecker(is_equal_comparer, 1, "length(some_number)")
+
+        assert checker.check(example_response, "TEST") is False
+        assert checker._prepared_data is None
+        assert caplog.record_tuples[2][1] == 40
+
+    def test_add_checker(self, example_response: Response):
+        waiter = RequestsWaiter(example_response).add_checker(
+            expected_value=["Mike"],
+            comparer="is_equal",
+            checker="jmespath_checker",
+            dict_path="list_of_dicts[?age < `18`].name",
+        )
+
+        assert waiter.run(retries=1).get_result() is example_response
+
+
+class TestSchemaChecker:
+    schema = {
+        "type": "object",
+        "required": ["name", "list_of_dicts"],
+        "properties": {
+            "list_of_dicts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"age": {"type": "integer", "minimum": 18}},
+                },
+            }
+        },
+    }
+
+    def test_valid(self, example_response: Response):
+        checker = SchemaChecker(match_schema, {"required": ["name", "City"]})
+
+        assert checker.check(example_response, "TEST") is True
+        assert checker.violation() is None
+
+    def test_violation_is_reported(self, example_response: Response):
+        checker = SchemaChecker(match_schema, self.schema)
+        schema_hash = ValidatorCache.schema_hash(self.schema)[:12]
+
+        assert checker.check(example_response, "TEST") is False
+        assert checker.violation() == (
+            "#/list_of_dicts/1/age: 15 is less than the minimum of 18"
+        )
+        assert checker.error_message() == (
+            "Checker: SchemaChecker | Comparer: match_schema | Dictor_fallback: None"
+            f" | Expected_value: <schema {schema_hash}> | Ignore_case: False"
+            " | Path: None | Search_query: None | Data: {'list_of_dicts': [{'name':"
+            " 'John', 'age': 30}, {'name': 'Mike', 'age': 15}], 'ok': True,"
+            " 'some_number': 123, 'list': ['1', '2', '3'], 'none': None, 'empty':"
+            " '', 'false': False, 'name': 'Jack', 'City': 'Cracow'}"
+            " | Violation: #/list_of_dicts/1/age: 15 is less than the minimum of 18"
+        )
+
+    def test_violation_is_not_computed_for_logs(
+        self, example_response: Response, mocker: MockerFixture
+    ):
+        checker = SchemaChecker(match_schema, self.schema)
+        violation_spy = mocker.spy(json_schema, "first_violation")
+
+        assert checker.check(example_response, "TEST") is False
+        assert "Violation" not in str(checker)
+        violation_spy.assert_not_called()
+
+    def test_other_comparers_are_rejected(self):
+        with pytest.raises(ValueError, match="requires the match_schema comparer"):
+            SchemaChecker(is_equal, self.schema)
+
+    def test_dict_path(self, example_response: Response):
+        checker = SchemaChecker(
+            match_schema, {"type": "array", "maxItems": 3}, dict_path="list"
+        )
+
+        assert checker.check(example_response, "TEST") is True
+
+    def test_validator_is_shared(self):
+        first = SchemaChecker(match_schema, dict(self.schema))
+        second = SchemaChecker(match_schema, dict(self.schema))
+
+        assert first.prepare_expected_value() is second.prepare_expected_value()
+
+    def test_error_message(self, example_response: Response):
+        waiter = RequestsWaiter(example_response).add_checker(
+            expected_value=self.schema,
+            comparer="match_schema",
+            checker="schema_checker",
+        )
+
+        with pytest.raises(
+            WaiterConditionWasNotMet,
+            match="Violation: #/list_of_dicts/1/age: 15 is less than the minimum",
+        ):
+            waiter.run(retries=1)
@@ -0,0 +1,102 @@
+from json import JSONDecodeError
+
+import pytest
+from pytest_mock import MockerFixture
+from requests import Response
+
+from bepatient.waiter_src.checkers.path_accessor import PathAccessor
+from bepatient.waiter_src.checkers.response_context import ResponseContext
+
+
+class TestResponseContext:
+    def test_json_is_decoded_once(
+        self, mocker: MockerFixture, example_response: Response
+    ):
+        json_spy = mocker.spy(example_response, "json")
+        context = ResponseContext(example_response)
+
+        assert context.json() is context.json()
+        assert json_spy.call_count == 1
+
+    def test_json_error_is_cached(self, mocker: MockerFixture):
+        response = mocker.MagicMock()
+        response.json.side_effect = JSONDecodeError("", "", 1)
+        context = ResponseContext(response)
+
+        for _ in range(2):
+            with pytest.raises(JSONDecodeError):
+                context.json()
+        assert response.json.call_count == 1
+
+    def test_attributes_are_taken_from_response(self, example_response: Response):
+        context = ResponseContext(example_response)
+
+        assert context.status_code == 200
+        assert context.content == example_response.content
+        assert context.headers is example_response.headers
+        assert context.request is example_response.request
+
+    def test_of_returns_the_same_context(self, example_response: Response):
+        context = ResponseContext(example_response)
+
+        assert ResponseContext.of(context) is context
+        assert ResponseContext.of(example_response).response is example_response
+
+    def test_search_index_is_built_once_per_data(self, example_response: Response):
+        context = ResponseContext(example_response)
+        data = context.json()
+
+        assert context.search(data, "name") == ["John", "Mike", "Jack"]
+        assert context.search(data, "age") == [30, 15]
+        assert context.search(data["list_of_dicts"][0], "age") == [30]
+        assert len(context.search_indexes) == 2
+        assert context.search_indexes[id(data)].hits == 2
+
+    def test_resolve_uses_search_index_if_enabled(self, example_response: Response):
+        context = ResponseContext(example_response)
+        accessor = PathAccessor("list_of_dicts", "name")
+
+        assert context.resolve(accessor, context.json()) == ["John", "Mike"]
+        assert not context.search_indexes
+        context.index_searches = True
+        assert context.resolve(accessor, context.json()) == ["John", "Mike"]
+        assert len(context.search_indexes) == 1
+
+
+class TestStreamedResponseContext:
+    def test_readers_share_the_buffer(
+        self, streamed_response: Response, streamed_content: bytes
+    ):
+        context = ResponseContext(streamed_response)
+        first, second = context.open_stream(), context.open_stream()
+
+        assert first.read(10) == streamed_content[:10]
+        assert second.read(20) == streamed_content[:20]
+        assert first.read(10) == streamed_content[10:20]
+        assert context.is_streamed is True
+        assert context.loaded_content() == "<body not loaded>"
+
+    def test_content_after_partial_read(
+        self, streamed_response: Response, streamed_content: bytes
+    ):
+        context = ResponseContext(streamed_response)
+        stream = context.open_stream()
+        stream.read(100)
+
+        assert context.content == streamed_content
+        assert context.is_streamed is False
+        assert streamed_response.content == streamed_content
+        assert stream.read(10) == streamed_content[100:110]
+
+    def test_json_of_streamed_response(self, streamed_response: Response):
+        context = ResponseContext(streamed_response)
+        context.open_stream().read(5)
+
+        assert context.json()["status"] == "done"
+
+    def test_loaded_response(self, example_response: Response):
+        context = ResponseContext(example_response)
+
+        assert context.is_streamed is False
+        assert context.open_stream().read() == example_response.content
+        assert context.loaded_content() == example_response.content
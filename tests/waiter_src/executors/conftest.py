@@ -1,3 +1,4 @@
+import httpx
 import pytest
 from requests import Response
 
@@ -6,3 +7,8 @@ from requests import Response
 def response_without_cookies_in_request(example_response: Response) -> Response:
     del example_response.request.headers["Cookie"]
     return example_response
+
+
+@pytest.fixture
+def httpx_request() -> httpx.Request:
+    return httpx.Request("GET", "https://webludus.pl", headers={"task": "test"})
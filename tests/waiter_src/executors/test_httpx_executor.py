@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from bepatient.waiter_src.checkers.checker import Checker
+from bepatient.waiter_src.checkers.response_checkers import JsonChecker
+from bepatient.waiter_src.comparators import is_equal
+from bepatient.waiter_src.executors import httpx_executor
+from bepatient.waiter_src.executors.httpx_executor import HttpxExecutor, httpx_to_curl
+
+
+def mocked_client(responses: list[httpx.Response]) -> httpx.AsyncClient:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestHttpxExecutor:
+    def test_is_condition_met(
+        self, httpx_request: httpx.Request, example_dict_content: dict[str, Any]
+    ):
+        client = mocked_client(
+            [httpx.Response(404), httpx.Response(200, json=example_dict_content)]
+        )
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200, client=client
+        ).add_main_condition(JsonChecker(is_equal, "Jack", dict_path="name"))
+
+        assert asyncio.run(executor.is_condition_met_async()) is False
+        assert asyncio.run(executor.is_condition_met_async()) is True
+        assert executor.get_result().json() == example_dict_content
+
+    def test_response_is_checked_before_sending_request(
+        self, httpx_request: httpx.Request, checker_true: Checker
+    ):
+        response = httpx.Response(200, request=httpx_request)
+        client = mocked_client([])
+        executor = HttpxExecutor(
+            req_or_res=response, expected_status_code=200, client=client
+        ).add_main_condition(checker_true)
+
+        assert asyncio.run(executor.is_condition_met_async()) is True
+        assert executor.get_result() is response
+        assert executor.request is httpx_request
+
+    def test_error_message(self, httpx_request: httpx.Request, checker_false: Checker):
+        client = mocked_client([httpx.Response(200)])
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200, client=client
+        ).add_main_condition(checker_false)
+
+        asyncio.run(executor.is_condition_met_async())
+
+        assert executor.error_message() == (
+            "The condition has not been met! | Failed checkers: (Checker: CheckerMocker"
+            " | Comparer: comparer | Expected_value: TEST | Data: Ok)"
+            " | curl -X GET -H 'host: webludus.pl' -H 'task: test' https://webludus.pl"
+        )
+
+    def test_http_error(self, httpx_request: httpx.Request, checker_true: Checker):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200, client=client
+        ).add_main_condition(checker_true)
+
+        assert asyncio.run(executor.is_condition_met_async()) is False
+
+    def test_time_limit(self, httpx_request: httpx.Request, checker_true: Checker):
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1)
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200, client=client
+        ).add_main_condition(checker_true)
+        executor.set_time_limit(0.01)
+
+        assert asyncio.run(executor.is_condition_met_async()) is False
+
+    def test_own_client_is_closed(self, httpx_request: httpx.Request):
+        executor = HttpxExecutor(req_or_res=httpx_request, expected_status_code=200)
+        client = executor.client
+
+        asyncio.run(executor.aclose())
+
+        assert client.is_closed
+
+    def test_closed_own_client_is_replaced(
+        self, httpx_request: httpx.Request, checker_true: Checker, mocker: MockerFixture
+    ):
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200
+        ).add_main_condition(checker_true)
+        asyncio.run(executor.aclose())
+        new_client = mocked_client([httpx.Response(200)])
+        mocker.patch.object(httpx, "AsyncClient", return_value=new_client)
+
+        assert asyncio.run(executor.is_condition_met_async()) is True
+        assert executor.client is new_client
+
+    def test_provided_client_is_not_closed(self, httpx_request: httpx.Request):
+        client = mocked_client([])
+        executor = HttpxExecutor(
+            req_or_res=httpx_request, expected_status_code=200, client=client
+        )
+
+        asyncio.run(executor.aclose())
+
+        assert not client.is_closed
+
+    def test_timeout(self, httpx_request: httpx.Request):
+        HttpxExecutor(req_or_res=httpx_request, expected_status_code=200, timeout=5)
+
+        assert httpx_request.extensions["timeout"] == {
+            "connect": 5,
+            "read": 5,
+            "write": 5,
+            "pool": 5,
+        }
+
+    def test_sync_method_is_not_available(self, httpx_request: httpx.Request):
+        executor = HttpxExecutor(req_or_res=httpx_request, expected_status_code=200)
+
+        with pytest.raises(TypeError, match="HttpxExecutor is asynchronous"):
+            executor.is_condition_met()
+
+    def test_curl_is_rendered_lazily(self, mocker: MockerFixture):
+        request = httpx.Request("POST", "https://webludus.pl", content=b"\x89PNG\xff")
+        curl_spy = mocker.spy(httpx_executor, "httpx_to_curl")
+
+        executor = HttpxExecutor(req_or_res=request, expected_status_code=200)
+
+        curl_spy.assert_not_called()
+        assert str(executor._input).endswith("-d '\ufffdPNG\ufffd' https://webludus.pl")
+        assert str(executor._input) == str(executor._input)
+        curl_spy.assert_called_once()
+
+
+def test_httpx_to_curl():
+    request = httpx.Request("POST", "https://webludus.pl/api", json={"name": "Jack"})
+
+    assert httpx_to_curl(request) == (
+        "curl -X POST -H 'host: webludus.pl' -H 'content-length: 15'"
+        " -H 'content-type: application/json' -d '{\"name\":\"Jack\"}'"
+        " https://webludus.pl/api"
+    )
@@ -1,16 +1,30 @@
 import json
-from typing import Any, Callable
+import logging
+from typing import Any, Callable, Literal
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from _pytest.logging import LogCaptureFixture
 from pytest_mock import MockerFixture
 from requests import PreparedRequest, Request, RequestException, Response, Session
-from responses import RequestsMock
+from responses import RequestsMock, matchers
+from urllib3 import HTTPResponse
+from urllib3.exceptions import ProtocolError
 
 from bepatient.waiter_src.checkers.checker import Checker
-from bepatient.waiter_src.exceptions import ExceptionConditionNotMet, ExecutorIsNotReady
+from bepatient.waiter_src.checkers.response_checkers import (
+    HeadersChecker,
+    StreamingJsonChecker,
+)
+from bepatient.waiter_src.comparators import is_equal
+from bepatient.waiter_src.exceptions import (
+    ExceptionConditionNotMet,
+    ExecutorIsNotReady,
+    WaiterConditionWasNotMet,
+)
 from bepatient.waiter_src.executors.requests_executor import RequestsExecutor
+from bepatient.waiter_src.executors.session_registry import session_registry
+from bepatient.waiter_src.waiter import wait_for_executor
 
 
 class TestRequestExecutor:
@@ -317,22 +331,19 @@ class TestRequestExecutor:
         assert executor.is_condition_met() is False
         assert caplog.record_tuples == logs
 
-    def test_creates_own_session_if_not_provided(
-        self, prepared_request: PreparedRequest, caplog: LogCaptureFixture
+    def test_uses_pooled_session_if_not_provided(
+        self, prepared_request: PreparedRequest, request_object: Request
     ):
         executor = RequestsExecutor(
             req_or_res=prepared_request, expected_status_code=200
         )
-        logs = [
-            (
-                "bepatient.waiter_src.executors.requests_executor",
-                10,
-                "Creating a new Session object",
-            )
-        ]
+        other_executor = RequestsExecutor(
+            req_or_res=request_object, expected_status_code=200
+        )
 
         assert isinstance(executor.session, Session)
-        assert caplog.record_tuples == logs
+        assert executor.session is other_executor.session
+        assert executor.session is session_registry.get_session(prepared_request)
 
     def test_response_headers_merged_into_session(
         self,
@@ -441,3 +452,341 @@ class TestRequestExecutor:
         executor.conditions_manager.main_conditions = [checker_true]
         assert executor.is_condition_met() is True
         assert executor.error_message() == "All conditions have been met."
+
+
+class TestRequestExecutorCookies:
+    def test_pooled_session_does_not_send_cookies_of_server(
+        self, mocked_responses: RequestsMock, prepared_request: PreparedRequest
+    ):
+        mocked_responses.get(
+            "https://webludus.pl", headers={"Set-Cookie": "sid=abc; Path=/"}
+        )
+        plain_mock = mocked_responses.get(
+            "https://webludus.pl",
+            match=[matchers.header_matcher({"Cookie": "user-token=abc-123"})],
+        )
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200
+        )
+
+        executor.is_condition_met()
+        executor.is_condition_met()
+
+        assert plain_mock.call_count == 1
+        assert len(executor.session.cookies) == 0
+
+
+class TestRequestExecutorTimeLimit:
+    @pytest.mark.parametrize(
+        "timeout,time_limit,expected",
+        [
+            ((15, 30), None, (15, 30)),
+            ((15, 30), 20, (15, 20)),
+            ((15, 30), 5, (5, 5)),
+            (10, 5.5, 5.5),
+            (10, -1, 0.001),
+        ],
+    )
+    def test_time_limit_reduces_timeout(
+        self,
+        prepared_request: PreparedRequest,
+        session_mock: Session,
+        checker_true: Checker,
+        timeout: int | tuple[int, int],
+        time_limit: float | None,
+        expected: float | tuple[float, float],
+    ):
+        executor = RequestsExecutor(
+            req_or_res=prepared_request,
+            expected_status_code=200,
+            session=session_mock,
+            timeout=timeout,
+        ).add_main_condition(checker_true)
+        executor.set_time_limit(time_limit)
+
+        assert executor.is_condition_met()
+        session_mock.send.assert_called_once_with(  # type: ignore[attr-defined]
+            request=prepared_request, timeout=expected
+        )
+
+
+class TestRequestExecutorConditional:
+    def test_validators_are_sent_back(
+        self, mocked_responses: RequestsMock, prepared_request: PreparedRequest
+    ):
+        mocked_responses.get(
+            "https://webludus.pl",
+            json={"status": "pending"},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        conditional_mock = mocked_responses.get(
+            "https://webludus.pl",
+            json={"status": "done"},
+            match=[
+                matchers.header_matcher(
+                    {
+                        "If-None-Match": '"v1"',
+                        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+                    }
+                )
+            ],
+        )
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, conditional=True
+        )
+
+        executor.is_condition_met()
+        executor.is_condition_met()
+
+        assert conditional_mock.call_count == 1
+        assert "If-None-Match" not in prepared_request.headers
+
+    def test_not_modified_reuses_verdicts(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        checker_false: Checker,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+    ):
+        caplog.set_level(logging.INFO)
+        mocked_responses.get(
+            "https://webludus.pl", json={"status": "pending"}, headers={"ETag": "v1"}
+        )
+        mocked_responses.get("https://webludus.pl", status=304)
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, conditional=True
+        ).add_main_condition(checker_false)
+
+        assert executor.is_condition_met() is False
+        first_response = executor.get_result()
+        check_spy = mocker.spy(checker_false, "check")
+
+        assert executor.is_condition_met() is False
+        assert executor.get_result() is first_response
+        assert executor.get_result().status_code == 200
+        check_spy.assert_not_called()
+        assert (
+            "bepatient.waiter_src.executors.requests_executor",
+            logging.INFO,
+            "Resource has not been modified. Reusing the last verdicts",
+        ) in caplog.record_tuples
+
+    def test_response_without_validators(
+        self, mocked_responses: RequestsMock, prepared_request: PreparedRequest
+    ):
+        mocked_responses.get("https://webludus.pl", json={"status": "pending"})
+        plain_mock = mocked_responses.get(
+            "https://webludus.pl",
+            json={"status": "pending"},
+            match=[matchers.header_matcher({"task": "test"}, strict_match=False)],
+        )
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, conditional=True
+        )
+
+        executor.is_condition_met()
+        executor.is_condition_met()
+
+        assert executor._validators == {}
+        assert "If-None-Match" not in plain_mock.calls[0].request.headers
+
+
+class TestRequestExecutorUnchangedBody:
+    def test_unchanged_body_is_not_checked_again(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        checker_false: Checker,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+    ):
+        caplog.set_level(logging.INFO)
+        mocked_responses.get("https://webludus.pl", json={"status": "pending"})
+        mocked_responses.get("https://webludus.pl", json={"status": "pending"})
+        executor = RequestsExecutor(
+            req_or_res=prepared_request,
+            expected_status_code=200,
+            skip_unchanged_body=True,
+        ).add_main_condition(checker_false)
+        check_spy = mocker.spy(checker_false, "check")
+
+        assert executor.is_condition_met() is False
+        assert executor.is_condition_met() is False
+        assert check_spy.call_count == 1
+        assert executor._failed_checkers == [checker_false]
+        assert (
+            "bepatient.waiter_src.executors.requests_executor",
+            logging.INFO,
+            "Response has not changed. Reusing the last verdicts",
+        ) in caplog.record_tuples
+
+    @pytest.mark.parametrize(
+        "status,body", [(200, {"status": "done"}), (500, {"status": "pending"})]
+    )
+    def test_changed_response_is_checked(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        checker_false: Checker,
+        mocker: MockerFixture,
+        status: int,
+        body: dict[str, str],
+    ):
+        mocked_responses.get("https://webludus.pl", json={"status": "pending"})
+        mocked_responses.get("https://webludus.pl", json=body, status=status)
+        executor = RequestsExecutor(
+            req_or_res=prepared_request,
+            expected_status_code=200,
+            skip_unchanged_body=True,
+        ).add_main_condition(checker_false)
+        check_spy = mocker.spy(checker_false, "check")
+
+        executor.is_condition_met()
+        executor.is_condition_met()
+
+        assert check_spy.call_count == 1 + (status == 200)
+
+    def test_changed_headers_are_checked_by_headers_checker(
+        self, mocked_responses: RequestsMock, prepared_request: PreparedRequest
+    ):
+        mocked_responses.get("https://webludus.pl", json={}, headers={"X-State": "1"})
+        mocked_responses.get("https://webludus.pl", json={}, headers={"X-State": "2"})
+        executor = RequestsExecutor(
+            req_or_res=prepared_request,
+            expected_status_code=200,
+            skip_unchanged_body=True,
+        ).add_main_condition(HeadersChecker(is_equal, "2", dict_path="x-state"))
+
+        assert executor.is_condition_met() is False
+        assert executor.is_condition_met() is True
+
+
+class TestRequestExecutorShortCircuit:
+    @pytest.fixture
+    def failed_checkers(self, checker_mocker: type[Checker]) -> list[Checker]:
+        return [
+            checker_mocker(is_equal, "FIRST"),
+            checker_mocker(is_equal, "SECOND"),
+        ]
+
+    @pytest.mark.parametrize(
+        "options,second_reply",
+        [
+            ({"conditional": True}, {"status": 304}),
+            ({"skip_unchanged_body": True}, {"json": {"status": "pending"}}),
+        ],
+    )
+    def test_reused_verdicts_list_all_failed_checkers(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        failed_checkers: list[Checker],
+        options: dict[str, Any],
+        second_reply: dict[str, Any],
+    ):
+        mocked_responses.get(
+            "https://webludus.pl", json={"status": "pending"}, headers={"ETag": "v1"}
+        )
+        mocked_responses.get("https://webludus.pl", **second_reply)
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, **options
+        )
+        executor.conditions_manager.short_circuit = True
+        for checker in failed_checkers:
+            executor.add_main_condition(checker)
+
+        with pytest.raises(WaiterConditionWasNotMet) as exc_info:
+            wait_for_executor(executor, retries=2, delay=0)
+
+        assert executor._failed_checkers == failed_checkers
+        assert str(exc_info.value).count("Checker:") == 2
+        assert len(mocked_responses.calls) == 2
+
+    def test_last_response_is_evaluated_fully_without_sending_it_again(
+        self,
+        mocked_responses: RequestsMock,
+        prepared_request: PreparedRequest,
+        failed_checkers: list[Checker],
+    ):
+        mocked_responses.get("https://webludus.pl", json={"status": "pending"})
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200
+        )
+        executor.conditions_manager.short_circuit = True
+        for checker in failed_checkers:
+            executor.add_main_condition(checker)
+
+        assert executor.is_condition_met() is False
+        assert len(executor._failed_checkers) == 1
+
+        executor.evaluate_fully()
+
+        assert executor._failed_checkers == failed_checkers
+        assert executor.conditions_manager.full_evaluation is False
+        assert len(mocked_responses.calls) == 1
+
+
+class TestRequestExecutorStream:
+    @pytest.fixture
+    def streaming_executor(self, prepared_request: PreparedRequest) -> RequestsExecutor:
+        executor = RequestsExecutor(
+            req_or_res=prepared_request, expected_status_code=200, stream=True
+        )
+        return executor.add_main_condition(
+            StreamingJsonChecker(is_equal, "done", dict_path="status")
+        )
+
+    def test_body_of_met_condition_is_loaded(
+        self,
+        mocked_responses: RequestsMock,
+        streaming_executor: RequestsExecutor,
+        streamed_content: bytes,
+    ):
+        mocked_responses.get("https://webludus.pl", body=streamed_content)
+
+        assert streaming_executor.is_condition_met() is True
+        assert streaming_executor.get_result().content == streamed_content
+
+    @pytest.mark.parametrize(
+        "unread_body,method", [("drain", "drain_conn"), ("close", "close")]
+    )
+    def test_unread_body_policy(
+        self,
+        mocked_responses: RequestsMock,
+        streaming_executor: RequestsExecutor,
+        mocker: MockerFixture,
+        unread_body: Literal["drain", "close"],
+        method: str,
+    ):
+        body = json.dumps({"status": "pending", "results": ["x" * 1000] * 100})
+        mocked_responses.get("https://webludus.pl", body=body)
+        spy = mocker.spy(HTTPResponse, method)
+        streaming_executor.unread_body = unread_body
+
+        assert streaming_executor.is_condition_met() is False
+        spy.assert_called_once()
+
+    def test_broken_stream_fails_the_attempt(
+        self,
+        mocked_responses: RequestsMock,
+        streaming_executor: RequestsExecutor,
+        streamed_content: bytes,
+        mocker: MockerFixture,
+    ):
+        mocked_responses.get("https://webludus.pl", body=streamed_content)
+        mocker.patch.object(
+            HTTPResponse, "read", side_effect=ProtocolError("Connection broken")
+        )
+        close_spy = mocker.spy(HTTPResponse, "close")
+
+        assert streaming_executor.is_condition_met() is False
+        close_spy.assert_called_once()
+
+
+class TestRequestsExecutorSlots:
+    def test_executor_has_no_dict(self, prepared_request: PreparedRequest):
+        executor = RequestsExecutor(prepared_request, 200)
+
+        assert not hasattr(executor, "__dict__")
+        assert not hasattr(executor.conditions_manager, "__dict__")
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_mock import MockerFixture
+from requests import PreparedRequest, Request, Response
+from responses import RequestsMock
+
+from bepatient.waiter_src.executors.session_registry import (
+    SessionRegistry,
+    configure_session_pool,
+    session_key,
+    session_registry,
+)
+
+
+class TestSessionKey:
+    def test_prepared_request(self, prepared_request: PreparedRequest):
+        assert session_key(prepared_request) == ("https", "webludus.pl", None)
+
+    def test_request_with_auth(self):
+        request = Request("get", "HTTP://Example.com:8080/path", auth=("user", "pass"))
+
+        assert session_key(request) == ("http", "example.com:8080", ("user", "pass"))
+
+    def test_authorization_header_is_hashed(self, prepared_request: PreparedRequest):
+        prepared_request.headers["Authorization"] = "Bearer secret"
+
+        assert session_key(prepared_request) == (
+            "https",
+            "webludus.pl",
+            hash("Bearer secret"),
+        )
+
+    def test_response_uses_first_request(self, example_response: Response):
+        redirect = Response()
+        redirect.request = PreparedRequest()
+        redirect.request.prepare(method="get", url="http://first.pl")
+        example_response.history = [redirect]
+
+        assert session_key(example_response) == ("http", "first.pl", None)
+
+
+class TestSessionRegistry:
+    def test_same_key_shares_session(self, prepared_request: PreparedRequest):
+        registry = SessionRegistry()
+        session = registry.get_session(prepared_request)
+
+        assert registry.get_session(Request("get", "https://webludus.pl/a")) is session
+        assert registry.get_session(Request("get", "https://other.pl")) is not session
+        assert (
+            registry.get_session(
+                Request("get", "https://webludus.pl", auth=("user", "pass"))
+            )
+            is not session
+        )
+        assert len(registry) == 3
+
+    def test_threads_share_session(self, prepared_request: PreparedRequest):
+        registry = SessionRegistry()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(
+                pool.map(lambda _: registry.get_session(prepared_request), range(50))
+            )
+
+        assert len({id(session) for session in sessions}) == 1
+
+    def test_pool_sizes(self, prepared_request: PreparedRequest):
+        registry = SessionRegistry(pool_connections=3, pool_maxsize=5)
+        session = registry.get_session(prepared_request)
+        adapter = session.get_adapter("https://webludus.pl")
+
+        assert adapter._pool_connections == 3  # type: ignore[attr-defined]
+        assert adapter._pool_maxsize == 5  # type: ignore[attr-defined]
+
+        registry.get_session(prepared_request, pool_maxsize=20)
+        adapter = session.get_adapter("https://webludus.pl")
+
+        assert adapter._pool_maxsize == 20  # type: ignore[attr-defined]
+
+    def test_cookies_are_not_stored(
+        self, prepared_request: PreparedRequest, mocked_responses: RequestsMock
+    ):
+        mocked_responses.get(
+            "https://webludus.pl/", headers={"Set-Cookie": "token=abc; Path=/"}
+        )
+        session = SessionRegistry().get_session(prepared_request)
+
+        session.get("https://webludus.pl/")
+
+        assert len(session.cookies) == 0
+
+    def test_idle_sessions_are_evicted(
+        self, mocker: MockerFixture, prepared_request: PreparedRequest
+    ):
+        registry = SessionRegistry(max_idle=10)
+        session = registry.get_session(prepared_request)
+        close_spy = mocker.spy(session, "close")
+        mocker.patch(
+            "bepatient.waiter_src.executors.session_registry.monotonic",
+            return_value=10**6,
+        )
+
+        assert registry.evict_idle() == 1
+        assert len(registry) == 0
+        close_spy.assert_called_once()
+        assert registry.get_session(prepared_request) is not session
+
+    def test_sessions_sending_requests_are_not_evicted(
+        self,
+        mocker: MockerFixture,
+        prepared_request: PreparedRequest,
+        mocked_responses: RequestsMock,
+    ):
+        mocked_responses.get("https://webludus.pl/")
+        registry = SessionRegistry(max_idle=10)
+        session = registry.get_session(prepared_request)
+        monotonic_mock = mocker.patch(
+            "bepatient.waiter_src.executors.session_registry.monotonic",
+            return_value=10**6,
+        )
+
+        session.get("https://webludus.pl/")
+        monotonic_mock.return_value = 10**6 + 5
+
+        assert registry.evict_idle() == 0
+        assert registry.get_session(prepared_request) is session
+
+    def test_configure_closes_sessions(self, prepared_request: PreparedRequest):
+        session = session_registry.get_session(prepared_request)
+
+        configure_session_pool(pool_maxsize=15)
+        try:
+            new_session = session_registry.get_session(prepared_request)
+            adapter = new_session.get_adapter("https://webludus.pl")
+
+            assert new_session is not session
+            assert adapter._pool_maxsize == 15  # type: ignore[attr-defined]
+        finally:
+            configure_session_pool(pool_maxsize=10)
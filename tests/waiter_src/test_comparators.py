@@ -1,3 +1,4 @@
+import re
 from typing import Any
 
 import pytest
@@ -109,9 +110,70 @@ from bepatient.waiter_src import comparators
         ("have_len_lesser", (1, 2, 3, 4, 5, 6), 7, True),
         ("have_len_lesser", (1, 2, 3, 4, 5, 6), 5, False),
         ("have_len_lesser", None, 5, False),
+        ("starts_with", "abcd", "ab", True),
+        ("starts_with", b"abcd", b"ab", True),
+        ("starts_with", b"abcd", b"bc", False),
+        ("starts_with", b"abcd", "ab", False),
+        ("starts_with", None, "ab", False),
+        ("ends_with", "abcd", "cd", True),
+        ("ends_with", b"abcd", b"cd", True),
+        ("ends_with", b"abcd", b"bc", False),
+        ("ends_with", [1, 2], 2, False),
+        ("match_regex", "status: done", r"status: \w+", True),
+        ("match_regex", b"id=123;", rb"id=\d+;", True),
+        ("match_regex", b"id=abc;", re.compile(rb"id=\d+;"), False),
+        ("match_regex", b"id=123;", r"id=\d+;", False),
+        ("match_regex", "abc", "(", False),
+        ("match_regex", None, "a", False),
+        ("match_schema", {"id": 1}, {"required": ["id"]}, True),
+        ("match_schema", [1, "2"], {"items": {"type": "integer"}}, False),
     ],
 )
 def test_happy_path(
     comparator: comparators.COMPARATORS, data: Any, expected_value: Any, result: bool
 ):
     assert getattr(comparators, comparator)(data, expected_value) is result
+
+
+@pytest.mark.parametrize("comparator", ["contain_all", "contain_any"])
+@pytest.mark.parametrize(
+    "data,expected_value",
+    [
+        (list(range(100)), [5, 99, 50]),
+        (list(range(100)), [5, 100]),
+        (list(range(100)), {-1, -2}),
+        (tuple(range(100)), (True, 1.0)),
+        (list(range(100)) + [[1, 2], {"id": 1}], [[1, 2], 7]),
+        (list(range(100)) + [[1, 2], {"id": 1}], [{"id": 1}, -1]),
+        ([[number, number] for number in range(50)], [[3, 3], [49, 49]]),
+        ([[number, number] for number in range(50)], [[3, 3], [50, 50]]),
+        ([{"id": number} for number in range(50)], [{"id": 3}, {"id": 60}]),
+        ([[number] for number in range(50)] + ["a"], [["a"], [3]]),
+        ([{3}, {1}, {2}] * 50, [{2}]),
+        ([{3}, {1}, {2}] * 50, [{4}, {1}]),
+        ([frozenset({3}), frozenset({1}), frozenset({2})] * 50, [{2}, {5}]),
+        ([[1, "a"], [1, 2], ["b"]] * 50, [[1, 2], ["a"]]),
+        ([[float("nan")], [2.0], [1]] * 50, [[1.0], [3]]),
+        ([[10**400], [2.0], [1]] * 50, [[1.0], [10**400]]),
+        ([(1, 2), [1, 2], (0,)] * 50, [[1, 2], [0]]),
+        ([[], [2, 1], [1, 3]] * 50, [[1, 3], [], [4]]),
+        (list("abcdefghij" * 20), "xyz"),
+        ("abcdefghij" * 20, ["abc", "xyz"]),
+    ],
+)
+def test_large_inputs(comparator: str, data: Any, expected_value: Any):
+    scan = all if comparator == "contain_all" else any
+    result = scan(i in data for i in expected_value)
+    function = getattr(comparators, comparator)
+
+    assert function(data, expected_value) is result
+    assert function(data, comparators.prepare_expected_items(expected_value)) is result
+
+
+def test_prepared_expected_items_are_compared_using_sets():
+    expected = comparators.ExpectedItems([2, [1]])
+
+    assert comparators.contain_all([[1], 2], expected) is True
+    assert comparators.contain_all([1, 2], expected) is False
+    assert comparators.contain_any([[1]], expected) is True
+    assert comparators.contain_any("21", expected) is False
@@ -1,8 +1,20 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
 import pytest
 from _pytest.logging import LogCaptureFixture
+from pytest_mock import MockerFixture
+from requests import Response
 
 from bepatient import Checker
-from bepatient.waiter_src.conditions_manager import ConditionsManager
+from bepatient.waiter_src.checkers.path_accessor import PathTrie, SearchIndex
+from bepatient.waiter_src.checkers.response_checkers import JsonChecker
+from bepatient.waiter_src.checkers.response_context import ResponseContext
+from bepatient.waiter_src.comparators import is_equal
+from bepatient.waiter_src.conditions_manager import (
+    CheckerStatistics,
+    ConditionsManager,
+)
 from bepatient.waiter_src.exceptions import ExceptionConditionNotMet, WaiterIsNotReady
 
 
@@ -64,3 +76,327 @@ class TestConditionsManager:
         manager = ConditionsManager()
         with pytest.raises(WaiterIsNotReady, match="No conditions defined"):
             manager.check_all("RESULT", "UUID")
+
+    def test_response_is_parsed_once_per_check(
+        self, mocker: MockerFixture, example_response: Response
+    ):
+        json_spy = mocker.spy(example_response, "json")
+        manager = ConditionsManager()
+        manager.exception_conditions.append(
+            JsonChecker(is_equal, False, dict_path="false")
+        )
+        manager.pre_conditions.append(JsonChecker(is_equal, True, dict_path="ok"))
+        manager.main_conditions.extend(
+            [
+                JsonChecker(is_equal, "Jack", dict_path="name"),
+                JsonChecker(is_equal, 123, dict_path="some_number"),
+            ]
+        )
+
+        assert manager.check_all(example_response, "UUID") == []
+        manager.check_all(example_response, "UUID")
+        assert json_spy.call_count == 2
+
+    def test_paths_are_resolved_in_single_traversal(
+        self, mocker: MockerFixture, example_response: Response
+    ):
+        resolve_spy = mocker.spy(PathTrie, "resolve")
+        manager = ConditionsManager()
+        manager.pre_conditions.append(JsonChecker(is_equal, True, dict_path="ok"))
+        manager.main_conditions.extend(
+            [
+                JsonChecker(is_equal, "Jack", dict_path="name"),
+                JsonChecker(
+                    is_equal, "fallback", "missing", dictor_fallback="fallback"
+                ),
+                JsonChecker(is_equal, 123, dict_path="SOME_NUMBER", ignore_case=True),
+            ]
+        )
+
+        assert manager.check_all(example_response, "UUID") == []
+        assert resolve_spy.call_count == 1
+        trie = manager.get_path_trie()
+        assert trie is not None and len(trie.accessors) == 4
+
+        manager.main_conditions[0].path = "some_number"
+        assert manager.check_all(example_response, "UUID") == [
+            manager.main_conditions[0]
+        ]
+        assert manager.get_path_trie() is not trie
+        assert resolve_spy.call_count == 2
+
+    def test_searches_share_index(
+        self, mocker: MockerFixture, example_response: Response
+    ):
+        index_spy = mocker.spy(SearchIndex, "__init__")
+        manager = ConditionsManager()
+        manager.main_conditions.extend(
+            [
+                JsonChecker(is_equal, ["John", "Mike", "Jack"], search_query="name"),
+                JsonChecker(is_equal, [30, 15], search_query="age"),
+                JsonChecker(
+                    is_equal, "none", search_query="city", dictor_fallback="none"
+                ),
+            ]
+        )
+
+        assert manager.check_all(example_response, "UUID") == []
+        assert index_spy.call_count == 1
+
+        manager.main_conditions.pop()
+        manager.main_conditions.pop()
+        manager.check_all(example_response, "UUID")
+        assert index_spy.call_count == 1
+
+    def test_path_trie_needs_two_shared_paths(
+        self, checker_true: Checker, example_response: Response
+    ):
+        manager = ConditionsManager()
+        manager.main_conditions.extend(
+            [
+                checker_true,
+                JsonChecker(is_equal, "Jack", dict_path="name"),
+                JsonChecker(is_equal, ["John", "Mike", "Jack"], search_query="name"),
+            ]
+        )
+
+        assert manager.get_path_trie() is None
+        assert manager.check_all(example_response, "UUID") == []
+
+
+class TestShortCircuit:
+    @pytest.fixture
+    def manager(self, checker_true: Checker, checker_false: Checker):
+        manager = ConditionsManager()
+        manager.short_circuit = True
+        manager.pre_conditions.extend([checker_true, checker_true])
+        manager.main_conditions.extend([checker_false, checker_true, checker_false])
+        return manager
+
+    def test_stops_at_first_failure(
+        self, mocker: MockerFixture, manager: ConditionsManager, checker_false: Checker
+    ):
+        check_spy = mocker.spy(checker_false, "check")
+
+        assert manager.check_all("RESULT", "UUID") == [checker_false]
+        assert check_spy.call_count == 1
+        assert manager.short_circuited is True
+
+    def test_full_evaluation(
+        self, mocker: MockerFixture, manager: ConditionsManager, checker_false: Checker
+    ):
+        check_spy = mocker.spy(checker_false, "check")
+        manager.full_evaluation = True
+
+        assert manager.check_all("RESULT", "UUID") == [checker_false, checker_false]
+        assert check_spy.call_count == 2
+        assert manager.short_circuited is False
+
+    def test_failure_of_the_last_checker_is_not_short_circuited(
+        self, checker_true: Checker, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.short_circuit = True
+        manager.main_conditions.extend([checker_true, checker_false])
+
+        assert manager.check_all("RESULT", "UUID") == [checker_false]
+        assert manager.short_circuited is False
+
+    def test_exception_level(self, checker_false: Checker):
+        manager = ConditionsManager()
+        manager.short_circuit = True
+        manager.exception_conditions.extend([checker_false, checker_false])
+
+        with pytest.raises(ExceptionConditionNotMet) as exc_info:
+            manager.check_all("RESULT", "UUID")
+        assert str(exc_info.value).count("Checker:") == 2
+
+
+class TestCheckerStatistics:
+    def test_statistics_are_recorded(
+        self, checker_true: Checker, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.short_circuit = True
+        manager.pre_conditions.append(checker_true)
+        manager.main_conditions.append(checker_false)
+
+        manager.check_all("RESULT", "UUID")
+        manager.check_all("RESULT", "UUID")
+
+        main, pre = manager.get_statistics("main"), manager.get_statistics("pre")
+        assert [(s.checker, s.calls, s.failures) for s in main] == [
+            (checker_false, 2, 2)
+        ]
+        assert [(s.checker, s.calls, s.failures) for s in pre] == [(checker_true, 2, 0)]
+        assert main[0].failure_rate == 0.75
+        assert len(manager.get_statistics()) == 2
+
+    def test_cheap_and_failing_checkers_go_first(
+        self, checker_mocker: type[Checker], checker_true: Checker
+    ):
+        expensive = checker_mocker(comparer=is_equal, expected_value="TEST")
+        cheap = checker_mocker(comparer=is_equal, expected_value="TEST")
+        manager = ConditionsManager()
+        manager.short_circuit = True
+        manager.main_conditions.extend([checker_true, expensive, cheap])
+        manager._get_checker_statistics(checker_true, "main").record(0.1, True)
+        manager._get_checker_statistics(expensive, "main").record(0.5, False)
+        manager._get_checker_statistics(cheap, "main").record(0.01, False)
+
+        assert manager.check_all("RESULT", "UUID") == [cheap]
+        assert manager.last_order["main"] == [cheap, checker_true, expensive]
+        assert [s.checker for s in manager.get_statistics()] == [
+            cheap,
+            checker_true,
+            expensive,
+        ]
+
+    def test_insertion_order_without_short_circuit(
+        self, checker_true: Checker, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.main_conditions.extend([checker_true, checker_false])
+        manager._get_checker_statistics(checker_true, "main").record(10, True)
+
+        assert manager.check_all("RESULT", "UUID") == [checker_false]
+        assert manager.last_order["main"] == [checker_true, checker_false]
+
+    def test_not_recorded_without_short_circuit(self, checker_false: Checker):
+        manager = ConditionsManager()
+        manager.main_conditions.append(checker_false)
+
+        manager.check_all("RESULT", "UUID")
+
+        assert not manager.get_statistics()
+
+    def test_str(self, checker_false: Checker):
+        statistics = CheckerStatistics(checker_false, "main")
+        statistics.record(0.5, False)
+
+        assert str(statistics) == (
+            "CheckerMocker | Level: main | Calls: 1 | Failures: 1"
+            " | Mean time: 0.500000 | Score: 0.750000"
+        )
+
+
+class TestLatchingConditions:
+    def test_latched_checker_is_not_evaluated_again(
+        self, mocker: MockerFixture, checker_true: Checker, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.main_conditions.extend([checker_true, checker_false])
+        manager.latching_checkers.add(checker_true)
+        check_spy = mocker.spy(checker_true, "check")
+
+        for _ in range(3):
+            assert manager.check_all("RESULT", "UUID") == [checker_false]
+
+        assert check_spy.call_count == 1
+        manager.reset_latches()
+        manager.check_all("RESULT", "UUID")
+        assert check_spy.call_count == 2
+
+    def test_latching_level(
+        self, mocker: MockerFixture, checker_true: Checker, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.pre_conditions.append(checker_true)
+        manager.main_conditions.append(checker_false)
+        manager.latching_levels.add("pre")
+        true_spy = mocker.spy(checker_true, "check")
+        false_spy = mocker.spy(checker_false, "check")
+
+        manager.check_all("RESULT", "UUID")
+        manager.check_all("RESULT", "UUID")
+
+        assert true_spy.call_count == 1
+        assert false_spy.call_count == 2
+
+    def test_failed_checker_is_not_latched(
+        self, mocker: MockerFixture, checker_false: Checker
+    ):
+        manager = ConditionsManager()
+        manager.main_conditions.append(checker_false)
+        manager.latching_checkers.add(checker_false)
+        check_spy = mocker.spy(checker_false, "check")
+
+        manager.check_all("RESULT", "UUID")
+        manager.check_all("RESULT", "UUID")
+
+        assert check_spy.call_count == 2
+
+    @pytest.mark.parametrize("short_circuit", [True, False])
+    def test_unhashable_checkers(self, short_circuit: bool):
+        @dataclass
+        class DataclassChecker(Checker):
+            comparer: Callable[[Any, Any], bool]
+            expected_value: Any
+
+            def __post_init__(self):
+                super().__init__(self.comparer, self.expected_value)
+
+            def prepare_data(self, data: Any, run_uuid: str | None = None) -> str:
+                return "Ok"
+
+        checker = DataclassChecker(is_equal, "Ok")
+        manager = ConditionsManager()
+        manager.short_circuit = short_circuit
+        manager.main_conditions.extend([checker, DataclassChecker(is_equal, "TEST")])
+        manager.latching_checkers.add(checker)
+
+        assert len(manager.check_all("RESULT", "UUID")) == 1
+        assert manager._satisfied is not None
+        assert checker in manager._satisfied
+
+    def test_containers_are_allocated_lazily(self, checker_true: Checker):
+        manager = ConditionsManager()
+        manager.main_conditions.append(checker_true)
+
+        manager.check_all("RESULT", "UUID")
+        manager.reset_latches()
+
+        assert manager._latching_checkers is None
+        assert manager._latching_levels is None
+        assert manager._satisfied is None
+        assert manager._statistics is None
+        assert not manager.get_statistics()
+
+
+class TestCheckerData:
+    def test_custom_checker_gets_response(
+        self,
+        checker_mocker: type[Checker],
+        streamed_response: Response,
+        streamed_content: bytes,
+        mocker: MockerFixture,
+    ):
+        checker = checker_mocker(comparer=is_equal, expected_value="Ok")
+        check_spy = mocker.spy(checker, "prepare_data")
+        manager = ConditionsManager()
+        manager.main_conditions.append(checker)
+
+        manager.check_all(ResponseContext(streamed_response), "UUID")
+
+        assert check_spy.call_args.args[0] is streamed_response
+        assert streamed_response.content == streamed_content
+
+    def test_opted_in_checker_gets_context(
+        self,
+        checker_mocker: type[Checker],
+        example_response: Response,
+        mocker: MockerFixture,
+    ):
+        class ContextChecker(checker_mocker):  # type: ignore[valid-type, misc]
+            uses_response_context = True
+
+        checker = ContextChecker(comparer=is_equal, expected_value="Ok")
+        check_spy = mocker.spy(checker, "prepare_data")
+        manager = ConditionsManager()
+        manager.main_conditions.append(checker)
+
+        manager.check_all(example_response, "UUID")
+
+        context = check_spy.call_args.args[0]
+        assert isinstance(context, ResponseContext)
+        assert context.response is example_response
@@ -0,0 +1,70 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from bepatient.waiter_src.delays import (
+    CappedDelay,
+    ConstantDelay,
+    DecorrelatedJitterDelay,
+    ExponentialDelay,
+    LinearDelay,
+    to_delay_policy,
+)
+
+
+class TestDelayPolicies:
+    def test_constant_delay(self):
+        policy = ConstantDelay(3)
+
+        assert [policy.get_delay(attempt) for attempt in range(1, 4)] == [3, 3, 3]
+
+    def test_linear_delay(self):
+        policy = LinearDelay(initial=1, step=2)
+
+        assert [policy.get_delay(attempt) for attempt in range(1, 4)] == [1, 3, 5]
+
+    def test_exponential_delay(self):
+        policy = ExponentialDelay(initial=0.5, factor=3)
+
+        assert [policy.get_delay(attempt) for attempt in range(1, 4)] == [
+            0.5,
+            1.5,
+            4.5,
+        ]
+
+    def test_exponential_delay_with_jitter(self, mocker: MockerFixture):
+        uniform = mocker.patch("random.uniform", return_value=0.1)
+        policy = ExponentialDelay(initial=1, jitter=True)
+
+        assert policy.get_delay(3) == 0.1
+        uniform.assert_called_once_with(0, 4)
+
+    def test_decorrelated_jitter_delay(self, mocker: MockerFixture):
+        uniform = mocker.patch("random.uniform", side_effect=[2, 5, 20, 1])
+        policy = DecorrelatedJitterDelay(initial=1, max_delay=10)
+
+        assert [policy.get_delay(attempt) for attempt in range(1, 4)] == [2, 5, 10]
+        policy.reset()
+        assert policy.get_delay(1) == 1
+        assert [call.args for call in uniform.call_args_list] == [
+            (1, 3),
+            (1, 6),
+            (1, 15),
+            (1, 3),
+        ]
+
+    def test_capped_delay(self):
+        policy = CappedDelay(ExponentialDelay(initial=1), max_delay=5)
+
+        assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    @pytest.mark.parametrize("delay", [0, 1, 2.5])
+    def test_number_is_converted_to_constant_delay(self, delay: float):
+        policy = to_delay_policy(delay)
+
+        assert isinstance(policy, ConstantDelay)
+        assert policy.get_delay(10) == delay
+
+    def test_policy_is_returned_unchanged(self):
+        policy = LinearDelay(1, 1)
+
+        assert to_delay_policy(policy) is policy
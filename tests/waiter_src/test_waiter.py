@@ -1,9 +1,14 @@
+import asyncio
+from time import monotonic
+
 import pytest
 from pytest_mock import MockerFixture
 
+from bepatient.waiter_src.delays import LinearDelay
 from bepatient.waiter_src.exceptions import WaiterConditionWasNotMet
+from bepatient.waiter_src.executors.async_executor import AsyncExecutor
 from bepatient.waiter_src.executors.executor import Executor
-from bepatient.waiter_src.waiter import wait_for_executor
+from bepatient.waiter_src.waiter import wait_for_executor, wait_for_executor_async
 
 
 class TestWaiter:
@@ -26,6 +31,16 @@ class TestWaiter:
 
         assert mock_executor.is_condition_met.call_count == 3
 
+    def test_last_result_is_evaluated_fully_before_raising(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.return_value = False
+        mock_executor.error_message.return_value = "error message"
+
+        with pytest.raises(WaiterConditionWasNotMet):
+            wait_for_executor(mock_executor, retries=3, delay=0)
+
+        mock_executor.evaluate_fully.assert_called_once()
+
     def test_do_not_raise_error(self, mocker: MockerFixture):
         mock_executor = mocker.MagicMock(spec=Executor)
         mock_executor.is_condition_met.return_value = False
@@ -34,3 +49,155 @@ class TestWaiter:
         wait_for_executor(executor=mock_executor, retries=3, delay=0, raise_error=False)
 
         assert mock_executor.is_condition_met.call_count == 3
+
+    def test_final_attempt_is_marked(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.return_value = False
+
+        wait_for_executor(mock_executor, retries=3, delay=0, raise_error=False)
+
+        assert [
+            call.args[0] for call in mock_executor.set_final_attempt.call_args_list
+        ] == [False, False, True, False]
+
+    def test_latches_are_reset(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.return_value = True
+
+        wait_for_executor(mock_executor, retries=3, delay=0)
+
+        mock_executor.reset_latches.assert_called_once()
+
+    def test_delay_policy(self, mocker: MockerFixture):
+        sleep = mocker.patch("bepatient.waiter_src.waiter.sleep")
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.side_effect = [False, False, False, True]
+
+        waiting_times = wait_for_executor(
+            mock_executor, retries=4, delay=LinearDelay(initial=1, step=2)
+        )
+
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 3, 5]
+        assert len(waiting_times) == 3
+
+    def test_waiting_times_are_recorded_on_failure(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.return_value = False
+        mock_executor.error_message.return_value = "error message"
+        waiting_times: list[float] = []
+
+        with pytest.raises(WaiterConditionWasNotMet):
+            wait_for_executor(
+                mock_executor, retries=2, delay=0.01, waiting_times=waiting_times
+            )
+
+        assert len(waiting_times) == 2
+        assert all(waiting_time >= 0.01 for waiting_time in waiting_times)
+
+    def test_total_timeout_keeps_the_cadence(self, mocker: MockerFixture):
+        clock = [0.0]
+
+        def attempt() -> bool:
+            clock[0] += 0.3
+            return False
+
+        def sleep(seconds: float):
+            clock[0] += seconds
+
+        mocker.patch("bepatient.waiter_src.waiter.monotonic", lambda: clock[0])
+        mocker.patch("bepatient.waiter_src.waiter.sleep", sleep)
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.side_effect = attempt
+        mock_executor.error_message.return_value = "error message"
+
+        with pytest.raises(WaiterConditionWasNotMet, match="error message"):
+            wait_for_executor(mock_executor, retries=60, delay=1, total_timeout=3.5)
+
+        assert mock_executor.is_condition_met.call_count == 4
+        assert clock[0] == pytest.approx(3.3)
+        time_limits = [call.args[0] for call in mock_executor.set_time_limit.mock_calls]
+        assert time_limits == pytest.approx([3.5, 2.5, 1.5, 0.5, None])
+
+    def test_total_timeout_does_not_wait_when_attempt_is_too_long(
+        self, mocker: MockerFixture
+    ):
+        clock = [0.0]
+
+        def attempt() -> bool:
+            clock[0] += 2
+            return clock[0] > 5
+
+        sleep = mocker.patch("bepatient.waiter_src.waiter.sleep")
+        mocker.patch("bepatient.waiter_src.waiter.monotonic", lambda: clock[0])
+        mock_executor = mocker.MagicMock(spec=Executor)
+        mock_executor.is_condition_met.side_effect = attempt
+
+        wait_for_executor(mock_executor, retries=60, delay=1, total_timeout=10)
+
+        assert mock_executor.is_condition_met.call_count == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [0, 0]
+
+
+class TestAsyncWaiter:
+    def test_wait_success(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=AsyncExecutor)
+        mock_executor.is_condition_met_async = mocker.AsyncMock(
+            side_effect=[False, True]
+        )
+
+        waiting_times = asyncio.run(
+            wait_for_executor_async(mock_executor, retries=3, delay=0)
+        )
+
+        assert mock_executor.is_condition_met_async.await_count == 2
+        assert len(waiting_times) == 1
+
+    def test_wait_timeout_retries(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=AsyncExecutor)
+        mock_executor.is_condition_met_async = mocker.AsyncMock(return_value=False)
+        mock_executor.error_message.return_value = "error message"
+
+        with pytest.raises(WaiterConditionWasNotMet, match="error message"):
+            asyncio.run(wait_for_executor_async(mock_executor, retries=3, delay=0))
+
+        assert mock_executor.is_condition_met_async.await_count == 3
+        mock_executor.aclose.assert_awaited_once()
+
+    def test_waits_are_concurrent(self, mocker: MockerFixture):
+        executors = []
+        for _ in range(50):
+            mock_executor = mocker.MagicMock(spec=AsyncExecutor)
+            mock_executor.is_condition_met_async = mocker.AsyncMock(
+                side_effect=[False, False, True]
+            )
+            executors.append(mock_executor)
+
+        async def wait_for_all():
+            return await asyncio.gather(
+                *(
+                    wait_for_executor_async(executor, retries=3, delay=0.05)
+                    for executor in executors
+                )
+            )
+
+        start = monotonic()
+        asyncio.run(wait_for_all())
+
+        assert monotonic() - start < 1
+
+    def test_total_timeout(self, mocker: MockerFixture):
+        mock_executor = mocker.MagicMock(spec=AsyncExecutor)
+        mock_executor.is_condition_met_async = mocker.AsyncMock(return_value=False)
+
+        waiting_times = asyncio.run(
+            wait_for_executor_async(
+                mock_executor,
+                retries=60,
+                delay=0.05,
+                total_timeout=0.12,
+                raise_error=False,
+            )
+        )
+
+        assert len(waiting_times) == 2
+        assert mock_executor.set_time_limit.mock_calls[-1].args == (None,)
@@ -0,0 +1,135 @@
+from time import monotonic, sleep
+
+import pytest
+from pytest_mock import MockerFixture
+
+from bepatient.waiter_src.exceptions import (
+    ExceptionConditionNotMet,
+    WaiterConditionWasNotMet,
+)
+from bepatient.waiter_src.executors.executor import Executor
+from bepatient.waiter_src.waiter_group import WaiterGroup
+
+
+def executor_mock(mocker: MockerFixture, results: list[bool]) -> Executor:
+    executor = mocker.MagicMock(spec=Executor)
+    executor.is_condition_met.side_effect = results
+    executor.error_message.return_value = "error message"
+    return executor
+
+
+class TestWaiterGroup:
+    def test_wait_for_all(self, mocker: MockerFixture):
+        executors = [
+            executor_mock(mocker, [True]),
+            executor_mock(mocker, [False, False, True]),
+            executor_mock(mocker, [False, True]),
+        ]
+
+        results = WaiterGroup(executors).run(retries=3, delay=0)
+
+        assert [result.executor for result in results] == executors
+        assert [result.condition_met for result in results] == [True, True, True]
+        assert [result.attempts for result in results] == [1, 3, 2]
+
+    def test_wait_for_any(self, mocker: MockerFixture):
+        executors = [
+            executor_mock(mocker, [False] * 10),
+            executor_mock(mocker, [False, True]),
+        ]
+
+        results = WaiterGroup(executors, max_workers=1).run(
+            retries=10, delay=0.01, until="any"
+        )
+
+        assert [result.condition_met for result in results] == [False, True]
+        assert results[0].attempts < 10
+
+    def test_wait_for_k_of_n(self, mocker: MockerFixture):
+        executors = [
+            executor_mock(mocker, [False, False]),
+            executor_mock(mocker, [True]),
+            executor_mock(mocker, [False, True]),
+        ]
+
+        results = WaiterGroup(executors).run(retries=2, delay=0, until=2)
+
+        assert [result.condition_met for result in results] == [False, True, True]
+
+    def test_raise_error_if_not_enough_executors_met_conditions(
+        self, mocker: MockerFixture
+    ):
+        executors = [
+            executor_mock(mocker, [False, False]),
+            executor_mock(mocker, [True]),
+        ]
+        msg = "Conditions were met by 1 of 2 executors, required: 2. | 0: error message"
+
+        with pytest.raises(WaiterConditionWasNotMet, match=msg):
+            WaiterGroup(executors).run(retries=2, delay=0)
+
+        executors[0].evaluate_fully.assert_called_once()  # type: ignore[attr-defined]
+        executors[1].evaluate_fully.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_stops_when_required_number_is_not_possible(self, mocker: MockerFixture):
+        executors = [
+            executor_mock(mocker, [False]),
+            executor_mock(mocker, [False] * 100),
+        ]
+        executors[0].is_condition_met.side_effect = (  # type: ignore[attr-defined]
+            ExceptionConditionNotMet("Failed checkers")
+        )
+
+        results = WaiterGroup(executors).run(retries=100, delay=0.01, raise_error=False)
+
+        assert results[0].attempts == 1
+        assert results[1].attempts < 100
+
+    def test_executor_exception_is_recorded(self, mocker: MockerFixture):
+        error = ExceptionConditionNotMet("Failed checkers")
+        executors = [
+            executor_mock(mocker, [False, True]),
+            executor_mock(mocker, [False]),
+        ]
+        executors[1].is_condition_met.side_effect = error  # type: ignore[attr-defined]
+
+        results = WaiterGroup(executors).run(retries=2, delay=0.05, until="any")
+
+        assert results[1].error is error
+        assert results[1].condition_met is False
+
+    def test_attempts_are_concurrent(self, mocker: MockerFixture):
+        def slow_attempt() -> bool:
+            sleep(0.1)
+            return True
+
+        executors = []
+        for _ in range(20):
+            executor = executor_mock(mocker, [])
+            executor.is_condition_met.side_effect = slow_attempt  # type: ignore
+            executors.append(executor)
+
+        start = monotonic()
+        WaiterGroup(executors, max_workers=20).run(retries=1)
+
+        assert monotonic() - start < 1
+
+    def test_total_timeout(self, mocker: MockerFixture):
+        executor = executor_mock(mocker, [False] * 100)
+
+        start = monotonic()
+        results = WaiterGroup([executor]).run(
+            retries=100, delay=0.05, total_timeout=0.2, raise_error=False
+        )
+
+        assert monotonic() - start < 0.5
+        assert 2 <= results[0].attempts <= 5
+        executor.set_time_limit.assert_called_with(None)  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize("until", ["some", -1, 3])
+    def test_invalid_until(self, mocker: MockerFixture, until: str | int):
+        group = WaiterGroup().add_executor(executor_mock(mocker, []))
+        group.add_executor(executor_mock(mocker, []))
+
+        with pytest.raises(ValueError, match="You have to choose between"):
+            group.run(until=until)  # type: ignore[arg-type]